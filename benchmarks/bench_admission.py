@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import random
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.memory import AdmissionPolicy, estimate_nbytes
+
+def spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def workload(key):
+    kind, n = key
+    if kind == "blob":      # ~free to recompute, large result
+        return bytes(256 * 1024)
+    if kind == "solve":     # expensive, small result
+        spin(0.0005)
+        return n * n
+    return n + 1            # cheap, small result
+
+def resident_bytes(vl):
+    return sum(estimate_nbytes(r) for law in vl.laws.values() for r in law.manifold.values())
+
+def run(vl, keys):
+    for key in keys:
+        vl.run("Mixed", workload, key)
+    return vl.telemetry.snapshot()["Mixed"]["hit_ratio"]
+
+def bench_admission():
+    print("BENCHMARK | Admission Control: memory saved vs hit rate lost (mixed workload)")
+    rng = random.Random(42)
+    kinds = ["blob"] * 2 + ["solve"] * 3 + ["cheap"] * 5
+    keys = [(rng.choice(kinds), int(rng.paretovariate(1.2)) % 200) for _ in range(4000)]
+
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer(telemetry=True)
+    start = time.perf_counter()
+    hit_all = run(vl, keys)
+    t_all = time.perf_counter() - start
+    mem_all = resident_bytes(vl)
+
+    VirtualLayer.ORACLE._laws = {}
+    policy = AdmissionPolicy(min_value_per_byte=1e-9)  # >= 1 ms of compute per MB kept
+    vl = VirtualLayer(admission=policy, telemetry=True)
+    start = time.perf_counter()
+    hit_adm = run(vl, keys)
+    t_adm = time.perf_counter() - start
+    mem_adm = resident_bytes(vl)
+
+    saved = 1 - mem_adm / mem_all
+    print(f"  > Admit all:        {mem_all / 1e3:10.1f} KB resident, hit rate {hit_all:6.1%}, {t_all*1000:8.1f} ms")
+    print(f"  > Value-per-byte:   {mem_adm / 1e3:10.1f} KB resident, hit rate {hit_adm:6.1%}, {t_adm*1000:8.1f} ms")
+    print(f"  > Memory saved:     {saved:8.1%}")
+    print(f"  > Hit rate lost:    {(hit_all - hit_adm) * 100:8.1f} pp ({policy.rejected} results rejected)")
+    assert saved > 0.5, "Admission control did not keep large, cheap results out"
+    print("\nVERDICT: PASS (Only worthwhile results enter the manifold)")
+
+if __name__ == "__main__":
+    bench_admission()
@@ -0,0 +1,39 @@
+import os
+import sys
+import time
+import asyncio
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+def bench_async_recall():
+    print("BENCHMARK | Async Recall Overhead (arun vs run)")
+    vl = VirtualLayer()
+    iterations = 100_000
+    inputs = [1.0, 2.0, 3.0, 4.0]
+
+    async def heavy_task(data):
+        await asyncio.sleep(0)
+        return sum(x * x for x in data)
+
+    vl.run("SyncTask", lambda data: sum(x * x for x in data), inputs)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        vl.run("SyncTask", None, inputs)
+    sync_ns = (time.perf_counter() - start) / iterations * 1e9
+
+    async def recall_loop():
+        await vl.arun("AsyncTask", heavy_task, inputs)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await vl.arun("AsyncTask", heavy_task, inputs)
+        return (time.perf_counter() - start) / iterations * 1e9
+
+    async_ns = asyncio.run(recall_loop())
+
+    print(f"  > run  recall:     {sync_ns:8.1f} ns/op")
+    print(f"  > arun recall:     {async_ns:8.1f} ns/op")
+    print(f"  > Event-loop overhead: {async_ns - sync_ns:8.1f} ns/op")
+
+if __name__ == "__main__":
+    bench_async_recall()
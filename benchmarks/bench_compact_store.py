@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.getcwd())
+import numpy as np
+from vld_sdk.compact import CompactManifold
+
+N = 200_000
+
+def measure(build):
+    tracemalloc.start()
+    store = build()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, used
+
+def bench_compact_store():
+    print(f"BENCHMARK | Compact Law store: bytes per memoized state ({N:,} float / 3-float results)")
+    rng = np.random.default_rng(0)
+    addrs = rng.integers(0, 2 ** 64, size=N, dtype=np.uint64)
+
+    def results(width):
+        # Fresh boxed results, as a ground phase would produce them
+        if width is None:
+            return rng.random(N).tolist()
+        return [tuple(r) for r in rng.random((N, width)).tolist()]
+
+    rows = []
+    for label, width in (("float", None), ("3-tuple", 3)):
+        state = rng.bit_generator.state
+        baseline, dict_bytes = measure(lambda: dict(zip(addrs.tolist(), results(width))))
+        rng.bit_generator.state = state
+        def build():
+            store = CompactManifold("float64", width=width)
+            store.update(zip(addrs.tolist(), results(width)))
+            return store
+        compact, compact_bytes = measure(build)
+        assert dict(compact.items()) == baseline
+        rows.append((label, dict_bytes / N, compact_bytes / N))
+        print(f"  > {label:8s} dict: {dict_bytes / N:6.1f} B/state | compact: {compact_bytes / N:6.1f} B/state "
+              f"| {dict_bytes / compact_bytes:4.1f}x smaller")
+
+    # Vectorized recall (3-tuple law) vs a Python loop over the dict
+    lookup = addrs[rng.integers(0, N, size=N)]
+    lookup_keys = lookup.tolist()
+    start = time.perf_counter()
+    expected = [baseline.get(k) for k in lookup_keys]
+    t_dict = time.perf_counter() - start
+    start = time.perf_counter()
+    values, found = compact.get_many(lookup)
+    t_many = time.perf_counter() - start
+    assert found.all() and [tuple(v) for v in values.tolist()] == expected
+    print(f"  > get_many:  {t_many * 1e9 / N:6.1f} ns/state (dict loop {t_dict * 1e9 / N:6.1f} ns/state)")
+
+    assert all(d / c > 2.5 for _, d, c in rows), "Compact store is not substantially smaller"
+    print("\nVERDICT: PASS (Numeric states stored in flat typed arrays)")
+
+if __name__ == "__main__":
+    bench_compact_store()
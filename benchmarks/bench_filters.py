@@ -0,0 +1,82 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.getcwd())
+from vld_sdk.filters import BloomFilter
+from vld_sdk.induction import _FILTER_DUTY, Law, MISS, SharedOracle
+from vld_sdk.persistence import SQLiteOracle
+from vld_sdk.server import OracleServer, RemoteOracle
+
+N = 1_000_000
+PROBES = 20_000
+GOLDEN = 0x9E3779B97F4A7C15
+ADDRS = [(i * GOLDEN) & 0xFFFFFFFFFFFFFFFF for i in range(N + PROBES)]
+
+def miss_latency(law, probes=ADDRS[N:]):
+    start = time.perf_counter()
+    for addr in probes:
+        assert law.execute(addr ^ law.seed) is MISS
+    return (time.perf_counter() - start) / len(probes)
+
+def report(label, oracle, law):
+    oracle.filtered = False
+    bare = miss_latency(law)
+    oracle.filtered = True
+    law.filter = None
+    start = time.perf_counter()
+    assert law.execute(ADDRS[N] ^ law.seed) is MISS  # Cold: starts the background build
+    first = time.perf_counter() - start
+    during, served = 0.0, 0
+    while law.filter is None and served < PROBES:
+        during += miss_latency(law, ADDRS[N + served:N + served + 100]) * 100
+        served += 100
+    law._screen(wait=True)
+    screened = miss_latency(law)
+    stats = law.filter.stats()
+    print(f"  > {label}: first miss {first * 1e3:5.1f} ms | {served:,} misses served during the "
+          f"{law.filter.build_time:4.1f} s background build"
+          + (f" at {during / served * 1e6:5.1f} us" if served else ""))
+    print(f"  > {label}: true miss {bare * 1e6:7.1f} us -> {screened * 1e6:5.1f} us ({bare / screened:5.1f}x)")
+    print(f"  > {label}: false positives {stats['false_positives']}/{PROBES} "
+          f"= {stats['observed_fpr']:.3%} (expected {stats['expected_fpr']:.3%}, "
+          f"configured {oracle.filter_error_rate:.0%}) | {stats['bytes'] / N:.2f} B/state")
+    assert stats["observed_fpr"] < 2 * oracle.filter_error_rate, "False-positive rate above bound"
+    assert screened < bare / 2, "Filter does not cut miss latency"
+    return first
+
+def bench_filters():
+    print(f"BENCHMARK | Bloom-filter read-through screen: {N:,} recorded states, {PROBES:,} true misses")
+    with tempfile.TemporaryDirectory() as tmp:
+        with SQLiteOracle(os.path.join(tmp, "oracle.db"), batch_size=1 << 16) as oracle:
+            law = oracle.publish(Law("Score", 0xC0FFEE))
+            for i, addr in enumerate(ADDRS[:N]):
+                oracle.store(law, addr, i * 0.5)
+            oracle.flush()
+            law.manifold.clear()
+            first = report("sqlite", oracle, law)
+            assert first < 0.1, "First miss waited for the filter build"
+
+            tracemalloc.start()
+            BloomFilter.of(oracle.addresses(law), oracle.filter_error_rate)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"  > sqlite: build peak {peak / 2 ** 20:5.1f} MiB ({peak / N:4.1f} B/state; "
+                  f"a list of the addresses alone is ~{N * 36 / 2 ** 20:.0f} MiB)")
+            assert peak < 8 * N, "Build holds the address set in memory"
+
+    backing = SharedOracle()
+    law = backing.publish(Law("Score", 0xC0FFEE))
+    for i, addr in enumerate(ADDRS[:N]):
+        law.manifold[addr] = i * 0.5
+    with OracleServer(backing) as server, RemoteOracle(server.address) as oracle:
+        law = oracle.get("Score")
+        report("remote", oracle, law)  # First miss queues behind the server's key scan
+        period = max(oracle.filter_refresh, law.filter.build_time / _FILTER_DUTY)
+        print(f"  > remote: rebuilt every {period:4.1f} s (refresh {oracle.filter_refresh:.0f} s, "
+              f"build {law.filter.build_time:4.2f} s: <= {_FILTER_DUTY:.0%} of wall time)")
+    print("\nVERDICT: PASS (True misses skip the backend round trip; builds run off the request path)")
+
+if __name__ == "__main__":
+    bench_filters()
@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+import functools
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+def bench_induce_overhead():
+    print("BENCHMARK | Decorator Recall Overhead: @vl.induce vs run([...]) vs lru_cache")
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    calls = 100_000
+    keys = [(i % 500, (i * 7) % 13) for i in range(calls)]
+
+    def blend(a, b, scale=1.0):
+        return (a * 31 + b) * scale
+
+    induced = vl.induce("Blend")(blend)
+    cached = functools.lru_cache(maxsize=None)(blend)
+    wrapped = lambda packed: blend(*packed)
+
+    def timed(call):
+        for a, b in keys:
+            call(a, b)  # ground every key: measure recall only
+        start = time.perf_counter()
+        for a, b in keys:
+            call(a, b)
+        return (time.perf_counter() - start) / calls * 1e9
+
+    t_lru = timed(cached)
+    t_induce = timed(induced)
+    t_run = timed(lambda a, b: vl.run("BlendList", wrapped, [a, b]))
+    t_kw = timed(lambda a, b: induced(b=b, a=a))
+
+    print(f"  > functools.lru_cache:       {t_lru:9.0f} ns/call")
+    print(f"  > @vl.induce (positional):   {t_induce:9.0f} ns/call")
+    print(f"  > @vl.induce (keywords):     {t_kw:9.0f} ns/call")
+    print(f"  > vl.run(name, f, [a, b]):   {t_run:9.0f} ns/call")
+    assert induced(2, 3) == induced(b=3, a=2) == blend(2, 3)
+    assert t_induce < t_run, "Decorator recall should beat list-wrapped run"
+    print("\nVERDICT: PASS (Multi-arg recall without list wrapping)")
+
+if __name__ == "__main__":
+    bench_induce_overhead()
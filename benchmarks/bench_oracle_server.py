@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import sys
+import threading
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import Law, SharedOracle
+from vld_sdk.server import OracleServer, RemoteOracle
+
+N = 20_000
+BATCH = 64
+REQUESTS = 2048  # Per measurement, split across clients
+GOLDEN = 0x9E3779B97F4A7C15
+ADDRS = [(i * GOLDEN) & 0xFFFFFFFFFFFFFFFF for i in range(N)]
+
+def run_server(queue, stop):
+    oracle = SharedOracle()
+    law = oracle.publish(Law("Score", 0))
+    for i, addr in enumerate(ADDRS):
+        law.record(addr, i * 0.5)
+    with OracleServer(oracle) as server:
+        queue.put(server.address)
+        stop.wait()
+        queue.put(server.stats())
+
+def measure(address, clients, batch):
+    oracle = RemoteOracle(address, pool_size=min(clients, 8))
+    law = oracle.get("Score")
+    per_client = REQUESTS // clients
+    latencies = []
+
+    def client(c):
+        mine = []
+        for r in range(per_client):
+            start = (c * per_client + r) * batch % (N - batch)
+            t0 = time.perf_counter()
+            results = oracle.load_many(law, ADDRS[start:start + batch])
+            mine.append(time.perf_counter() - t0)
+            assert results[0] == start * 0.5
+        latencies.extend(mine)
+
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    oracle.close()
+    latencies.sort()
+    requests = per_client * clients
+    return requests / elapsed, requests * batch / elapsed, latencies[len(latencies) // 2]
+
+def bench_oracle_server():
+    print(f"BENCHMARK | Oracle server over TCP: {REQUESTS} multi-gets per run, pooled pipelined clients")
+    queue, stop = multiprocessing.Queue(), multiprocessing.Event()
+    proc = multiprocessing.Process(target=run_server, args=(queue, stop))
+    proc.start()
+    address = queue.get(timeout=30)
+    print(f"  > host: {os.cpu_count()} CPU(s); server in its own process, clients are threads of this one")
+    rows = {}
+    for batch in (1, BATCH):
+        for clients in (1, 16, 256):
+            rps, kps, p50 = measure(address, clients, batch)
+            rows[(batch, clients)] = kps
+            print(f"  > {batch:3d} keys/request | {clients:3d} clients: {rps:8,.0f} round trips/s "
+                  f"| {kps:10,.0f} keys/s | p50 {p50 * 1e6:7.0f} us")
+    stop.set()
+    stats = queue.get(timeout=30)
+    proc.join()
+    print(f"  > server: {stats['connections']} connections, {stats['requests']:,} requests, "
+          f"{stats['keys_read']:,} keys read")
+
+    assert rows[(BATCH, 16)] > 5 * rows[(1, 16)], "Batched multi-get does not raise key throughput"
+    print("\nVERDICT: PASS (Laws served to concurrent clients with batched, pipelined requests)")
+
+if __name__ == "__main__":
+    bench_oracle_server()
@@ -0,0 +1,64 @@
+import math
+import operator
+import os
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+N = 200_000
+STEPS = 20
+
+def sum_sqrt(xs):
+    return sum(math.sqrt(x) for x in xs)
+
+def sum_newton(xs):
+    # ~1us per element: a few Newton steps of sqrt(1 + x)
+    total = 0.0
+    for x in xs:
+        y = 1.0 + x
+        r = y
+        for _ in range(6):
+            r = 0.5 * (r + y / r)
+        total += r
+    return total
+
+def measure(fold, inputs):
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    start = time.perf_counter()
+    plain = [vl.run("Fold", fold, xs) for xs in inputs]
+    t_plain = (time.perf_counter() - start) / len(inputs)
+
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    vl.register_reduction("Fold", operator.add, leaf=fold, chunk_size=1024, content_defined=True)
+    vl.reduce("Fold", inputs[0])  # Warm: the first input is folded in full
+    start = time.perf_counter()
+    folded = [vl.reduce("Fold", xs) for xs in inputs[1:]]
+    t_fold = (time.perf_counter() - start) / (len(inputs) - 1)
+    assert all(math.isclose(a, b, rel_tol=1e-9) for a, b in zip(plain[1:], folded))
+    return t_plain * 1000, t_fold * 1000
+
+def bench_reduction():
+    print(f"BENCHMARK | Segment-tree induction: {STEPS} inputs of {N:,} elements, "
+          "each a 1% slide of the last")
+    data = list(range(N))
+    inputs = []
+    for step in range(STEPS):
+        data = data[N // 100:] + list(range(N + step * N // 100, N + (step + 1) * N // 100))
+        inputs.append(data)
+
+    speedups = {}
+    for label, fold in (("sum(sqrt)", sum_sqrt), ("Newton", sum_newton)):
+        plain, folded = measure(fold, inputs)
+        speedups[label] = plain / folded
+        print(f"  > {label:10s} whole-input law: {plain:8.2f} ms/input | "
+              f"reduction law: {folded:8.2f} ms/input | {plain / folded:5.1f}x")
+    print("  > (Each input is still hashed chunk by chunk: folds about as cheap as")
+    print("     hashing break even, heavier folds gain with the reused fraction.)")
+    assert speedups["Newton"] > 3, "Overlapping inputs did not reuse chunk partials"
+    print("\nVERDICT: PASS (Only unseen chunks are folded)")
+
+if __name__ == "__main__":
+    bench_reduction()
@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import Law
+from vld_sdk.sharding import ShardedOracle
+
+N = 100_000
+BATCH = 1000
+GOLDEN = 0x9E3779B97F4A7C15
+ADDRS = [(i * GOLDEN) & 0xFFFFFFFFFFFFFFFF for i in range(N)]
+
+def fill(oracle):
+    law = oracle.publish(Law("Score", 0xC0FFEE))
+    for i, addr in enumerate(ADDRS):
+        oracle.store(law, addr, i * 0.5)
+    oracle.flush()
+    return law
+
+def scan(oracle, law):
+    start = time.perf_counter()
+    for lo in range(0, N, BATCH):
+        results = oracle.load_many(law, ADDRS[lo:lo + BATCH])
+        assert results[-1] == (lo + len(results) - 1) * 0.5
+    return N / (time.perf_counter() - start)
+
+def bench_sharding():
+    print(f"BENCHMARK | Consistent-hash sharded oracle: {N:,} states, {BATCH}-key scattered multi-gets")
+    rows = {}
+    for n in (1, 4):
+        with ShardedOracle.spawn(n) as oracle:
+            law = fill(oracle)
+            sizes = sorted(oracle.sizes().values())
+            rows[n] = scan(oracle, law)
+            print(f"  > {n} shard(s): {rows[n]:9,.0f} keys/s | states per shard {sizes[0]:,}..{sizes[-1]:,} "
+                  f"(ideal {N // n:,})")
+            if n == 1:
+                continue
+            shard = oracle.add_shard()
+            added = oracle.moved
+            oracle.remove_shard(shard)
+            removed = oracle.moved - added
+            print(f"  > add 5th shard: moved {added:,} states ({added / N:.1%}, ideal {1 / 5:.1%}) "
+                  f"| remove it: moved {removed:,}")
+            assert abs(added / N - 0.2) < 0.07, "Adding a shard moved far more than 1/N of the states"
+            assert removed == added
+            assert sizes[-1] < 1.3 * N / n, "Shards are badly unbalanced"
+    print(f"  > host: {os.cpu_count()} CPU(s); shards are separate processes")
+    print("\nVERDICT: PASS (States spread by consistent hashing; membership changes move ~1/N)")
+
+if __name__ == "__main__":
+    bench_sharding()
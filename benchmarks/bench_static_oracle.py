@@ -0,0 +1,62 @@
+import os
+import pickle
+import sys
+import tempfile
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import MISS, VirtualLayer
+from vld_sdk.static import StaticOracle, export_static
+
+N = 200_000
+LOOKUPS = 20_000
+
+def bench_static_oracle():
+    print(f"BENCHMARK | Static MPH export vs pickle: load time and bytes per entry ({N:,} states)")
+    vl = VirtualLayer()
+    law = vl._get_or_create_law("Score", 0)
+    for h in range(N):
+        law.record(h, h * 0.5)
+    VirtualLayer.ORACLE._laws = {"Score": law}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickled = os.path.join(tmp, "oracle.pkl")
+        static = os.path.join(tmp, "oracle.vld")
+        with open(pickled, "wb") as f:
+            pickle.dump({"Score": (law.seed, dict(law.manifold))}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        stats = export_static(VirtualLayer.ORACLE, static)
+        print(f"  > export: {stats['build_seconds']:.2f}s | {stats['buckets']:,} buckets | "
+              f"index {stats['index_bytes'] / N:4.1f} B/entry")
+
+        start = time.perf_counter()
+        with open(pickled, "rb") as f:
+            table = pickle.load(f)
+        t_pickle = time.perf_counter() - start
+        start = time.perf_counter()
+        oracle = StaticOracle(static)
+        restored = oracle.get("Score")
+        t_static = time.perf_counter() - start
+
+        keys = [(h * 7919) % N for h in range(LOOKUPS)]
+        start = time.perf_counter()
+        assert all(restored.execute(h) == h * 0.5 for h in keys)
+        t_lookup = time.perf_counter() - start
+        assert restored.execute(N + 1) is MISS
+        manifold = table["Score"][1]
+        seed = table["Score"][0]
+        start = time.perf_counter()
+        assert all(manifold[(seed ^ h) & 0xFFFFFFFFFFFFFFFF] == h * 0.5 for h in keys)
+        t_dict = time.perf_counter() - start
+
+        pickle_bytes, static_bytes = os.path.getsize(pickled), stats["bytes"]
+        print(f"  > pickle: load {t_pickle * 1e3:7.2f} ms | {pickle_bytes / N:5.1f} B/entry on disk")
+        print(f"  > static: load {t_static * 1e3:7.2f} ms | {static_bytes / N:5.1f} B/entry on disk "
+              f"| {t_pickle / t_static:,.0f}x faster to open")
+        print(f"  > recall: static {t_lookup * 1e9 / LOOKUPS:6.0f} ns/state "
+              f"(loaded dict {t_dict * 1e9 / LOOKUPS:4.0f} ns/state)")
+        oracle.close()
+
+    assert t_static * 10 < t_pickle, "Static export does not open substantially faster"
+    print("\nVERDICT: PASS (Read-only oracle answers from an mmap without loading its table)")
+
+if __name__ == "__main__":
+    bench_static_oracle()
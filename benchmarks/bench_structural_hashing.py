@@ -0,0 +1,37 @@
+import os
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+def make_config(width):
+    # A large, mostly-static nested input: one block per layer
+    return {f"layer_{i}": {"weights": tuple(float(j) for j in range(256)), "bias": (0.0,) * 16}
+            for i in range(width)}
+
+def bench_structural_hashing():
+    print("BENCHMARK | Structural Hashing: one changed leaf in a large nested input")
+    static = make_config(200)
+    steps = 200
+
+    def timed(vl):
+        start = time.perf_counter()
+        for step in range(steps):
+            vl.run("Train", lambda x: x["step"], {"model": static, "step": step})
+        return time.perf_counter() - start
+
+    VirtualLayer.ORACLE._laws = {}
+    t_flat = timed(VirtualLayer())
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer(structural_hashing=True)
+    vl.hasher.mark_frozen(static)
+    t_tree = timed(vl)
+
+    print(f"  > Flat canonical hashing:  {t_flat*1000:9.2f} ms ({steps} calls)")
+    print(f"  > Structural (Merkle):     {t_tree*1000:9.2f} ms ({steps} calls)")
+    print(f"  > Speedup:                 {t_flat / t_tree:9.1f}x")
+    assert t_tree < t_flat, "Structural hashing did not skip the static sub-tree"
+    print("\nVERDICT: PASS (Changed inputs cost O(changed path))")
+
+if __name__ == "__main__":
+    bench_structural_hashing()
@@ -0,0 +1,53 @@
+import math
+import os
+import random
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+GRID = 81
+QUERIES = 2000
+TOLERANCE = 1e-4
+
+def response(x):
+    # Stand-in for an expensive smooth model evaluation (~1 ms)
+    end = time.perf_counter() + 0.001
+    while time.perf_counter() < end:
+        pass
+    return math.exp(-x) * math.sin(3 * x)
+
+def bench_surrogate():
+    print(f"BENCHMARK | Surrogate interpolation: {QUERIES} in-range queries after a "
+          f"{GRID}-point sweep (tolerance {TOLERANCE:g})")
+    rng = random.Random(20)
+    queries = [rng.uniform(0.0, 2.0) for _ in range(QUERIES)]
+
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    start = time.perf_counter()
+    exact = [vl.run("Response", response, x) for x in queries]
+    t_exact = time.perf_counter() - start
+
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    vl.set_surrogate("Response", TOLERANCE)
+    for i in range(GRID):
+        vl.run("Response", response, 2.0 * i / (GRID - 1))
+    start = time.perf_counter()
+    answers = [vl.run("Response", response, x) for x in queries]
+    t_surrogate = time.perf_counter() - start
+
+    stats = vl.get_stats()["surrogate"]["Response"]
+    answered = stats["answered"]
+    error = max(abs(a - b) for a, b in zip(answers, exact))
+    print(f"  > Exact law:        {t_exact:6.2f} s (every query executes)")
+    print(f"  > Surrogate law:    {t_surrogate:6.2f} s | answered {answered}/{QUERIES} "
+          f"| max error bound {stats['max_error_bound']:.2e}")
+    print(f"  > Observed max error {error:.2e} (tolerance {TOLERANCE:g})")
+    assert error <= TOLERANCE, "Surrogate answer outside tolerance"
+    assert answered > QUERIES * 0.8, "Surrogate answered too few queries"
+    print("\nVERDICT: PASS (In-range queries answered from the interpolant within tolerance)")
+
+if __name__ == "__main__":
+    bench_surrogate()
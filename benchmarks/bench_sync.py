@@ -0,0 +1,50 @@
+import os
+import pickle
+import sys
+import threading
+import time
+from multiprocessing.connection import Pipe
+sys.path.append(os.getcwd())
+from vld_sdk.induction import Law, SharedOracle
+from vld_sdk.persistence import encode_payload
+from vld_sdk.sync import Replica
+
+N = 100_000
+GOLDEN = 0x9E3779B97F4A7C15
+
+def replica(keys):
+    oracle = SharedOracle()
+    law = oracle.publish(Law("Score", 0xC0FFEE))
+    for i in keys:
+        law.record((i * GOLDEN) & 0xFFFFFFFFFFFFFFFF, i * 0.5)
+    return oracle
+
+def bench_sync():
+    print(f"BENCHMARK | Anti-entropy sync vs full copy: {N:,} states per replica, 1% differing")
+    # Each side misses 0.5% of the union that the other side holds
+    left = replica(i for i in range(N) if i % 200 != 0)
+    right = replica(i for i in range(N) if i % 200 != 100)
+    law = left.get("Score")
+    full = len(pickle.dumps([(addr, encode_payload(r)) for addr, r in law.manifold.items()], protocol=5))
+
+    a, b = Pipe()
+    worker = threading.Thread(target=Replica(right).serve, args=(b,))
+    worker.start()
+    start = time.perf_counter()
+    stats = Replica(left).sync(a)
+    elapsed = time.perf_counter() - start
+    worker.join()
+
+    moved = stats["bytes_sent"] + stats["bytes_received"]
+    assert dict(left.get("Score").manifold) == dict(right.get("Score").manifold)
+    assert stats["states_sent"] == stats["states_received"] == N // 200
+    print(f"  > full copy:   {full:>10,} bytes (one replica's states)")
+    print(f"  > delta sync:  {moved:>10,} bytes in {stats['rounds']} round trips "
+          f"| {full / moved:4.1f}x less | {elapsed:.2f}s")
+    print(f"  > states moved: {stats['states_sent']} pushed, {stats['states_received']} pulled")
+
+    assert moved * 3 < full, "Delta sync does not transfer substantially less than a full copy"
+    print("\nVERDICT: PASS (Replicas converge by exchanging only differing subtrees)")
+
+if __name__ == "__main__":
+    bench_sync()
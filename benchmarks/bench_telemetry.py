@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+BUDGET_NS = 100     # Telemetry cost per recall...
+REFERENCE_NS = 550  # ...on a host where a telemetry-off recall takes this long
+
+def bench_telemetry():
+    print("BENCHMARK | Telemetry Hit-Path Cost: vl.run recall with metrics off vs on")
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    calls, rounds = 2_000, 300
+    keys = [i % 500 for i in range(calls)]
+    square = lambda x: x * x
+    run = vl.run
+    for x in keys[:500]:
+        run("Square", square, x)  # Ground every key: measure recall only
+
+    def timed():
+        start = time.perf_counter()
+        for x in keys:
+            run("Square", square, x)
+        return (time.perf_counter() - start) / calls * 1e9
+
+    # Many short interleaved rounds, min of each: both sides get the host's quiet moments
+    off, on = [], []
+    for _ in range(rounds):
+        vl.telemetry.disable()
+        off.append(timed())
+        vl.telemetry.enable()
+        on.append(timed())
+    t_off, t_on = min(off), min(on)
+    metrics = vl.telemetry.snapshot()["Square"]
+
+    # This host's speed varies severalfold: scale the cost to the reference recall
+    cost = (t_on - t_off) * REFERENCE_NS / t_off
+    print(f"  > telemetry off:  {t_off:6.0f} ns/hit")
+    print(f"  > telemetry on:   {t_on:6.0f} ns/hit (+{t_on - t_off:.0f} ns = +{(t_on - t_off) / t_off:.1%})")
+    print(f"  > at a {REFERENCE_NS} ns recall: +{cost:.0f} ns (budget {BUDGET_NS} ns)")
+    print(f"  > counted {metrics['hits']:,} hits, {metrics['lookup_seconds']['count']:,} sampled lookups "
+          f"(1 in {vl.telemetry.sample_every})")
+    assert metrics["hits"] == rounds * calls, "Hits were not all counted"
+    assert cost < BUDGET_NS, "Telemetry exceeds its hit-path budget"
+    print("\nVERDICT: PASS (Per-law metrics within the hit-path budget)")
+
+if __name__ == "__main__":
+    bench_telemetry()
@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import threading
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+def naive_memo_run(cache, func, inputs):
+    # Reference: unsynchronized check-then-compute memoization
+    if inputs in cache:
+        return cache[inputs]
+    result = func(inputs)
+    cache[inputs] = result
+    return result
+
+def run_herd(n_threads, n_keys, call):
+    barrier = threading.Barrier(n_threads)
+
+    def worker(i):
+        barrier.wait()
+        call(i % n_keys)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    start = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return time.perf_counter() - start
+
+def bench_thundering_herd():
+    print("BENCHMARK | Thundering Herd: Single-Flight Grounding")
+    for n_threads, n_keys in [(16, 1), (64, 1), (64, 8), (256, 16)]:
+        calls = {"naive": 0, "vld": 0}
+        lock = threading.Lock()
+
+        def expensive(kind):
+            def task(x):
+                with lock:
+                    calls[kind] += 1
+                time.sleep(0.02)  # I/O-bound ground phase (releases the GIL)
+                return x * x
+            return task
+
+        cache = {}
+        naive_task = expensive("naive")
+        t_naive = run_herd(n_threads, n_keys, lambda k: naive_memo_run(cache, naive_task, k))
+
+        VirtualLayer.ORACLE._laws = {}
+        vl = VirtualLayer()
+        vld_task = expensive("vld")
+        t_vld = run_herd(n_threads, n_keys, lambda k: vl.run("Herd", vld_task, k))
+
+        print(f"  > threads={n_threads:3d} keys={n_keys:2d} | "
+              f"naive compute calls: {calls['naive']:3d} ({t_naive*1000:7.1f} ms) | "
+              f"VLD compute calls: {calls['vld']:3d} ({t_vld*1000:7.1f} ms)")
+        assert calls["vld"] == n_keys, "Single-flight failed to deduplicate misses"
+
+    print("\nVERDICT: PASS (Concurrent misses collapse to one ground phase per unique key)")
+
+if __name__ == "__main__":
+    bench_thundering_herd()
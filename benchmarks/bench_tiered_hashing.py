@@ -0,0 +1,33 @@
+import os
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+def recall_ns(vl, name, inputs, iterations):
+    for x in inputs:
+        vl.run(name, lambda v: v, x)
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        for x in inputs:
+            vl.run(name, None, x)
+    return (time.perf_counter_ns() - start) / (iterations * len(inputs))
+
+def bench_tiered_hashing():
+    print("BENCHMARK | Tiered Input Hashing: Recall ns/op")
+    workloads = {
+        "int": list(range(100)),
+        "str": [f"key_{i}" for i in range(100)],
+        "float": [i * 0.5 + 0.25 for i in range(100)],
+        "bytes": [bytes([i]) * 32 for i in range(100)],
+    }
+    iterations = 2000
+    for kind, inputs in workloads.items():
+        VirtualLayer.ORACLE._laws = {}
+        before = recall_ns(VirtualLayer(coordinate_cache=0), f"SHA_{kind}", inputs, iterations)
+        after = recall_ns(VirtualLayer(), f"Tiered_{kind}", inputs, iterations)
+        print(f"  > {kind:6}: SHA-256 every call: {before:7.1f} ns/op | "
+              f"Tiered key: {after:7.1f} ns/op | Speedup: {before / after:4.2f}x")
+
+if __name__ == "__main__":
+    bench_tiered_hashing()
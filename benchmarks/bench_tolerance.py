@@ -0,0 +1,52 @@
+import math
+import os
+import random
+import sys
+import time
+sys.path.append(os.getcwd())
+from vld_sdk.induction import VirtualLayer
+
+DIM = 16
+STATES = 50
+READINGS = 2000
+NOISE = 1e-13
+
+def model(reading):
+    # Stand-in for an expensive per-reading evaluation (~1 ms)
+    end = time.perf_counter() + 0.001
+    while time.perf_counter() < end:
+        pass
+    return sum(x * x for x in reading)
+
+def bench_tolerance():
+    print(f"BENCHMARK | Approximate recall: {READINGS} sensor readings of {STATES} states "
+          f"(dim {DIM}, noise {NOISE:g})")
+    rng = random.Random(19)
+    states = [[rng.uniform(-1, 1) for _ in range(DIM)] for _ in range(STATES)]
+    readings = [[x + rng.gauss(0, NOISE) for x in rng.choice(states)] for _ in range(READINGS)]
+
+    rows = {}
+    for label, epsilon in (("Exact", None), ("Tolerance", 1e-9)):
+        VirtualLayer.ORACLE._laws = {}
+        vl = VirtualLayer(telemetry=True)
+        if epsilon is not None:
+            vl.set_tolerance("Model", epsilon)
+        start = time.perf_counter()
+        results = [vl.run("Model", model, r) for r in readings]
+        elapsed = time.perf_counter() - start
+        error = max(abs(a - sum(x * x for x in r)) for a, r in zip(results, readings))
+        stats = vl.get_stats()
+        computed = stats["laws"]["Model"]["compute_latency_seconds"]["count"]
+        hit_rate = 1 - computed / READINGS
+        rows[label] = hit_rate
+        print(f"  > {label:10s} hit rate {hit_rate:6.1%} | {elapsed:6.2f} s | "
+              f"max result error {error:.2e}")
+        if epsilon is not None:
+            t = stats["tolerance"]["Model"]
+            print(f"  > {'':10s} approximate hits {t['approximate_hits']} | "
+                  f"max input distance {t['max_error']:.2e} (epsilon {epsilon:g})")
+    assert rows["Tolerance"] > 0.95 and rows["Exact"] < 0.05, "Noisy readings were not recalled"
+    print("\nVERDICT: PASS (Readings within epsilon recall the nearest recorded state)")
+
+if __name__ == "__main__":
+    bench_tolerance()
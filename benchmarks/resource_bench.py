@@ -37,6 +37,20 @@ def benchmark_memory_over_time():
     end_rss = get_rss()
     print(f"Final RSS after {iterations} inductions: {end_rss:.2f} MB (Delta: {end_rss - start_rss:.2f} MB)")
 
+def benchmark_bounded_memory_over_time():
+    print("\n--- Memory Over Time: Budgeted Overlay (max_entries=10000) ---")
+    for policy in ("lru", "lfu", "arc", "gdsf"):
+        vl = VirtualLayer(max_entries=10000, eviction=policy)
+        iterations = 50000
+        start_rss = get_rss()
+        for i in range(iterations):
+            vl.run(f"task_{i}", lambda x: x[0]*x[0], [i])
+        end_rss = get_rss()
+        stats = vl.get_stats()
+        print(f"{policy:>4} | Resident States: {stats['total_memoized_states']:6} | "
+              f"Evictions: {stats['evictions']:6} | RSS Delta: {end_rss - start_rss:.2f} MB")
+        VirtualLayer.ORACLE._laws = {}
+
 def benchmark_crossover():
     print("\n--- Crossover Point: Generative vs. Materialized ---")
     n_elements = 100000
@@ -66,4 +80,5 @@ def benchmark_crossover():
 if __name__ == "__main__":
     benchmark_memory_scaling()
     benchmark_memory_over_time()
+    benchmark_bounded_memory_over_time()
     benchmark_crossover()
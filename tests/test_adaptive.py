@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.adaptive import AdaptiveBypass
+from vld_sdk.induction import VirtualLayer
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def fast_layer():
+    return VirtualLayer(adaptive_bypass=AdaptiveBypass(window=64, sample_every=1, probe_after=64))
+
+def slow_square(x):
+    time.sleep(0.001)
+    return x * x
+
+def test_never_hitting_cheap_law_is_bypassed():
+    vl = fast_layer()
+    for i in range(1000):
+        assert vl.run("Identity", lambda x: x, i) == i
+    stats = vl.get_stats()["bypass"]["Identity"]
+    assert stats["mode"] == "bypass"
+    assert stats["bypassed_calls"] > 0
+    assert stats["decisions"][0]["mode"] == "bypass"
+    # Bypassed calls are neither hashed nor recorded
+    assert len(vl.laws["Identity"].manifold) < 1000
+
+def test_profitable_law_stays_active():
+    vl = fast_layer()
+    for i in range(300):
+        assert vl.run("Slow", slow_square, i % 4) == (i % 4) ** 2
+    stats = vl.get_stats()["bypass"]["Slow"]
+    assert stats["mode"] == "active" and stats["bypassed_calls"] == 0
+    assert len(vl.laws["Slow"].manifold) == 4
+
+def test_probe_reenables_when_workload_changes():
+    vl = fast_layer()
+    # Expensive but never repeated: caching cannot pay off
+    for i in range(100):
+        vl.run("Shifting", slow_square, 1000 + i)
+    assert vl.get_stats()["bypass"]["Shifting"]["mode"] == "bypass"
+
+    # Same function, now a hot working set: the next probe re-enables it
+    for i in range(200):
+        assert vl.run("Shifting", slow_square, i % 4) == (i % 4) ** 2
+    stats = vl.get_stats()["bypass"]["Shifting"]
+    assert stats["mode"] == "active"
+    assert [d["mode"] for d in stats["decisions"]] == ["bypass", "active"]
+
+def test_failed_probes_back_off():
+    vl = fast_layer()
+    for i in range(3000):
+        vl.run("Unique", lambda x: x, i)
+    stats = vl.get_stats()["bypass"]["Unique"]
+    assert stats["failed_probes"] >= 1 and stats["probe_after"] > 64
+
+def test_decorated_functions_are_governed():
+    vl = fast_layer()
+
+    @vl.induce("Add")
+    def add(a, b):
+        return a + b
+
+    for i in range(500):
+        assert add(i, 1) == i + 1
+    assert vl.get_stats()["bypass"]["Add"]["mode"] == "bypass"
+
+def test_disabled_by_default():
+    vl = VirtualLayer()
+    for i in range(200):
+        vl.run("Identity", lambda x: x, i)
+    assert "bypass" not in vl.get_stats()
+    assert len(vl.laws["Identity"].manifold) == 200
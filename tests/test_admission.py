@@ -0,0 +1,64 @@
+import os
+import sys
+import time
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.memory import AdmissionPolicy
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def slow_small(x):
+    time.sleep(0.002)
+    return x
+
+def fast_large(x):
+    return bytes(1 << 20)
+
+def test_policy_rules():
+    assert AdmissionPolicy().admit(bytes(1 << 20), 0.0)
+    assert not AdmissionPolicy(min_cost=1e-3).admit(1, 1e-4)
+    assert AdmissionPolicy(min_cost=1e-3).admit(1, 1e-2)
+    assert not AdmissionPolicy(max_result_bytes=1024).admit(bytes(4096), 10.0)
+    # 1 ms of compute to keep 1 MiB resident: below 1 ns/byte
+    value = AdmissionPolicy(min_value_per_byte=1e-9)
+    assert not value.admit(bytes(1 << 20), 1e-3)
+    assert value.admit(bytes(1 << 20), 1e-2)
+    assert (value.admitted, value.rejected) == (1, 1)
+    assert value.rejected_bytes >= 1 << 20
+
+def test_rejected_results_are_returned_but_not_recorded():
+    vl = VirtualLayer(admission=AdmissionPolicy(min_value_per_byte=1e-9))
+    assert len(vl.run("Large", fast_large, 1)) == 1 << 20
+    assert vl.laws["Large"].manifold == {}
+    assert vl.run("Small", slow_small, 1) == 1
+    assert len(vl.laws["Small"].manifold) == 1
+    stats = vl.get_stats()["admission"]
+    assert stats["admitted"] == 1 and stats["rejected"] == 1
+
+def test_per_law_override():
+    vl = VirtualLayer(admission=AdmissionPolicy(max_result_bytes=1024))
+    vl.set_admission("Large", None)
+    vl.run("Large", fast_large, 1)
+    vl.run("Other", fast_large, 1)
+    assert len(vl.laws["Large"].manifold) == 1
+    assert vl.laws["Other"].manifold == {}
+
+def test_batched_and_async_paths_apply_admission():
+    import asyncio
+    policy = AdmissionPolicy(max_result_bytes=1024)
+    vl = VirtualLayer(admission=policy)
+    out = vl.run_many("Mixed", lambda n: bytes(n), [16, 1 << 16, 16])
+    assert [len(b) for b in out] == [16, 1 << 16, 16]
+    assert len(vl.laws["Mixed"].manifold) == 1
+
+    async def main():
+        return await vl.arun("AsyncLarge", fast_large, 1)
+    assert len(asyncio.run(main())) == 1 << 20
+    assert vl.laws["AsyncLarge"].manifold == {}
+    assert policy.rejected == 2
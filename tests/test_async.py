@@ -0,0 +1,87 @@
+import asyncio
+import os
+import sys
+import threading
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+
+@pytest.fixture(autouse=True)
+def fresh_oracle():
+    # Reset the Oracle for each test to ensure isolation
+    VirtualLayer.ORACLE._laws = {}
+
+def test_arun_awaits_coroutines_and_recalls():
+    vl = VirtualLayer()
+    calls = []
+
+    async def fetch(x):
+        calls.append(x)
+        await asyncio.sleep(0.01)
+        return x * 10
+
+    async def main():
+        first = await vl.arun("Fetch", fetch, 4)
+        second = await vl.arun("Fetch", fetch, 4)
+        return first, second
+
+    assert asyncio.run(main()) == (40, 40)
+    assert calls == [4]
+    # Sync and async paths share the same Law
+    assert vl.run("Fetch", lambda x: None, 4) == 40
+
+def test_concurrent_tasks_share_one_future():
+    vl = VirtualLayer()
+    calls = []
+
+    @vl.ainduce("SlowSquare")
+    async def slow_square(x):
+        calls.append(x)
+        await asyncio.sleep(0.05)
+        return x * x
+
+    async def main():
+        return await asyncio.gather(*(slow_square(i % 3) for i in range(30)))
+
+    assert asyncio.run(main()) == [(i % 3) ** 2 for i in range(30)]
+    assert sorted(calls) == [0, 1, 2]
+
+def test_exception_propagates_to_all_waiters():
+    vl = VirtualLayer()
+
+    async def boom(x):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("ground failure")
+
+    async def main():
+        return await asyncio.gather(*(vl.arun("Boom", boom, 1) for _ in range(5)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert vl.laws["Boom"].async_flights == {}
+
+def test_large_inputs_are_hashed_off_loop():
+    vl = VirtualLayer(async_hash_threshold=1024)
+    payload = b"\x01" * 100_000
+    hashing_threads = []
+    original = vl.hasher.hash_data
+
+    def spy(data):
+        hashing_threads.append((data, threading.current_thread()))
+        return original(data)
+
+    vl.hasher.hash_data = spy
+
+    async def main():
+        big = await vl.arun("Len", len, payload)
+        small = await vl.arun("Len", len, b"abc")
+        return big, small
+
+    assert asyncio.run(main()) == (100_000, 3)
+    threads = {data: thread for data, thread in hashing_threads}
+    assert threads[payload] is not threading.main_thread()
+    assert threads[b"abc"] is threading.main_thread()
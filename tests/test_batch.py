@@ -0,0 +1,59 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+
+@pytest.fixture(autouse=True)
+def fresh_oracle():
+    # Reset the Oracle for each test to ensure isolation
+    VirtualLayer.ORACLE._laws = {}
+
+def sum_of_squares(n):
+    return sum(i * i for i in range(n))
+
+def never_called(n):
+    raise AssertionError("Ground phase re-executed for a memoized input")
+
+def test_run_many_inline_matches_run():
+    vl = VirtualLayer()
+    inputs = [5, 3, 5, 9, 3, 1]
+    assert vl.run_many("SumSq", sum_of_squares, inputs) == [sum_of_squares(n) for n in inputs]
+    assert len(vl.laws["SumSq"].manifold) == 4
+    assert vl.run("SumSq", never_called, 9) == sum_of_squares(9)
+    assert vl.run_many("SumSq", never_called, []) == []
+
+def test_run_many_resolves_hits_and_misses_together():
+    vl = VirtualLayer()
+    vl.run("SumSq", sum_of_squares, 10)
+    calls = []
+
+    def counted(n):
+        calls.append(n)
+        return sum_of_squares(n)
+
+    out = vl.run_many("SumSq", counted, [10, 11, 10, 12])
+    assert out == [sum_of_squares(n) for n in (10, 11, 10, 12)]
+    assert calls == [11, 12]
+
+def test_run_many_process_pool_is_order_deterministic():
+    inputs = [(i * 37) % 101 for i in range(300)]
+    expected = [sum_of_squares(n) for n in inputs]
+    for workers in (1, 3):
+        VirtualLayer.ORACLE._laws = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            vl = VirtualLayer(executor=pool)
+            assert vl.run_many("SumSq", sum_of_squares, inputs, chunksize=7) == expected
+        # Merged results are recalled without the pool
+        assert vl.run_many("SumSq", never_called, inputs) == expected
+        assert VirtualLayer.ORACLE.get("SumSq") is vl.laws["SumSq"]
+
+def test_run_many_explicit_executor_overrides_default():
+    vl = VirtualLayer()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert vl.run_many("SumSq", sum_of_squares, range(20), executor=pool) == \
+            [sum_of_squares(n) for n in range(20)]
@@ -0,0 +1,105 @@
+import array
+import hashlib
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.core import CanonicalEncoder, DeterministicHasher
+from vld_sdk.induction import VirtualLayer
+
+H = DeterministicHasher.hash_data
+
+def test_scalars_are_type_tagged():
+    assert len({H(1), H("1"), H(b"1"), H(True), H(1.0)}) == 5
+    assert H(True) != H("True") and H(1.0) != H("1.0") and H(b"abc") != H("abc")
+    for x in ["abc", "\ud800", "x" * 10_000, b"abc", 0, -2 ** 200, 1.5, -0.0, True, None]:
+        assert H(x) == DeterministicHasher.hash_canonical(x)  # Direct scalar path, same stream
+    # Packed float lists carry their own tag: never the bytes of another value
+    packed = b"\x00VLD:d1" + b"\x00" * 6 + b"\xf0?" + b"\x00" * 7 + b"@"
+    assert H([1.0, 2.0]) == int(hashlib.sha256(packed).hexdigest(), 16)
+    assert H([1.0, 2.0]) != H(packed[7:])
+
+def test_scalars_of_different_types_are_not_recalled_for_each_other():
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    inputs = [1, "1", b"1", True, 1.0]
+    assert [vl.run("kind", lambda x: type(x).__name__, x) for x in inputs] == \
+        ["int", "str", "bytes", "bool", "float"]
+    assert len({vl.hasher.hash_data(x) for x in inputs}) == 5
+
+def test_non_float_lists_no_longer_crash():
+    assert H(["a", "b"]) != H(["a", "c"])
+    assert H([1, "1"]) != H(["1", 1])
+    assert H([2 ** 2000]) != H([2 ** 2000 + 1])
+
+def test_int_float_bool_lists_do_not_alias():
+    assert len({H([1]), H([1.0]), H([True])}) == 3
+    assert H([10 ** 17]) != H([10 ** 17 + 1])  # Not exactly representable as doubles
+    assert H([2 ** 53] * 8) != H([2 ** 53 + 1] * 8)
+    assert H([1.0, 1]) != H([1.0, 1.0])
+
+def test_large_int_lists_are_not_recalled_for_neighbours():
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    assert vl.run("ids", lambda ids: ids[0] % 1000, [10 ** 17]) == 0
+    assert vl.run("ids", lambda ids: ids[0] % 1000, [10 ** 17 + 1]) == 1
+    assert vl.run("flags", lambda xs: type(xs[0]).__name__, [True]) == "bool"
+    assert vl.run("flags", lambda xs: type(xs[0]).__name__, [1]) == "int"
+
+def test_dicts_are_order_independent_and_type_tagged():
+    assert H({"a": 1, "b": [1, "x"]}) == H({"b": [1, "x"], "a": 1})
+    assert H({"a": 1}) != H({"a": 1.0})
+    assert H({1: "a"}) != H({"1": "a"})
+    assert H({1: "a", "b": 2}) == H({"b": 2, 1: "a"})
+    assert H({"k": (1, 2)}) != H({"k": [1, 2]})
+    assert H({"k": {"n": [1]}}) != H({"k": {"n": [[1]]}})
+
+def test_sets_and_tuples():
+    assert H({3, 1, 2}) == H({1, 2, 3})
+    # Like ==, a frozenset and a set with equal members share a coordinate
+    assert H(frozenset({1, 2})) == H({1, 2})
+    assert H({1, 2}) != H([1, 2])
+    assert H((1, 2)) != H((2, 1))
+    assert H((None, True)) != H((None, 1))
+
+def test_buffers_hash_contents_and_layout():
+    assert H(bytearray(b"abc")) == H(memoryview(b"abc"))
+    assert H(array.array("d", [1.0, 2.0])) != H(array.array("f", [1.0, 2.0]))
+    big = bytearray(range(256)) * 64
+    assert H(big) == H(memoryview(bytes(big)))
+    strided = memoryview(bytes(range(16)))[::2]
+    assert H(strided) != H(memoryview(bytes(range(0, 16, 2))))
+
+def test_numpy_arrays_include_dtype_shape_strides():
+    np = pytest.importorskip("numpy")
+    a = np.arange(12, dtype=np.float64).reshape(3, 4)
+    assert H(a) == H(a.copy())
+    assert H(a) != H(a.astype(np.float32))
+    assert H(a) != H(a.reshape(4, 3))
+    assert H(a.T) != H(np.ascontiguousarray(a.T))
+    big = np.random.default_rng(0).random(1 << 18)
+    flipped = big.copy(); flipped[-1] += 1e-12
+    assert H(big) != H(flipped)
+
+def test_streaming_matches_one_shot_digest():
+    payload = {"blob": b"x" * (CanonicalEncoder.FLUSH * 3), "n": 1}
+    enc = CanonicalEncoder()
+    enc.write(payload)
+    assert int.from_bytes(enc.digest(), "big") == H(payload)
+
+def test_run_with_structured_inputs():
+    VirtualLayer.ORACLE._laws = {}
+    vl = VirtualLayer()
+    calls = []
+
+    def keys(obj):
+        calls.append(obj)
+        return sorted(obj)
+
+    assert vl.run("Keys", keys, {"b": 1, "a": 2}) == ["a", "b"]
+    assert vl.run("Keys", keys, {"a": 2, "b": 1}) == ["a", "b"]
+    assert vl.run("Keys", keys, ["x", "y"]) == ["x", "y"]
+    assert len(calls) == 2
@@ -0,0 +1,85 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+np = pytest.importorskip("numpy")
+from vld_sdk.compact import CompactManifold
+from vld_sdk.induction import VirtualLayer, MISS
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def test_mapping_semantics_match_dict():
+    rng = np.random.default_rng(7)
+    addrs = rng.integers(0, 2 ** 64, size=5000, dtype=np.uint64).tolist() + [0, 2 ** 64 - 1]
+    store, ref = CompactManifold(capacity=8), {}
+    for i, a in enumerate(addrs):
+        store[a] = ref[a] = i * 0.5
+    for a in addrs[::3]:
+        assert store.pop(a) == ref.pop(a)
+    for a in addrs[::7]:  # Reinsert over tombstones
+        store[a] = ref[a] = -1.0
+    assert len(store) == len(ref)
+    assert dict(store.items()) == ref
+    assert all(store.get(a, MISS) == ref.get(a, MISS) for a in addrs)
+    assert store.get(12345, MISS) is MISS
+    store.clear()
+    assert len(store) == 0 and store.get(addrs[1]) is None
+
+def test_values_keep_their_python_types():
+    ints = CompactManifold("int64")
+    ints[1] = 7
+    ints[2] = 2 ** 70  # Out of range: side dict
+    ints[3] = 7.0      # Wrong kind: side dict
+    assert type(ints[1]) is int and ints[2] == 2 ** 70 and type(ints[3]) is float
+    pairs = CompactManifold("float64", width=2)
+    pairs[1] = (1.5, -2.0)
+    pairs[2] = [1.5, -2.0]  # Not a tuple: side dict
+    assert pairs[1] == (1.5, -2.0) and pairs[2] == [1.5, -2.0]
+    # A key moves between the arrays and the side dict without duplicates
+    pairs[1] = None
+    pairs[2] = (0.0, 0.0)
+    assert len(pairs) == 2 and pairs[1] is None and pairs[2] == (0.0, 0.0)
+
+def test_vectorized_lookups():
+    store = CompactManifold("float64")
+    addrs = np.arange(1, 20001, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    for a in addrs[:10000].tolist():
+        store[a] = float(a % 1000)
+    store[int(addrs[-1])] = "side"
+    values, found = store.get_many(addrs)
+    assert found[:10000].all() and not found[10000:].any()
+    assert np.array_equal(values[:10000], (addrs[:10000] % np.uint64(1000)).astype(np.float64))
+    contained = store.contains_many(addrs)
+    assert contained[:10000].all() and contained[-1] and not contained[10000:-1].any()
+
+def test_unsupported_dtype_is_rejected():
+    with pytest.raises(ValueError):
+        CompactManifold("complex128")
+
+def test_layer_laws_use_the_compact_store():
+    vl = VirtualLayer()
+    vl.run("Square", lambda x: x * x, 3.0)
+    vl.set_compact("Square")  # Converts the existing manifold
+    assert isinstance(vl.laws["Square"].manifold, CompactManifold)
+    xs = [float(i) for i in range(500)]
+    assert vl.run_many("Square", lambda x: x * x, xs) == [x * x for x in xs]
+    assert vl.run_many("Square", lambda x: pytest.fail("recomputed"), xs) == [x * x for x in xs]
+    assert vl.run("Square", None, 3.0) == 9.0
+
+    vl.set_compact("MinMax", dtype="int32", width=2)
+    assert vl.run("MinMax", lambda xs: (min(xs), max(xs)), [3, 1, 2]) == (1, 3)
+    assert vl.run("MinMax", None, [3, 1, 2]) == (1, 3)
+    assert vl.get_stats()["total_memoized_states"] == 501
+
+def test_budgets_evict_from_the_compact_store():
+    vl = VirtualLayer(law_max_entries=100)
+    vl.set_compact("Half")
+    vl.run_many("Half", lambda x: x / 2, [float(i) for i in range(300)])
+    law = vl.laws["Half"]
+    assert len(law.manifold) == 100
+    assert law.execute(vl.coords.coordinate(299.0)) == 149.5
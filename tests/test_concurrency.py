@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+import time
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.concurrency import SingleFlight
+from vld_sdk.induction import VirtualLayer
+
+@pytest.fixture(autouse=True)
+def fresh_oracle():
+    # Reset the Oracle for each test to ensure isolation
+    VirtualLayer.ORACLE._laws = {}
+
+def herd(n_threads, target):
+    barrier = threading.Barrier(n_threads)
+    results = [None] * n_threads
+
+    def worker(i):
+        barrier.wait()
+        results[i] = target(i)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_threads)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    return results
+
+def test_thundering_herd_computes_once():
+    vl = VirtualLayer()
+    calls = []
+
+    def slow_square(x):
+        calls.append(x)
+        time.sleep(0.05)
+        return x * x
+
+    results = herd(32, lambda i: vl.run("SlowSquare", slow_square, 12))
+    assert results == [144] * 32
+    assert calls == [12]
+
+def test_one_call_per_unique_key():
+    vl = VirtualLayer()
+    calls = []
+
+    def slow_cube(x):
+        calls.append(x)
+        time.sleep(0.02)
+        return x ** 3
+
+    results = herd(40, lambda i: vl.run("SlowCube", slow_cube, i % 4))
+    assert results == [(i % 4) ** 3 for i in range(40)]
+    assert sorted(calls) == [0, 1, 2, 3]
+
+def test_waiters_receive_leader_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.05)
+        raise ValueError("ground phase failed")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("k", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    waiter = threading.Thread(target=call)
+    waiter.start()
+    leader.join(); waiter.join()
+    assert len(errors) == 2 and len(flight) == 0
+
+def test_unrelated_laws_do_not_block():
+    vl = VirtualLayer()
+    vl.run("Fast", lambda x: x + 1, 1)
+    release = threading.Event()
+    slow = threading.Thread(target=vl.run, args=("Slow", lambda x: release.wait(5), 1))
+    slow.start()
+    start = time.perf_counter()
+    assert vl.run("Fast", lambda x: x + 1, 1) == 2
+    assert vl.run("Fast", lambda x: x + 1, 2) == 3
+    assert time.perf_counter() - start < 1.0
+    release.set()
+    slow.join()
+
+def test_concurrent_law_creation_converges():
+    layers = [VirtualLayer() for _ in range(16)]
+    herd(16, lambda i: layers[i].run("Converge", lambda x: x * 2, i))
+    laws = {id(vl.laws["Converge"]) for vl in layers}
+    assert len(laws) == 1
+    assert len(VirtualLayer.ORACLE.get("Converge").manifold) == 16
+
+def test_global_and_law_budgets_do_not_deadlock():
+    vl = VirtualLayer(max_entries=50, law_max_entries=30)
+    done = []
+
+    def worker(i):
+        for x in range(2000):
+            assert vl.run(f"Law{i % 2}", lambda v: v * 3, (i * 7919 + x) % 500) == (i * 7919 + x) % 500 * 3
+        done.append(i)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(4)]
+    for t in threads: t.start()
+    deadline = time.monotonic() + 20
+    for t in threads: t.join(max(0.0, deadline - time.monotonic()))
+    assert sorted(done) == [0, 1, 2, 3], "Budget eviction deadlocked"
+    stats = vl.get_stats()
+    assert stats["budget_entries"] <= 50
+    assert all(len(law.manifold) <= 30 for law in vl.laws.values())
+    assert stats["budget_entries"] == sum(len(law.manifold) for law in vl.laws.values())
@@ -0,0 +1,139 @@
+import os
+import sys
+import threading
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.filters import BloomFilter
+from vld_sdk.induction import SharedOracle, VirtualLayer
+from vld_sdk.persistence import SQLiteOracle
+from vld_sdk.server import OracleServer, RemoteOracle
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+    yield
+    VirtualLayer.ORACLE._laws = {}
+
+GOLDEN = 0x9E3779B97F4A7C15
+KEYS = [(i * GOLDEN) & 0xFFFFFFFFFFFFFFFF for i in range(40_000)]
+
+def never_called(x):
+    raise AssertionError("Filter hid a recorded state")
+
+def square(x):
+    return x * x
+
+def test_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.update(KEYS[:20_000])  # Grows well past the initial capacity
+    assert len(bloom) == 20_000
+    assert bloom.stats()["layers"] > 1
+    assert all(key in bloom for key in KEYS[:20_000])
+    false = sum(bloom.check(key) for key in KEYS[20_000:])
+    assert false / 20_000 < 0.02  # Scaled layers stay within 2p
+    assert bloom.negatives == 20_000 - false
+    assert 0 < bloom.expected_fpr() < 0.02
+    with pytest.raises(ValueError):
+        BloomFilter(error_rate=1.0)
+
+def test_sqlite_misses_skip_the_query(tmp_path):
+    path = str(tmp_path / "oracle.db")
+    with SQLiteOracle(path) as oracle:
+        VirtualLayer(oracle=oracle).run_many("Square", square, list(range(500)))
+
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        assert vl.run("Square", never_called, 1) == 1  # Read through while the filter builds
+        oracle.get("Square")._screen(wait=True)
+        loads = []
+        load = oracle.load
+        oracle.load = lambda law, addr: loads.append(addr) or load(law, addr)
+        assert all(vl.run("Square", never_called, i) == i * i for i in range(0, 500, 5))
+        assert len(loads) == 100  # Recorded states are read through
+        loads.clear()
+        assert vl.run("Square", square, 10_000) == 10_000 ** 2  # True miss
+        assert len(loads) <= 1
+        stats = vl.get_stats()["filters"]["Square"]
+        assert stats["entries"] == 501  # Built on load, then updated by record
+        assert stats["skipped_round_trips"] >= 1
+        assert vl.run("Square", never_called, 10_000) == 10_000 ** 2
+
+def test_batched_recall_is_screened_then_read_through(tmp_path):
+    with SQLiteOracle(str(tmp_path / "oracle.db")) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        vl.run("Square", square, 1)
+        law = oracle.get("Square")
+        vl.run_many("Square", square, list(range(2, 300)))
+        law._screen(wait=True)
+        law.manifold.clear()
+        assert vl.run_many("Square", never_called, list(range(1, 300))) == [i * i for i in range(1, 300)]
+        assert law.filter.false_positives <= law.filter.lookups
+
+def test_sqlite_filter_is_built_off_the_request_thread(tmp_path):
+    path = str(tmp_path / "oracle.db")
+    with SQLiteOracle(path) as oracle:
+        VirtualLayer(oracle=oracle).run_many("Square", square, list(range(100)))
+
+    with SQLiteOracle(path) as oracle:
+        law, scan = oracle.get("Square"), oracle.addresses
+        taken, release = threading.Event(), threading.Event()
+
+        def slow_scan(law):
+            snapshot = list(scan(law))
+            taken.set()
+            assert release.wait(10)
+            return snapshot
+        oracle.addresses = slow_scan
+        vl = VirtualLayer(oracle=oracle)
+        assert vl.run("Square", square, 1000) == 1000 ** 2  # Not blocked by the build
+        assert taken.wait(10) and law.filter is None
+        assert vl.run("Square", square, 1001) == 1001 ** 2  # Recorded after the snapshot
+        release.set()
+        assert law._screen(wait=True) is not None
+        law.manifold.clear()
+        assert [vl.run("Square", never_called, i) for i in (5, 1000, 1001)] == [25, 1000 ** 2, 1001 ** 2]
+
+def test_sqlite_filter_rebuilds_after_sibling_writes(tmp_path):
+    path = str(tmp_path / "oracle.db")
+    with SQLiteOracle(path) as a, SQLiteOracle(path) as b:
+        VirtualLayer(oracle=a).run_many("Square", square, list(range(100)))
+        a.flush()
+        law = a.get("Square")
+        screen = law._screen(wait=True)
+        screen.built_at -= 60  # Past filter_refresh, but only this connection wrote
+        assert law._screen(wait=True) is screen
+
+        VirtualLayer(oracle=b).run("Square", square, 7000)
+        b.flush()  # Another connection commits: the next check rebuilds
+        screen.built_at -= 60
+        assert law._screen(wait=True) is not screen
+        assert VirtualLayer(oracle=a).run("Square", never_called, 7000) == 7000 ** 2
+
+def test_remote_filter_refreshes_for_other_hosts():
+    with OracleServer(SharedOracle()) as server:
+        with RemoteOracle(server.address) as a, RemoteOracle(server.address) as b:
+            VirtualLayer(oracle=a).run_many("Square", square, list(range(100)))
+            a.flush()
+            vl = VirtualLayer(oracle=b)
+            assert vl.run("Square", never_called, 42) == 42 * 42
+            law = b.get("Square")
+            law._screen(wait=True)
+            requests = b.requests
+            assert vl.run("Square", square, 5000) == 5000 ** 2
+            assert b.requests - requests <= 2  # Filtered miss, then the buffered put
+
+            VirtualLayer(oracle=a).run("Square", square, 7000)
+            a.flush()
+            law.filter.built_at -= 60  # Stale: rebuilt from the server's keys
+            law._screen(wait=True)
+            law.manifold.clear()
+            assert vl.run("Square", never_called, 7000) == 7000 ** 2
+
+def test_memory_oracle_is_not_filtered():
+    vl = VirtualLayer()
+    vl.run_many("Square", square, list(range(10)))
+    assert vl.ORACLE.get("Square").filter is None
+    assert "filters" not in vl.get_stats()
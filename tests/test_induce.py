@@ -0,0 +1,107 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def test_keys_are_canonical_across_call_styles():
+    vl = VirtualLayer()
+    calls = []
+
+    @vl.induce()
+    def volume(w, h, d=1):
+        calls.append((w, h, d))
+        return w * h * d
+
+    assert volume(2, 3) == 6
+    assert volume(2, 3, 1) == 6
+    assert volume(h=3, w=2) == 6
+    assert volume(2, d=1, h=3) == 6
+    assert len(calls) == 1
+    assert volume(2, 3, d=2) == 12
+    assert len(calls) == 2
+
+def test_types_do_not_alias():
+    vl = VirtualLayer()
+
+    @vl.induce("Kind")
+    def kind(x, y):
+        return type(x).__name__
+
+    assert kind(1, 2) == "int"
+    assert kind(1.0, 2) == "float"
+    assert kind(True, 2) == "bool"
+    assert kind(-0.0, 0) == "float" and kind(0.0, 0) == "float"
+
+def test_telemetry_enabled_after_decoration_is_counted():
+    vl = VirtualLayer()
+    square = vl.induce("Square")(lambda x: x * x)
+    assert square(3) == 9 and square(3) == 9  # Fast path
+    vl.telemetry.enable()
+    assert square(3) == 9 and square(4) == 16
+    metrics = vl.get_stats()["laws"]["Square"]
+    assert metrics["hits"] == 1 and metrics["misses"] == 1
+
+def test_varargs_and_keyword_only():
+    vl = VirtualLayer()
+    calls = []
+
+    @vl.induce()
+    def join(sep, *parts, upper=False, **extra):
+        calls.append(parts)
+        out = sep.join(parts)
+        return out.upper() if upper else out
+
+    assert join("-", "a", "b", x=1, y=2) == "a-b"
+    assert join("-", "a", "b", y=2, x=1) == "a-b"
+    assert len(calls) == 1
+    assert join("-", "a", "b", upper=True, x=1, y=2) == "A-B"
+    with pytest.raises(TypeError):
+        join()
+
+def test_ignore_and_key_funcs():
+    vl = VirtualLayer()
+    calls = []
+
+    @vl.induce(ignore=("log",), key_funcs={"conn": lambda c: c["dsn"]})
+    def query(conn, sql, log=None):
+        calls.append(sql)
+        return f"{conn['dsn']}:{sql}"
+
+    assert query({"dsn": "db1", "socket": object()}, "select 1", log=print) == "db1:select 1"
+    assert query({"dsn": "db1", "socket": object()}, "select 1") == "db1:select 1"
+    assert len(calls) == 1
+    assert query({"dsn": "db2"}, "select 1") == "db2:select 1"
+    assert len(calls) == 2
+
+    with pytest.raises(ValueError):
+        vl.induce(ignore=("missing",))(lambda a: a)
+
+def test_decorated_functions_share_laws_through_the_oracle():
+    producer, consumer = VirtualLayer(), VirtualLayer()
+
+    @producer.induce("Area")
+    def area(w, h):
+        return w * h
+
+    @consumer.induce("Area")
+    def never(w, h):
+        raise AssertionError("Not recalled from the shared law")
+
+    assert area(3, 4) == 12
+    assert never(h=4, w=3) == 12
+    assert area.law_name == "Area" and area.__name__ == "area"
+
+def test_coroutines_are_rejected():
+    vl = VirtualLayer()
+    with pytest.raises(TypeError):
+        @vl.induce()
+        async def fetch(x):
+            return x
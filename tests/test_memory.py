@@ -0,0 +1,95 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.memory import (ARCPolicy, GDSFPolicy, LFUPolicy, LRUPolicy,
+                            ManifoldBudget, estimate_nbytes)
+
+@pytest.fixture(autouse=True)
+def fresh_oracle():
+    # Reset the Oracle for each test to ensure isolation
+    VirtualLayer.ORACLE._laws = {}
+
+def square(x):
+    return x * x
+
+def test_lru_order():
+    p = LRUPolicy()
+    for k in "abc":
+        p.admit(k, 1, 0.0)
+    p.touch("a")
+    assert p.evict() == "b"
+    assert p.evict() == "c"
+    assert p.evict() == "a"
+
+def test_lfu_prefers_rare_keys():
+    p = LFUPolicy()
+    for k in "abc":
+        p.admit(k, 1, 0.0)
+    p.touch("a"); p.touch("a"); p.touch("c")
+    assert p.evict() == "b"
+    assert p.evict() == "c"
+    p.discard("a")
+    p.admit("d", 1, 0.0)
+    assert p.evict() == "d"
+
+def test_arc_protects_frequent_keys_from_scans():
+    p = ARCPolicy(capacity=4)
+    for k in ("hot1", "hot2"):
+        p.admit(k, 1, 0.0)
+        p.touch(k)
+    evicted = []
+    for i in range(10):
+        p.admit(f"scan{i}", 1, 0.0)
+        if len(p.t1) + len(p.t2) > 4:
+            evicted.append(p.evict())
+    assert "hot1" not in evicted and "hot2" not in evicted
+
+def test_gdsf_keeps_expensive_small_results():
+    p = GDSFPolicy()
+    p.admit("cheap_big", 1000, 0.001)
+    p.admit("costly_small", 10, 1.0)
+    assert p.evict() == "cheap_big"
+    assert p.clock > 0.0
+
+def test_law_entry_budget():
+    vl = VirtualLayer(law_max_entries=10)
+    for i in range(100):
+        assert vl.run("Square", square, i) == i * i
+    law = vl.laws["Square"]
+    assert len(law.manifold) == 10
+    assert vl.get_stats()["evictions"] == 90
+    # Most recent states are still resident under LRU
+    assert law.execute(vl.hasher.hash_data(99)) == 99 * 99
+
+def test_global_budget_spans_laws():
+    vl = VirtualLayer(max_entries=50, eviction="lfu")
+    for i in range(500):
+        vl.run(f"task_{i}", lambda x: x[0] * x[0], [i])
+    stats = vl.get_stats()
+    assert stats["total_memoized_states"] == 50
+    assert stats["budget_entries"] == 50
+
+@pytest.mark.parametrize("policy", ["lru", "lfu", "arc", "gdsf"])
+def test_byte_budget(policy):
+    vl = VirtualLayer(max_bytes=20_000, eviction=policy)
+    for i in range(200):
+        vl.run("Blob", lambda n: b"x" * 1000, i)
+    assert vl.budget.nbytes <= 20_000
+    assert 0 < len(vl.laws["Blob"].manifold) < 200
+
+def test_oversized_result_is_not_retained():
+    vl = VirtualLayer()
+    vl.set_budget("Huge", max_bytes=100)
+    vl.run("Huge", lambda n: b"x" * 10_000, 1)
+    assert vl.laws["Huge"].manifold == {}
+
+def test_estimate_nbytes_scales_with_payload():
+    assert estimate_nbytes(b"x" * 10_000) > 10_000
+    assert estimate_nbytes(list(range(10_000))) > estimate_nbytes(list(range(10)))
+    budget = ManifoldBudget(max_entries=1)
+    assert budget.entries == 0
@@ -0,0 +1,115 @@
+import os
+import sys
+import time
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import CachedException, MISS, VirtualLayer
+from vld_sdk.persistence import SQLiteOracle
+
+class Counter:
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.func(x)
+
+def fail_on_negative(x):
+    if x < 0:
+        raise ValueError(f"negative input {x}")
+    return x * 2
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def test_none_results_are_recalled():
+    vl = VirtualLayer()
+    lookup = Counter(lambda key: None)
+    assert vl.run("Lookup", lookup, "missing") is None
+    assert vl.run("Lookup", lookup, "missing") is None
+    assert lookup.calls == 1
+
+def test_execute_misses_with_sentinel():
+    vl = VirtualLayer()
+    vl.run("Lookup", lambda key: None, "k")
+    law = vl.laws["Lookup"]
+    assert law.execute(vl.hasher.hash_data("k")) is None
+    assert law.execute(vl.hasher.hash_data("other")) is MISS
+
+def test_exceptions_are_not_cached_by_default():
+    vl = VirtualLayer()
+    func = Counter(fail_on_negative)
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            vl.run("Double", func, -1)
+    assert func.calls == 2
+
+def test_configured_exceptions_are_recalled():
+    vl = VirtualLayer(cache_exceptions=(ValueError,))
+    func = Counter(fail_on_negative)
+    for _ in range(3):
+        with pytest.raises(ValueError, match="negative input -1"):
+            vl.run("Double", func, -1)
+    assert func.calls == 1
+
+    def type_error(x):
+        raise TypeError("not cached")
+    wrapped = Counter(type_error)
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            vl.run("Broken", wrapped, 1)
+    assert wrapped.calls == 2
+
+def test_cached_failures_do_not_pin_frames():
+    vl = VirtualLayer(cache_exceptions=True)
+    with pytest.raises(ValueError):
+        vl.run("Double", fail_on_negative, -5)
+    law = vl.laws["Double"]
+    envelope = next(iter(law.manifold.values()))
+    assert isinstance(envelope, CachedException)
+    assert envelope.exc.__traceback__ is None
+
+def test_ttl_expires_negative_entries():
+    vl = VirtualLayer(cache_exceptions=True, exception_ttl=0.05)
+    func = Counter(fail_on_negative)
+    with pytest.raises(ValueError):
+        vl.run("Double", func, -1)
+    with pytest.raises(ValueError):
+        vl.run("Double", func, -1)
+    assert func.calls == 1
+    time.sleep(0.06)
+    with pytest.raises(ValueError):
+        vl.run("Double", func, -1)
+    assert func.calls == 2
+
+def test_run_many_keeps_successes_of_a_failing_batch():
+    vl = VirtualLayer(cache_exceptions=True)
+    func = Counter(fail_on_negative)
+    with pytest.raises(ValueError):
+        vl.run_many("Double", func, [1, -1, 2])
+    assert func.calls == 3
+    assert vl.run_many("Double", func, [1, 2]) == [2, 4]
+    with pytest.raises(ValueError):
+        vl.run("Double", func, -1)
+    assert func.calls == 3
+
+def test_negative_entries_persist(tmp_path):
+    path = str(tmp_path / "oracle.db")
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle, cache_exceptions=True)
+        with pytest.raises(ValueError):
+            vl.run("Double", fail_on_negative, -3)
+        assert vl.run("Nothing", lambda x: None, 1) is None
+
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle, cache_exceptions=True)
+        def never(x):
+            raise AssertionError("Recomputed after warm start")
+        with pytest.raises(ValueError, match="-3"):
+            vl.run("Double", never, -3)
+        assert vl.run("Nothing", never, 1) is None
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.persistence import SQLiteOracle, decode_payload, encode_payload
+
+def heavy_task(data):
+    return sum(x * x for x in data)
+
+def never_called(data):
+    raise AssertionError("Ground phase re-executed after warm start")
+
+def test_payload_roundtrip_in_band():
+    blob = encode_payload({"small": [1, 2, 3], "none": None})
+    assert blob[:1] == b"\x00"
+    assert decode_payload(blob) == {"small": [1, 2, 3], "none": None}
+
+def test_payload_roundtrip_out_of_band():
+    np = pytest.importorskip("numpy")
+    big = np.arange(100_000, dtype=np.float64)
+    blob = encode_payload({"big": big, "label": "x"}, oob_threshold=1024)
+    assert blob[:1] == b"\x01"
+    restored = decode_payload(blob)
+    assert np.array_equal(restored["big"], big) and restored["label"] == "x"
+    # Zero-copy: the array is a read-only view on the stored blob
+    assert not restored["big"].flags.writeable
+
+def test_warm_start_recalls_without_compute(tmp_path):
+    path = str(tmp_path / "oracle.db")
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        for n in range(1, 50):
+            vl.run("HeavyTask", heavy_task, list(range(n)))
+
+    with SQLiteOracle(path) as oracle:
+        # Nothing is resident until a state is touched
+        law = oracle.get("HeavyTask")
+        assert law is not None and law.manifold == {}
+        vl = VirtualLayer(oracle=oracle)
+        assert vl.run("HeavyTask", never_called, list(range(10))) == heavy_task(range(10))
+        assert len(vl.laws["HeavyTask"].manifold) == 1
+        assert len(oracle) == 49
+
+def test_group_commit_buffers_writes(tmp_path):
+    oracle = SQLiteOracle(str(tmp_path / "oracle.db"), batch_size=100, flush_interval=3600)
+    vl = VirtualLayer(oracle=oracle)
+    for i in range(10):
+        vl.run("Square", lambda x: x * x, i)
+    assert len(oracle._pending) == 10
+    # Pending states are still visible to read-through
+    law = vl.laws["Square"]
+    law.manifold.clear()
+    assert law.execute(vl.hasher.hash_data(3)) == 9
+    oracle.close()
+    assert SQLiteOracle(str(tmp_path / "oracle.db")).get("Square") is not None
+
+def test_warm_start_across_processes(tmp_path):
+    path = str(tmp_path / "oracle.db")
+    script = (
+        "import sys; sys.path.insert(0, %r)\n"
+        "from vld_sdk.induction import VirtualLayer\n"
+        "from vld_sdk.persistence import SQLiteOracle\n"
+        "vl = VirtualLayer(oracle=SQLiteOracle(%r))\n"
+        "print(vl.run('Cube', lambda x: x ** 3, 7))\n"
+    ) % (os.getcwd(), path)
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "343"
+
+    vl = VirtualLayer(oracle=SQLiteOracle(path))
+    assert vl.run("Cube", never_called, 7) == 343
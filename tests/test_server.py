@@ -0,0 +1,122 @@
+import multiprocessing
+import os
+import sys
+import threading
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import numpy as np
+import pytest
+from vld_sdk.induction import Law, SharedOracle, VirtualLayer
+from vld_sdk.server import OracleServer, OracleServerError, RemoteOracle
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+    yield
+    VirtualLayer.ORACLE._laws = {}
+
+@pytest.fixture
+def server():
+    with OracleServer(SharedOracle()) as server:
+        yield server
+
+def never_called(x):
+    raise AssertionError("Remote oracle did not answer")
+
+def square(x):
+    return x * x
+
+def induce_remotely(address, lo, hi):
+    with RemoteOracle(address) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        for i in range(lo, hi):
+            vl.run("Square", square, i)
+
+def test_binding_beyond_loopback_requires_opt_in():
+    for host in ("0.0.0.0", "", "::", "example.com"):
+        with pytest.raises(ValueError, match="allow_remote"):
+            OracleServer(SharedOracle(), host=host)
+    for host in ("127.0.0.1", "localhost", "::1"):
+        OracleServer(SharedOracle(), host=host)
+    OracleServer(SharedOracle(), host="0.0.0.0", allow_remote=True)
+
+def test_hosts_share_laws_over_tcp(server):
+    with RemoteOracle(server.address) as a:
+        vl = VirtualLayer(oracle=a)
+        for i in range(200):
+            vl.run("Square", square, i)
+        vl.run("Array", lambda n: np.arange(n), 5)
+
+    with RemoteOracle(server.address) as b:
+        vl = VirtualLayer(oracle=b)
+        assert all(vl.run("Square", never_called, i) == i * i for i in range(200))
+        assert vl.run("Array", never_called, 5).tolist() == [0, 1, 2, 3, 4]
+        assert b.names() == ["Array", "Square"]
+    assert server.stats()["keys_written"] == 201
+
+def test_unix_socket_and_sibling_process(tmp_path):
+    path = str(tmp_path / "oracle.sock")
+    with OracleServer(SharedOracle(), path=path) as server:
+        assert server.address == path
+        child = multiprocessing.Process(target=induce_remotely, args=(path, 0, 100))
+        child.start()
+        child.join(30)
+        assert child.exitcode == 0
+        with RemoteOracle(path) as oracle:
+            vl = VirtualLayer(oracle=oracle)
+            assert all(vl.run("Square", never_called, i) == i * i for i in range(100))
+
+def test_run_many_batches_misses_into_one_request(server):
+    with RemoteOracle(server.address) as a:
+        VirtualLayer(oracle=a).run_many("Square", square, list(range(500)))
+    with RemoteOracle(server.address) as b:
+        vl = VirtualLayer(oracle=b)
+        vl.run("Square", square, 0)
+        before = b.requests
+        assert vl.run_many("Square", never_called, list(range(500))) == [i * i for i in range(500)]
+        assert b.requests - before == 1
+        assert b.keys_requested == 1 + 499
+
+def test_pipelined_requests_from_many_threads(server):
+    with RemoteOracle(server.address) as writer:
+        VirtualLayer(oracle=writer).run_many("Square", square, list(range(1000)))
+    before = server.stats()["connections"]
+    errors = []
+    with RemoteOracle(server.address, pool_size=2) as shared:
+        law = VirtualLayer(oracle=shared)._get_or_create_law("Square", 0)
+
+        def worker(offset):
+            try:
+                hashes = [VirtualLayer().coords.coordinate(i) for i in range(offset, 1000, 16)]
+                results = shared.load_many(law, [(law.seed ^ h) & 0xFFFFFFFFFFFFFFFF for h in hashes])
+                assert results == [i * i for i in range(offset, 1000, 16)]
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert errors == []
+    assert server.stats()["connections"] - before == 2
+
+def test_writes_are_buffered_readable_and_flushed(server):
+    with RemoteOracle(server.address, batch_size=10_000, flush_interval=3600) as a:
+        vl = VirtualLayer(oracle=a)
+        for i in range(50):
+            vl.run("Square", square, i)
+        law = a.get("Square")
+        law.manifold.clear()  # Force read-through of unflushed states
+        assert vl.run("Square", never_called, 7) == 49
+        assert server.stats()["keys_written"] == 0
+    assert server.stats()["keys_written"] == 50  # close() flushed
+
+def test_rejected_put_surfaces_on_flush(server):
+    with RemoteOracle(server.address) as a:
+        a.store(Law("Unpublished", 1), 5, 25)
+        with pytest.raises(OracleServerError, match="Unknown law"):
+            a.flush()
+        a.flush()  # Reported once
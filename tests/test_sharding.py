@@ -0,0 +1,91 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.sharding import HashRing, ShardedOracle
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+    yield
+    VirtualLayer.ORACLE._laws = {}
+
+@pytest.fixture
+def sharded():
+    with ShardedOracle.spawn(3) as oracle:
+        yield oracle
+
+GOLDEN = 0x9E3779B97F4A7C15
+KEYS = [(i * GOLDEN) & 0xFFFFFFFFFFFFFFFF for i in range(50_000)]
+
+def never_called(x):
+    raise AssertionError("Sharded oracle did not answer")
+
+def square(x):
+    return x * x
+
+def test_ring_balances_and_moves_about_one_nth():
+    ring = HashRing(vnodes=128)
+    for shard in ("a", "b", "c", "d"):
+        ring.add(shard)
+    before = ring.owners(KEYS)
+    counts = {s: before.count(s) for s in ring.shards}
+    assert all(0.75 < c / (len(KEYS) / 4) < 1.25 for c in counts.values())
+
+    ring.add("e")
+    after = ring.owners(KEYS)
+    moved = [(b, a) for b, a in zip(before, after) if b != a]
+    assert 0.14 < len(moved) / len(KEYS) < 0.26  # ~1/5
+    assert all(a == "e" for _, a in moved)  # Only onto the new shard
+
+    ring.remove("e")
+    assert ring.owners(KEYS) == before
+    ring.remove("b")
+    moved = [b for b, a in zip(before, ring.owners(KEYS)) if b != a]
+    assert set(moved) == {"b"}
+    with pytest.raises(LookupError):
+        HashRing().owner(1)
+
+def test_states_are_spread_and_recalled_in_order(sharded):
+    vl = VirtualLayer(oracle=sharded)
+    vl.run_many("Square", square, list(range(3000)))
+    sharded.flush()
+    sizes = sharded.sizes()
+    assert sum(sizes.values()) == 3000
+    assert all(size > 500 for size in sizes.values())
+
+    sharded.get("Square").manifold.clear()  # Resolve everything from the shards
+    inputs = list(range(2999, -1, -3))
+    assert vl.run_many("Square", never_called, inputs) == [i * i for i in inputs]
+    assert all(client.requests > 0 for client in sharded.shards.values())
+
+def test_second_client_shares_shards(sharded):
+    VirtualLayer(oracle=sharded).run_many("Square", square, list(range(500)))
+    sharded.flush()
+    addresses = [client.address for client in sharded.shards.values()]
+    with ShardedOracle(addresses) as other:
+        vl = VirtualLayer(oracle=other)
+        assert all(vl.run("Square", never_called, i) == i * i for i in range(0, 500, 7))
+        assert other.names() == ["Square"]
+
+def test_adding_and_removing_shards_moves_only_their_share(sharded):
+    vl = VirtualLayer(oracle=sharded)
+    vl.run_many("Square", square, list(range(4000)))
+    shard = sharded.add_shard()
+    sizes = sharded.sizes()
+    assert sum(sizes.values()) == 4000
+    assert sharded.moved == sizes[shard]
+    assert 0.15 < sharded.moved / 4000 < 0.35  # ~1/4
+
+    moved = sharded.moved
+    sharded.remove_shard(shard)
+    assert sharded.moved - moved == sizes[shard]
+    assert sum(sharded.sizes().values()) == 4000
+    sharded.get("Square").manifold.clear()
+    assert vl.run_many("Square", never_called, list(range(4000))) == [i * i for i in range(4000)]
+    with pytest.raises(KeyError):
+        sharded.remove_shard(shard)
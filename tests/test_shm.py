@@ -0,0 +1,97 @@
+import multiprocessing
+import os
+import sys
+import uuid
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.shm import SharedMemoryOracle
+
+def never_called(x):
+    raise AssertionError("Sibling induction was not shared")
+
+def square(x):
+    return x * x
+
+def make_bytes(n):
+    return bytes([n % 256]) * 4096
+
+def induce_in_child(name, start, count):
+    oracle = SharedMemoryOracle(name)
+    vl = VirtualLayer(oracle=oracle)
+    for i in range(start, start + count):
+        vl.run("Square", square, i)
+    vl.run("Blob", make_bytes, 7)
+    del vl
+    oracle.close()
+
+@pytest.fixture
+def oracle():
+    oracle = SharedMemoryOracle(f"vld_test_{uuid.uuid4().hex[:12]}", capacity=1 << 12,
+                                arena_bytes=1 << 20)
+    yield oracle
+    oracle.close()
+    oracle.unlink()
+
+def test_sibling_process_recalls_inductions(oracle):
+    child = multiprocessing.Process(target=induce_in_child, args=(oracle.name, 0, 50))
+    child.start(); child.join()
+    assert child.exitcode == 0
+
+    vl = VirtualLayer(oracle=oracle)
+    assert [vl.run("Square", never_called, i) for i in range(50)] == [i * i for i in range(50)]
+    blob = vl.run("Blob", never_called, 7)
+    assert type(blob) is bytes and blob == make_bytes(7)  # Same type as in-process
+
+def test_zero_copy_bytes_are_views(oracle):
+    child = multiprocessing.Process(target=induce_in_child, args=(oracle.name, 0, 1))
+    child.start(); child.join()
+    view = SharedMemoryOracle(oracle.name, zero_copy=True)
+    blob = VirtualLayer(oracle=view).run("Blob", never_called, 7)
+    # Zero-copy: a read-only view on the shared arena
+    assert isinstance(blob, memoryview) and blob.readonly
+    assert blob == make_bytes(7)
+    blob.release()
+    view.close()
+
+def test_concurrent_writers(oracle):
+    children = [multiprocessing.Process(target=induce_in_child, args=(oracle.name, k * 100, 100))
+                for k in range(4)]
+    for c in children: c.start()
+    for c in children: c.join()
+    assert all(c.exitcode == 0 for c in children)
+    # 400 squares + one shared blob (stored once)
+    assert len(oracle) == 401
+    vl = VirtualLayer(oracle=oracle)
+    assert all(vl.run("Square", never_called, i) == i * i for i in range(400))
+
+def test_laws_with_equal_addresses_are_isolated(oracle):
+    vl = VirtualLayer(oracle=oracle)
+    vl.run("A", lambda x: "a", 1)
+    vl.run("B", lambda x: "b", 1)
+    law_a, law_b = vl.laws["A"], vl.laws["B"]
+    law_a.manifold.clear(); law_b.manifold.clear()
+    assert law_a.execute(vl.hasher.hash_data(1)) == "a"
+    assert law_b.execute(vl.hasher.hash_data(1)) == "b"
+
+def test_numpy_results_are_zero_copy(oracle):
+    np = pytest.importorskip("numpy")
+    vl = VirtualLayer(oracle=oracle)
+    vl.run("Grid", lambda n: np.arange(n * n, dtype=np.float32).reshape(n, n), 32)
+    law = vl.laws["Grid"]
+    law.manifold.clear()
+    grid = law.execute(vl.hasher.hash_data(32))
+    assert grid.shape == (32, 32) and grid.dtype == np.float32
+    assert grid[31, 31] == 32 * 32 - 1
+    assert not grid.flags.writeable and not grid.flags.owndata
+    del grid
+
+def test_full_arena_drops_instead_of_failing(oracle):
+    vl = VirtualLayer(oracle=oracle)
+    for i in range(400):
+        vl.run("Big", lambda n: b"x" * 8192, i)
+    assert oracle.dropped > 0
+    assert len(vl.laws["Big"].manifold) == 400
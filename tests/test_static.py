@@ -0,0 +1,149 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import numpy as np
+import pytest
+from vld_sdk.induction import MISS, VirtualLayer
+from vld_sdk.persistence import SQLiteOracle
+from vld_sdk.static import StaticOracle, export_static
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+    yield
+    VirtualLayer.ORACLE._laws = {}
+
+def never_called(x):
+    raise AssertionError("Static oracle did not answer")
+
+def square(x):
+    return x * x
+
+CALLS = []
+
+def tracked_square(x):
+    CALLS.append(x)
+    return x * x
+
+def induce():
+    vl = VirtualLayer()
+    for i in range(500):
+        vl.run("Square", square, i)
+    vl.run("Dict", lambda k: {"key": k, "items": [k, k]}, "a")
+    vl.run("Blob", lambda n: bytes(range(n)), 200)
+    vl.run("Array", lambda n: np.arange(n, dtype=np.float32).reshape(2, -1), 8)
+    vl.run("Half", lambda x: x / 2, 3)
+    vl.run("Big", lambda x: 2 ** 100 + x, 1)  # Too wide to inline: pickled
+    return vl
+
+def test_round_trip_answers_without_executing(tmp_path):
+    induce()
+    path = str(tmp_path / "oracle.vld")
+    stats = export_static(VirtualLayer.ORACLE, path)
+    assert stats["laws"] == 6
+    assert stats["entries"] == 505
+    assert stats["bytes"] == os.path.getsize(path)
+
+    with StaticOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        assert all(vl.run("Square", never_called, i) == i * i for i in range(500))
+        assert vl.run("Dict", never_called, "a") == {"key": "a", "items": ["a", "a"]}
+        assert vl.run("Blob", never_called, 200) == bytes(range(200))
+        array = vl.run("Array", never_called, 8)
+        assert array.dtype == np.float32 and array.shape == (2, 4)
+        assert array.tolist() == [[0, 1, 2, 3], [4, 5, 6, 7]]
+        del array
+        half = vl.run("Half", never_called, 3)
+        assert half == 1.5 and type(half) is float
+        assert vl.run("Big", never_called, 1) == 2 ** 100 + 1
+
+def test_non_members_miss_and_run_locally(tmp_path):
+    induce()
+    path = str(tmp_path / "oracle.vld")
+    export_static(VirtualLayer.ORACLE, path)
+    with StaticOracle(path) as oracle:
+        law = oracle.get("Square")
+        assert law is not None and oracle.get("Unknown") is None
+        missing = [h for h in range(1 << 40, (1 << 40) + 2000) if law.execute(h) is MISS]
+        assert len(missing) == 2000
+
+        vl = VirtualLayer(oracle=oracle)
+        assert vl.run("Square", square, 600) == 360000
+        assert vl.run("Cube", lambda x: x ** 3, 3) == 27  # Runtime-only law
+        assert "Cube" in oracle.names()
+
+def test_loaded_states_are_not_resident(tmp_path):
+    induce()
+    path = str(tmp_path / "oracle.vld")
+    export_static(VirtualLayer.ORACLE, path)
+    with StaticOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        for i in range(100):
+            vl.run("Square", never_called, i)
+        assert len(oracle.get("Square").manifold) == 0
+        assert len(oracle) == 505
+
+def test_selected_and_versioned_laws(tmp_path):
+    vl = VirtualLayer(versioned=True)
+    for i in range(50):
+        vl.run("Square", tracked_square, i)
+        vl.run("Double", lambda x: 2 * x, i)
+    names = [n for n in VirtualLayer.ORACLE.names() if n.startswith("Square@")]
+    path = str(tmp_path / "oracle.vld")
+    stats = export_static(VirtualLayer.ORACLE, path, laws=names)
+    assert stats["laws"] == 1 and stats["entries"] == 50
+
+    del CALLS[:]
+    with StaticOracle(path) as oracle:
+        static = VirtualLayer(oracle=oracle, versioned=True)
+        assert [static.run("Square", tracked_square, i) for i in range(50)] == [i * i for i in range(50)]
+        assert CALLS == []
+        assert oracle.names() == names
+
+    with pytest.raises(KeyError):
+        export_static(VirtualLayer.ORACLE, path, laws=["Missing"])
+
+def test_export_from_sqlite_oracle(tmp_path):
+    db = str(tmp_path / "oracle.db")
+    source = SQLiteOracle(db)
+    vl = VirtualLayer(oracle=source)
+    for i in range(300):
+        vl.run("Square", square, i)
+    source.close()
+
+    reopened = SQLiteOracle(db)  # Laws not yet loaded in this process
+    path = str(tmp_path / "oracle.vld")
+    stats = export_static(reopened, path)
+    reopened.close()
+    assert stats["laws"] == 1 and stats["entries"] == 300
+    with StaticOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle)
+        assert all(vl.run("Square", never_called, i) == i * i for i in range(300))
+
+def test_cached_exceptions_are_not_exported(tmp_path):
+    vl = VirtualLayer(cache_exceptions=True)
+
+    def fail(x):
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        vl.run("Fail", fail, 1)
+    vl.run("Square", square, 3)
+    path = str(tmp_path / "oracle.vld")
+    stats = export_static(VirtualLayer.ORACLE, path)
+    assert stats["laws"] == 2 and stats["entries"] == 1
+
+def test_empty_export_and_bad_magic(tmp_path):
+    path = str(tmp_path / "empty.vld")
+    stats = export_static(VirtualLayer.ORACLE, path)
+    assert stats["entries"] == 0
+    with StaticOracle(path) as oracle:
+        assert len(oracle) == 0 and oracle.names() == []
+
+    bogus = tmp_path / "bogus.vld"
+    bogus.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        StaticOracle(str(bogus))
@@ -0,0 +1,84 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.core import DeterministicHasher, StructuralHasher
+from vld_sdk.induction import VirtualLayer
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def test_digests_are_structural_and_order_independent():
+    h = StructuralHasher()
+    assert h.hash_data({"a": [1, 2], "b": (3,)}) == h.hash_data({"b": (3,), "a": [1, 2]})
+    assert h.hash_data({"a": [1, 2]}) != h.hash_data({"a": [[1, 2]]})
+    assert h.hash_data([(1,), 2]) != h.hash_data([1, (2,)])
+    # Scalars (and therefore law seeds) keep the flat coordinates
+    assert h.hash_data("abc") == DeterministicHasher.hash_data("abc")
+
+def test_immutable_subtrees_are_cached_by_identity(monkeypatch):
+    h = StructuralHasher()
+    shared = tuple(range(1000))
+    first = h.hash_data({"x": 1, "big": shared})
+    nodes = []
+    original = h._node
+    monkeypatch.setattr(h, "_node", lambda obj: nodes.append(obj) or original(obj))
+    second = h.hash_data({"x": 2, "big": shared})
+    assert first != second
+    # The outer dict is rehashed; the shared tuple is recalled
+    assert len(nodes) == 2 and nodes[1] is shared
+
+def test_mutable_subtrees_are_not_cached_unless_frozen():
+    h = StructuralHasher()
+    data = [1, 2, 3]
+    before = h.hash_data({"k": data})
+    data.append(4)
+    assert h.hash_data({"k": data}) != before
+
+    frozen = h.mark_frozen([5, 6])
+    h.hash_data({"k": frozen})
+    assert id(frozen) in h._digests
+    h.unfreeze(frozen)
+    assert id(frozen) not in h._digests
+
+def test_digest_cache_is_bounded_by_bytes_and_frozen_marks_by_count():
+    h = StructuralHasher(max_entries=4, max_bytes=64 << 10)
+    blobs = [bytes([i]) * (16 << 10) for i in range(10)]
+    for blob in blobs:
+        h.hash_data((blob,))
+    assert h._nbytes <= 64 << 10
+    pinned = {id(obj) for obj, _, _ in h._digests.values()}
+    assert len(pinned & {id(b) for b in blobs}) <= 4
+    h.hash_data((b"z" * (128 << 10),))  # Larger than the whole cache: never pinned
+    assert all(len(obj) != 128 << 10 for obj, _, _ in h._digests.values() if type(obj) is bytes)
+
+    marks = [h.mark_frozen([i]) for i in range(10)]
+    assert len(h._frozen) == 4
+    assert [id(m) for m in marks[-4:]] == list(h._frozen)
+
+def test_frozen_numpy_arrays_skip_rehash():
+    np = pytest.importorskip("numpy")
+    h = StructuralHasher()
+    weights = h.mark_frozen(np.arange(1 << 16, dtype=np.float64))
+    a = h.hash_data({"w": weights, "lr": 0.1})
+    assert h._digests[id(weights)][0] is weights
+    assert a != h.hash_data({"w": weights, "lr": 0.2})
+    assert a == h.hash_data({"lr": 0.1, "w": weights})
+
+def test_run_uses_structural_mode_transparently():
+    vl = VirtualLayer(structural_hashing=True)
+    calls = []
+    config = vl.hasher.mark_frozen({"layers": [64, 64], "act": "relu"})
+
+    def build(inputs):
+        calls.append(inputs)
+        return (inputs["config"]["act"], inputs["step"])
+
+    assert vl.run("Build", build, {"config": config, "step": 1}) == ("relu", 1)
+    assert vl.run("Build", build, {"step": 1, "config": config}) == ("relu", 1)
+    assert vl.run("Build", build, {"config": config, "step": 2}) == ("relu", 2)
+    assert len(calls) == 2
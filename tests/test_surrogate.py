@@ -0,0 +1,136 @@
+import math
+import os
+import sys
+import threading
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer, GeodesicFlowSolver
+from vld_sdk.surrogate import Surrogate, cubic_arc, hermite
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+class Counted:
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.func(x)
+
+def test_hermite_reuses_the_cubic_arc():
+    assert GeodesicFlowSolver().solve_path(2.0, 5.0, 5) == [2.0 + 3.0 * cubic_arc(t / 4) for t in range(5)]
+    # Zero slopes: the Hermite segment is exactly the geodesic arc
+    assert hermite(0.0, 2.0, 0.0, 1.0, 5.0, 0.0, 0.25) == 2.0 + 3.0 * cubic_arc(0.25)
+    # Cubics are reproduced by exact slopes
+    f, df = (lambda x: x ** 3 - x), (lambda x: 3 * x ** 2 - 1)
+    assert math.isclose(hermite(1.0, f(1.0), df(1.0), 2.0, f(2.0), df(2.0), 1.3), f(1.3))
+
+def test_in_range_queries_answered_within_tolerance():
+    vl = VirtualLayer()
+    surrogate = vl.set_surrogate("Sin", tolerance=1e-3)
+    sin = Counted(math.sin)
+    for i in range(41):
+        vl.run("Sin", sin, i * 0.05)
+    assert sin.calls == 41
+
+    queries = [0.1 + 0.0137 * k for k in range(1, 101)]
+    for x in queries:
+        assert abs(vl.run("Sin", sin, x) - math.sin(x)) <= 1e-3
+    assert sin.calls == 41
+    stats = vl.get_stats()["surrogate"]["Sin"]
+    # Every exact miss is a query, including the 41 recording runs
+    assert stats["answered"] == 100 and stats["queries"] == 141
+    assert 0 < stats["max_error_bound"] <= 1e-3
+
+    # Out of range: executed (and recorded, extending the range)
+    assert vl.run("Sin", sin, 2.5) == math.sin(2.5)
+    assert sin.calls == 42 and surrogate.points == 42
+
+def test_loose_fits_fall_back_to_execution():
+    vl = VirtualLayer()
+    vl.set_surrogate("Wiggle", tolerance=1e-6)
+    wiggle = Counted(lambda x: math.sin(20 * x))
+    for i in range(11):
+        vl.run("Wiggle", wiggle, i * 0.1)
+    assert vl.run("Wiggle", wiggle, 0.55) == math.sin(20 * 0.55)
+    assert wiggle.calls == 12
+    assert vl.get_stats()["surrogate"]["Wiggle"]["answered"] == 0
+
+def test_validation_audits_answers():
+    vl = VirtualLayer()
+    surrogate = vl.set_surrogate("Exp", tolerance=1e-3, validate_every=5)
+    exp = Counted(math.exp)
+    for i in range(21):
+        vl.run("Exp", exp, i * 0.05)
+    for k in range(1, 20):
+        vl.run("Exp", exp, 0.05 + 0.0437 * k)
+    stats = surrogate.stats()
+    # 19 answerable queries: every 5th is executed and checked
+    assert stats["answered"] == 16 and stats["validations"] == 3
+    assert exp.calls == 24 and stats["bound_violations"] == 0
+    assert stats["observed_max_error"] <= 1e-3
+
+def test_two_arguments_interpolate_across_rows():
+    vl = VirtualLayer()
+    vl.set_surrogate("Field", tolerance=1e-2, arguments=lambda p: (p[0], p[1]))
+    field = Counted(lambda p: math.sin(p[0]) * math.cos(p[1]))
+    for j in range(11):
+        for i in range(21):
+            vl.run("Field", field, (i * 0.1, j * 0.1))
+    calls = field.calls
+    x, y = 1.03, 0.47
+    assert abs(vl.run("Field", field, (x, y)) - math.sin(x) * math.cos(y)) <= 1e-2
+    assert field.calls == calls
+    assert vl.run("Field", field, (1.03, 1.5)) == math.sin(1.03) * math.cos(1.5)  # Past the last row
+    assert field.calls == calls + 1
+
+def test_non_numeric_inputs_and_results_are_ignored():
+    surrogate = Surrogate(tolerance=1.0)
+    assert surrogate.point("abc") is None
+    assert surrogate.point((1.0, 2.0, 3.0)) is None
+    assert surrogate.point(True) is None
+    assert surrogate.point(float("nan")) is None
+    surrogate.add((1.0,), "text")
+    assert surrogate.points == 0
+    with pytest.raises(ValueError):
+        Surrogate(tolerance=-1.0)
+
+def test_answers_are_consistent_while_points_are_added():
+    surrogate = Surrogate(tolerance=1e-3)
+    for i in range(0, 401, 8):
+        surrogate.add((i * 0.005,), math.sin(i * 0.005))
+    errors, done = [], threading.Event()
+
+    def read():
+        try:
+            while not done.is_set():
+                for k in range(1, 200):
+                    x = k * 0.01
+                    found = surrogate.answer((x,))
+                    if found is not None and abs(found - math.sin(x)) > 1e-3:
+                        errors.append((x, found))
+        except Exception as exc:  # IndexError from lists caught mid-insert
+            errors.append(exc)
+
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    readers = [threading.Thread(target=read, daemon=True) for _ in range(3)]
+    try:
+        for thread in readers:
+            thread.start()
+        for i in range(401):
+            if i % 8:
+                surrogate.add((i * 0.005,), math.sin(i * 0.005))
+    finally:
+        done.set()
+        for thread in readers:
+            thread.join(10)
+        sys.setswitchinterval(switch)
+    assert errors == []
+    assert surrogate.points == 401
@@ -0,0 +1,150 @@
+import multiprocessing
+import os
+import sys
+import threading
+from multiprocessing.connection import Client, Listener, Pipe
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import Law, SharedOracle, VirtualLayer
+from vld_sdk.sync import Replica
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+    yield
+    VirtualLayer.ORACLE._laws = {}
+
+def square(x):
+    return x * x
+
+def spread(i):
+    return (i * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF  # Input hashes cover the address space
+
+def replica_oracle(name, keys, value=square, seed=1234):
+    oracle = SharedOracle()
+    law = oracle.publish(Law(name, seed))
+    for i in keys:
+        law.record(spread(i), value(i))
+    return oracle
+
+def session(left, right, **kwargs):
+    """Runs right.serve() on a thread and left.sync() against it."""
+    a, b = Pipe()
+    served = {}
+    worker = threading.Thread(target=lambda: served.update(right.serve(b)))
+    worker.start()
+    stats = left.sync(a, **kwargs)
+    worker.join(10)
+    return stats, served
+
+def states(oracle, name):
+    return dict(oracle.get(name).manifold)
+
+def serve_in_child(conn, lo, hi):
+    vl = VirtualLayer()
+    for i in range(lo, hi):
+        vl.run("Square", square, i)
+    vl.run("ChildOnly", square, 3)
+    Replica().serve(conn)
+    conn.send(sorted(VirtualLayer.ORACLE.names()))
+    conn.send(len(VirtualLayer.ORACLE.get("Square").manifold))
+
+def serve_on_socket(path, lo, hi, ready):
+    vl = VirtualLayer()
+    for i in range(lo, hi):
+        vl.run("Square", square, i)
+    with Listener(path, family="AF_UNIX") as listener:
+        ready.set()
+        with listener.accept() as conn:
+            Replica().serve(conn)
+            conn.send(len(VirtualLayer.ORACLE.get("Square").manifold))
+
+def test_two_processes_converge_over_a_pipe():
+    parent, child = multiprocessing.Pipe()
+    proc = multiprocessing.Process(target=serve_in_child, args=(child, 0, 2000))
+    proc.start()
+    vl = VirtualLayer()
+    for i in range(100, 2100):
+        vl.run("Square", square, i)
+
+    stats = Replica().sync(parent)
+    assert parent.recv() == ["ChildOnly", "Square"]
+    assert parent.recv() == 2100
+    proc.join(10)
+    assert stats["states_received"] == 101 and stats["states_sent"] == 100
+    assert stats["peer"]["states_received"] == 100
+    assert len(VirtualLayer.ORACLE.get("Square").manifold) == 2100
+    assert vl.run("ChildOnly", None, 3) == 9
+    assert all(vl.run("Square", None, i) == i * i for i in range(2100))
+
+def test_two_processes_converge_over_a_unix_socket(tmp_path):
+    path = str(tmp_path / "sync.sock")
+    ready = multiprocessing.Event()
+    proc = multiprocessing.Process(target=serve_on_socket, args=(path, 0, 500, ready))
+    proc.start()
+    assert ready.wait(10)
+    vl = VirtualLayer()
+    for i in range(250, 750):
+        vl.run("Square", square, i)
+    with Client(path, family="AF_UNIX") as conn:
+        stats = Replica().sync(conn)
+        assert conn.recv() == 750
+    proc.join(10)
+    assert stats["states_received"] == 250 and stats["states_sent"] == 250
+    assert len(VirtualLayer.ORACLE.get("Square").manifold) == 750
+
+def test_identical_replicas_exchange_only_roots():
+    left = replica_oracle("F", range(5000))
+    right = replica_oracle("F", range(5000))
+    stats, served = session(Replica(left), Replica(right))
+    assert stats["rounds"] == 2  # hello, done
+    assert stats["states_sent"] == stats["states_received"] == 0
+    assert served["states_sent"] == 0
+
+def test_small_difference_transfers_only_missing_states():
+    left = replica_oracle("F", range(10000))
+    right = replica_oracle("F", [h for h in range(10000) if h % 100] + [10**6])
+    stats, served = session(Replica(left), Replica(right))
+    assert stats["states_sent"] == 100 and stats["states_received"] == 1
+    assert states(left, "F") == states(right, "F")
+    assert len(states(left, "F")) == 10001
+    full = sum(8 + len(repr(i * i)) for i in range(10000))  # Lower bound for a full copy
+    assert stats["bytes_sent"] + stats["bytes_received"] < full / 2
+
+def test_one_sided_and_selected_laws():
+    left = replica_oracle("F", range(100))
+    left.publish(Law("G", 99)).record(spread(1), "g")
+    right = replica_oracle("H", range(10))
+    stats, _ = session(Replica(left), Replica(right), laws=["F", "H"])
+    assert stats["laws"] == 2
+    assert len(states(right, "F")) == 100 and len(states(left, "H")) == 10
+    assert right.get("G") is None
+
+def test_seed_mismatch_is_skipped_and_conflicts_counted():
+    left = replica_oracle("F", range(50))
+    right = replica_oracle("F", range(50), seed=4321)
+    stats, _ = session(Replica(left), Replica(right))
+    assert stats["laws_skipped"] == 1 and stats["states_received"] == 0
+
+    left = replica_oracle("F", range(50))
+    right = replica_oracle("F", range(50), value=lambda h: -h if h == 7 else h * h)
+    stats, _ = session(Replica(left), Replica(right))
+    assert stats["conflicts"] == 1
+    assert stats["states_sent"] == stats["states_received"] == 0
+
+def test_cached_exceptions_are_not_replicated():
+    vl = VirtualLayer(cache_exceptions=True)
+
+    def fail(x):
+        raise ValueError(x)
+
+    with pytest.raises(ValueError):
+        vl.run("Fail", fail, 1)
+    vl.run("Fail", square, 2)
+    right = SharedOracle()
+    stats, _ = session(Replica(), Replica(right))
+    assert stats["states_sent"] == 1
+    assert list(states(right, "Fail").values()) == [4]
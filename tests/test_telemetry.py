@@ -0,0 +1,108 @@
+import asyncio
+import os
+import sys
+import urllib.request
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.telemetry import Telemetry, serve_metrics
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def square(x):
+    return x * x
+
+def test_counts_hits_misses_and_compute():
+    vl = VirtualLayer(telemetry=True)
+    for x in [1, 2, 1, 1, 3]:
+        vl.run("Square", square, x)
+    stats = vl.get_stats()["laws"]["Square"]
+    assert stats["hits"] == 2 and stats["misses"] == 3
+    assert stats["hit_ratio"] == pytest.approx(0.4)
+    assert stats["compute_latency_seconds"]["count"] == 3
+    assert stats["bytes_stored"] > 0
+    assert stats["saved_seconds"] == pytest.approx(2 * stats["compute_seconds"] / 3)
+
+def test_switchable_at_runtime():
+    vl = VirtualLayer()
+    vl.run("Square", square, 1)
+    assert "laws" not in vl.get_stats()
+    vl.telemetry.enable()
+    vl.run("Square", square, 1)
+    vl.telemetry.disable()
+    vl.run("Square", square, 1)
+    assert vl.telemetry.snapshot()["Square"]["hits"] == 1
+
+def test_latency_is_sampled():
+    vl = VirtualLayer(telemetry=True)
+    vl.telemetry.sample_every = 4
+    for x in range(16):
+        vl.run("Square", square, x % 2)
+    snap = vl.telemetry.snapshot()["Square"]
+    assert (snap["hits"], snap["misses"]) == (14, 2)
+    # The first call binds the law's metrics; then one timed recall per 4 counted down
+    assert snap["hash_seconds"]["count"] == 3
+    assert snap["lookup_seconds"]["count"] == 3
+
+def test_metrics_bound_to_shared_laws_follow_their_layer():
+    a, b = VirtualLayer(telemetry=True), VirtualLayer(telemetry=True)
+    for vl in (a, b, a, a, b):
+        vl.run("Square", square, 3)  # One law, shared through the oracle
+    assert (a.telemetry.snapshot()["Square"]["hits"], b.telemetry.snapshot()["Square"]["hits"]) == (2, 2)
+    a.telemetry.reset()
+    a.run("Square", square, 3)
+    assert a.telemetry.snapshot()["Square"]["hits"] == 1
+
+def test_batched_async_and_decorated_paths_are_counted():
+    vl = VirtualLayer(telemetry=True)
+    vl.run_many("Square", square, [1, 2, 2, 3])
+    vl.run_many("Square", square, [1, 2])
+
+    @vl.induce("Add")
+    def add(a, b):
+        return a + b
+    add(1, 2); add(1, 2)
+
+    async def main():
+        await vl.arun("Async", square, 4)
+        await vl.arun("Async", square, 4)
+    asyncio.run(main())
+
+    snap = vl.telemetry.snapshot()
+    assert (snap["Square"]["hits"], snap["Square"]["misses"]) == (3, 3)
+    assert (snap["Add"]["hits"], snap["Add"]["misses"]) == (1, 1)
+    assert (snap["Async"]["hits"], snap["Async"]["misses"]) == (1, 1)
+    assert snap["Async"]["compute_latency_seconds"]["count"] == 1
+
+def test_prometheus_exposition():
+    telemetry = Telemetry(enabled=True)
+    metrics = telemetry.law('we"ird')
+    metrics.hits = 5
+    metrics.observe_compute(0.002, 128)
+    text = telemetry.to_prometheus()
+    assert "# TYPE vld_law_hits_total counter" in text
+    assert 'vld_law_hits_total{law="we\\"ird"} 5' in text
+    assert 'vld_law_compute_latency_seconds_bucket{law="we\\"ird",le="0.005"} 1' in text
+    assert 'vld_law_compute_latency_seconds_bucket{law="we\\"ird",le="0.001"} 0' in text
+    assert 'vld_law_compute_latency_seconds_bucket{law="we\\"ird",le="+Inf"} 1' in text
+    assert 'vld_law_stored_bytes_total{law="we\\"ird"} 128' in text
+    assert text.endswith("\n")
+
+def test_metrics_endpoint():
+    vl = VirtualLayer(telemetry=True)
+    vl.run("Square", square, 3)
+    server = serve_metrics(vl.telemetry, port=0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as resp:
+            body = resp.read().decode()
+            assert resp.headers["Content-Type"].startswith("text/plain")
+        assert 'vld_law_misses_total{law="Square"} 1' in body
+    finally:
+        server.shutdown()
+        server.server_close()
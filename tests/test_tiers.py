@@ -0,0 +1,77 @@
+import gc
+import json
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.tiers import CompressedResult, ResultTier, SpilledArray, SpilledBlob
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def report(n):
+    return json.dumps([{"id": i, "status": "ok", "tags": ["a", "b"]} for i in range(n)])
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma", "bz2"])
+def test_large_results_are_compressed(codec):
+    tier = ResultTier(threshold=4096, codec=codec)
+    vl = VirtualLayer(result_tier=tier)
+    text = vl.run("Report", report, 2000)
+    stored = next(iter(vl.laws["Report"].manifold.values()))
+    assert isinstance(stored, CompressedResult) and stored.nbytes < len(text) // 4
+    assert vl.run("Report", lambda n: pytest.fail("recomputed"), 2000) == text
+    assert vl.get_stats()["tier"]["compressed"] == 1
+
+def test_small_and_incompressible_results_stay_resident():
+    vl = VirtualLayer(result_tier=ResultTier(threshold=4096))
+    vl.run("Small", report, 2)
+    noise = vl.run("Noise", lambda n: os.urandom(n), 1 << 16)
+    assert isinstance(next(iter(vl.laws["Small"].manifold.values())), str)
+    assert next(iter(vl.laws["Noise"].manifold.values())) is noise
+
+def test_budgets_charge_the_resident_footprint():
+    vl = VirtualLayer(max_bytes=64 * 1024, result_tier=ResultTier(threshold=4096))
+    for n in (3000, 3001, 3002):
+        vl.run("Report", report, n)
+    # ~150 KB of JSON each, but only the compressed blobs are resident
+    assert len(vl.laws["Report"].manifold) == 3
+    assert vl.budget.nbytes < 64 * 1024
+
+def test_numpy_results_spill_to_read_only_memmaps(tmp_path):
+    np = pytest.importorskip("numpy")
+    tier = ResultTier(threshold=4096, spill_dir=str(tmp_path))
+    vl = VirtualLayer(result_tier=tier)
+    grid = vl.run("Grid", lambda n: np.arange(n * n, dtype=np.float32).reshape(n, n), 256)
+    stored = next(iter(vl.laws["Grid"].manifold.values()))
+    assert isinstance(stored, SpilledArray) and os.path.exists(stored.path)
+
+    recalled = vl.run("Grid", lambda n: pytest.fail("recomputed"), 256)
+    assert isinstance(recalled, np.memmap) and not recalled.flags.writeable
+    assert np.array_equal(recalled, grid)
+    # Recall reuses one mapping: no decode, no copy
+    assert vl.run("Grid", None, 256) is recalled
+
+def test_spilled_files_are_removed_on_eviction(tmp_path):
+    np = pytest.importorskip("numpy")
+    vl = VirtualLayer(max_entries=1, result_tier=ResultTier(threshold=4096, spill_dir=str(tmp_path)))
+    vl.run("Zeros", lambda n: np.zeros(n), 10_000)
+    vl.run("Zeros", lambda n: np.zeros(n), 20_000)
+    gc.collect()
+    assert len(os.listdir(tmp_path)) == 1
+
+def test_other_results_spill_as_blobs(tmp_path):
+    tier = ResultTier(threshold=4096, spill_dir=str(tmp_path), spill_threshold=1024)
+    vl = VirtualLayer(result_tier=tier)
+    rows = vl.run("Rows", lambda n: [{"i": i, "name": f"row-{i}"} for i in range(n)], 5000)
+    stored = next(iter(vl.laws["Rows"].manifold.values()))
+    assert isinstance(stored, SpilledBlob) and stored.codec == "zlib"
+    assert vl.run("Rows", None, 5000) == rows
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        ResultTier(codec="snappy")
@@ -0,0 +1,114 @@
+import math
+import os
+import random
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.lsh import ToleranceIndex
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def norm(v):
+    return math.sqrt(sum(x * x for x in v))
+
+def test_nearby_inputs_recall_within_epsilon():
+    vl = VirtualLayer()
+    index = vl.set_tolerance("Norm", epsilon=1e-9)
+    calls = []
+
+    def tracked(v):
+        calls.append(v)
+        return norm(v)
+
+    reading = [0.1 * i for i in range(32)]
+    assert vl.run("Norm", tracked, reading) == norm(reading)
+    jittered = [x + 1e-15 for x in reading]
+    assert vl.run("Norm", tracked, jittered) == norm(reading)  # Recalled, not recomputed
+    assert len(calls) == 1
+    far = [x + 1e-3 for x in reading]
+    assert vl.run("Norm", tracked, far) == norm(far)
+    assert len(calls) == 2
+
+    stats = vl.get_stats()["tolerance"]["Norm"]
+    assert stats["lookups"] == 3 and stats["approximate_hits"] == 1
+    assert stats["hit_rate"] == 1 / 3 and 0 < stats["max_error"] <= 1e-9
+    assert index.entries == 2
+
+def test_every_neighbour_within_epsilon_is_found():
+    # Multi-probing flips every bit whose hyperplane lies within epsilon
+    index = ToleranceIndex(epsilon=0.05, bits=12, max_probes=1 << 12)
+    rng = random.Random(3)
+    points = [tuple(rng.uniform(-1, 1) for _ in range(8)) for _ in range(300)]
+    for h, p in enumerate(points):
+        index.add(p, h)
+    for h, p in enumerate(points):
+        direction = [rng.gauss(0, 1) for _ in p]
+        scale = 0.049 / norm(direction)
+        query = tuple(x + d * scale for x, d in zip(p, direction))
+        found = index.nearest(query)
+        assert found is not None and found[2] <= 0.05
+        assert math.dist(points[found[1]], query) == found[2]
+    assert index.truncated == 0
+
+def test_nearest_candidate_wins():
+    vl = VirtualLayer()
+    vl.set_tolerance("Label", epsilon=0.5)
+    vl.run("Label", lambda v: "a", [-1.0, 0.0])
+    vl.run("Label", lambda v: "b", [1.0, 0.0])
+    assert vl.run("Label", None, [0.9, 0.05]) == "b"
+    assert vl.run("Label", None, [-0.8, -0.1]) == "a"
+
+def test_non_numeric_inputs_use_exact_recall():
+    vl = VirtualLayer()
+    vl.set_tolerance("Upper", epsilon=1.0)
+    assert vl.run("Upper", str.upper, "abc") == "ABC"
+    assert vl.run("Upper", str.upper, "abd") == "ABD"
+    assert vl.get_stats()["tolerance"]["Upper"]["lookups"] == 0
+    # Digit strings are text, not vectors ("12" is not (1.0, 2.0))
+    assert vl.run("Upper", lambda s: s + "!", "12") == "12!"
+    assert vl.run("Upper", lambda s: s + "?", "13") == "13?"
+    assert vl.run("Upper", len, ["1", "2"]) == 2
+    assert vl.get_stats()["tolerance"]["Upper"]["lookups"] == 0
+
+def test_evicted_states_are_dropped_from_the_index():
+    vl = VirtualLayer(law_max_entries=1)
+    index = vl.set_tolerance("Sum", epsilon=0.1)
+    vl.run("Sum", sum, [1.0, 2.0])
+    vl.run("Sum", sum, [5.0, 5.0])  # Evicts [1.0, 2.0]
+    assert vl.run("Sum", sum, [1.0, 2.05]) == 3.05
+    assert index.stats()["approximate_hits"] == 0
+    assert index.entries == 1  # Only the resident state stays indexed
+
+def test_index_stays_bounded_by_the_budget():
+    vl = VirtualLayer(law_max_entries=50)
+    index = vl.set_tolerance("Sum", epsilon=1e-6)
+    for i in range(1000):
+        vl.run("Sum", sum, [float(i), 0.5])
+    assert index.entries == len(vl.laws["Sum"].manifold) == 50
+    assert sum(map(len, index.buckets.values())) == 50
+
+def test_induce_with_vectorize_and_numpy_inputs():
+    np = pytest.importorskip("numpy")
+    vl = VirtualLayer()
+    vl.set_tolerance("Energy", epsilon=1e-6, vectorize=lambda call: call[0][0])
+
+    @vl.induce("Energy")
+    def energy(signal, gain=1.0):
+        return float(gain * (signal ** 2).sum())
+
+    signal = np.linspace(0.0, 1.0, 64)
+    first = energy(signal)
+    assert energy(signal + 1e-12) == first
+    assert vl.get_stats()["tolerance"]["Energy"]["approximate_hits"] == 1
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        ToleranceIndex(epsilon=-1.0)
+    with pytest.raises(ValueError):
+        ToleranceIndex(epsilon=1.0, bits=0)
@@ -0,0 +1,109 @@
+import os
+import sys
+
+# Ensure root is in path
+sys.path.append(os.getcwd())
+
+import pytest
+from vld_sdk.core import CodeFingerprint
+from vld_sdk.induction import VirtualLayer
+from vld_sdk.persistence import SQLiteOracle
+
+@pytest.fixture(autouse=True)
+def reset_oracle():
+    VirtualLayer.ORACLE._laws = {}
+
+def deploy(source: str, name: str = "price"):
+    """Compiles `source` as if freshly imported by a new release."""
+    namespace = {}
+    exec(compile(source, f"<release:{name}>", "exec"), namespace)
+    return namespace[name]
+
+V1 = "def price(x):\n    return x * 2\n"
+V1_MOVED = "\n\n# moved further down the file\ndef price(x):\n    return x * 2\n"
+V2 = "def price(x):\n    return x * 3\n"
+
+def test_fingerprint_tracks_code_not_location():
+    assert CodeFingerprint.of(deploy(V1)) == CodeFingerprint.of(deploy(V1_MOVED))
+    assert CodeFingerprint.of(deploy(V1)) != CodeFingerprint.of(deploy(V2))
+
+def test_fingerprint_includes_defaults_and_closures():
+    def scaler(k):
+        return lambda x, bias=0: x * k + bias
+    assert CodeFingerprint.of(scaler(2)) == CodeFingerprint.of(scaler(2))
+    assert CodeFingerprint.of(scaler(2)) != CodeFingerprint.of(scaler(3))
+
+    def with_default(x, bias=1):
+        return x + bias
+    def with_other_default(x, bias=2):
+        return x + bias
+    assert CodeFingerprint.of(with_default) != CodeFingerprint.of(with_other_default)
+
+HELPER_V1 = "def rate():\n    return 2\n\ndef price(x):\n    return x * rate()\n"
+HELPER_V2 = "def rate():\n    return 3\n\ndef price(x):\n    return x * rate()\n"
+
+def test_fingerprint_follows_module_level_helpers():
+    assert CodeFingerprint.of(deploy(HELPER_V1)) == CodeFingerprint.of(deploy(HELPER_V1))
+    assert CodeFingerprint.of(deploy(HELPER_V1)) != CodeFingerprint.of(deploy(HELPER_V2))
+    recursive = deploy("def price(x):\n    return x if x < 2 else price(x - 1)\n")
+    assert CodeFingerprint.of(recursive) == CodeFingerprint.of(recursive)
+
+def test_recreated_lambdas_reuse_their_fingerprint(monkeypatch):
+    vl = VirtualLayer(versioned=True)
+    calls = []
+    original = CodeFingerprint.of
+    monkeypatch.setattr(CodeFingerprint, "of", lambda func: calls.append(func) or original(func))
+    for x in range(5):
+        assert vl.run("Double", lambda v: v * 2, x) == x * 2
+    assert len(calls) == 1
+
+    def scaled(k):
+        return lambda v: v * k
+    assert vl.version_of(scaled(2)) == vl.version_of(scaled(2))
+    assert vl.version_of(scaled(2)) != vl.version_of(scaled(3))
+
+def test_unchanged_code_stays_warm_across_deploys(tmp_path):
+    path = str(tmp_path / "laws.db")
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle, versioned=True)
+        assert vl.run("Price", deploy(V1), 10) == 20
+
+    # Next release: same code, new function object, new process state
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle, versioned=True)
+        assert vl.run("Price", deploy(V1_MOVED), 10) == 20
+        # Recalled from storage, not re-induced
+        assert vl.laws["Price"].evolution_depth == 0
+
+def test_changed_code_gets_a_fresh_manifold(tmp_path):
+    path = str(tmp_path / "laws.db")
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle, versioned=True)
+        assert vl.run("Price", deploy(V1), 10) == 20
+
+    with SQLiteOracle(path) as oracle:
+        vl = VirtualLayer(oracle=oracle, versioned=True)
+        assert vl.run("Price", deploy(V2), 10) == 30
+        # Both releases stay addressable side by side
+        assert vl.run("Price", deploy(V1), 10) == 20
+
+def test_unversioned_layers_keep_name_keyed_laws():
+    vl = VirtualLayer()
+    assert vl.run("Price", deploy(V1), 10) == 20
+    assert vl.run("Price", deploy(V2), 10) == 20  # stale by design
+    assert vl.laws["Price"].name == "Price" and vl.laws["Price"].version is None
+
+def test_budgets_follow_the_algorithm_across_versions():
+    vl = VirtualLayer(versioned=True, law_max_entries=2)
+    budget = vl.set_budget("Price", max_entries=2)
+    vl.run("Price", deploy(V1), 1)
+    vl.run("Price", deploy(V2), 1)
+    vl.run("Price", deploy(V2), 2)
+    assert budget.entries == 2 and budget.evictions == 1
+
+def test_induce_is_versioned():
+    vl = VirtualLayer(versioned=True)
+    first = vl.induce("Price")(deploy(V1))
+    second = vl.induce("Price")(deploy(V2))
+    assert first(5) == 10 and second(5) == 15 and first(5) == 10
+    assert vl.laws["Price"].name.startswith("Price@")
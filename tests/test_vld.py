@@ -1,10 +1,48 @@
-from vld_sdk.core import DeterministicHasher, FeistelMemoizer, RNSEngine, NTTEngine
+from vld_sdk.core import DeterministicHasher, FeistelMemoizer, RNSEngine, NTTEngine, CoordinateCache
 
 def test_hasher():
     h = DeterministicHasher()
     assert h.hash_data("test") == h.hash_data("test")
     assert h.hash_data([1.0, 2.0]) != h.hash_data([1.0, 2.1])
 
+def test_coordinate_cache_matches_hasher():
+    h = DeterministicHasher()
+    cache = CoordinateCache(h)
+    for x in [10, "abc", b"abc", 2.5, True, -0.0, float("nan"), [1.0, 2.0]]:
+        assert cache.coordinate(x) == h.hash_data(x)
+        assert cache.coordinate(x) == h.hash_data(x)
+    # Equal-but-distinct types never alias
+    assert cache.coordinate(1) != cache.coordinate(True)
+    assert cache.coordinate(0.0) != cache.coordinate(-0.0)
+
+def test_coordinate_cache_skips_sha_on_recall():
+    calls = []
+
+    class CountingHasher(DeterministicHasher):
+        def hash_data(self, data):
+            calls.append(data)
+            return super().hash_data(data)
+
+    cache = CoordinateCache(CountingHasher(), max_entries=4)
+    for _ in range(3):
+        cache.coordinate("hot")
+    assert calls == ["hot"]
+    for i in range(10):
+        cache.coordinate(i)
+    assert len(cache._tiers[int]) <= 4
+
+def test_coordinate_cache_does_not_pin_large_inputs():
+    h = DeterministicHasher()
+    cache = CoordinateCache(h)
+    big = "x" * (1 << 20)
+    assert cache.coordinate(big) == h.hash_data(big)
+    assert cache.coordinate(b"y" * 4096) == h.hash_data(b"y" * 4096)
+    assert cache.coordinate(1 << 4000) == h.hash_data(1 << 4000)
+    assert cache.coordinate_args((1, big)) == h.hash_data((1, big))
+    assert not any(cache._tiers.values()) and not cache._args
+    cache.coordinate("small")
+    assert "small" in cache._tiers[str]
+
 def test_feistel():
     f = FeistelMemoizer()
     c = 0x1234567890ABCDEF1234567890ABCDEF1234567890ABCDEF1234567890ABCDEF
@@ -33,6 +71,9 @@ if __name__ == "__main__":
     try:
         test_hasher()
         print("Hasher: OK")
+        test_coordinate_cache_matches_hasher()
+        test_coordinate_cache_skips_sha_on_recall()
+        print("Coordinate Cache: OK")
         test_feistel()
         print("Feistel: OK")
         test_rns()
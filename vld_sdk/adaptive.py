@@ -0,0 +1,144 @@
+"""
+VLD-ADAPTIVE: Adaptive Bypass
+Brief: Switches laws whose induction is a net loss into pass-through mode,
+and probes them periodically to re-enable induction if the workload changes.
+
+Notation:
+    [Benefit]  B = hit_ratio * E[compute]
+    [Overhead] O = E[hash + lookup] + miss_ratio * E[record]
+    [Decision] bypass <=> B < O  (re-evaluated every window; probes back off)
+"""
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+NORMAL = 0   # Induce and recall as usual
+MEASURE = 1  # As NORMAL, but time hashing and lookup for the cost model
+BYPASS = 2   # Call the function directly: no hash, lookup or record
+
+class LawGovernor:
+    """Cost model and mode for one algorithm (approximate, lock-free counters)."""
+    def __init__(self, owner: 'AdaptiveBypass'):
+        self.owner = owner
+        self.bypassing = False
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.bypassed_calls = 0
+        self.probe_after = owner.probe_after
+        # Exponentially decayed sums (halved every window)
+        self.overhead_sum = 0.0
+        self.overhead_n = 0.0
+        self.compute_sum = 0.0
+        self.record_sum = 0.0
+        self.compute_n = 0.0
+        self.decided_bypass = False
+        self.switches = 0
+        self.probes = 0
+        self.decisions = deque(maxlen=owner.history)
+        self._lock = threading.Lock()
+
+    def gate(self) -> int:
+        if self.bypassing:
+            self.skipped += 1
+            if self.skipped < self.probe_after:
+                self.bypassed_calls += 1
+                return BYPASS
+            # Probe: run one window normally and re-decide
+            self.bypassing = False
+        self.calls += 1
+        return MEASURE if self.calls % self.owner.sample_every == 0 else NORMAL
+
+    def count(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if self.hits + self.misses >= self.owner.window:
+            self.decide()
+
+    def observe_overhead(self, seconds: float):
+        self.overhead_sum += seconds
+        self.overhead_n += 1
+
+    def observe_compute(self, compute: float, record: float):
+        self.compute_sum += compute
+        self.record_sum += record
+        self.compute_n += 1
+
+    def decide(self):
+        with self._lock:
+            calls = self.hits + self.misses
+            if calls < self.owner.window:
+                return  # Another thread already closed this window
+            if not self.overhead_n or not self.compute_n:
+                self._roll()
+                return  # Not enough evidence yet: stay active
+            hit_ratio = self.hits / calls
+            benefit = hit_ratio * self.compute_sum / self.compute_n
+            overhead = (self.overhead_sum / self.overhead_n +
+                        (self.misses / calls) * self.record_sum / self.compute_n)
+            bypass = benefit < overhead
+            if bypass and self.decided_bypass:
+                # A failed probe doubles the wait before the next one
+                self.probes += 1
+                self.probe_after = min(self.probe_after * 2, self.owner.max_probe_after)
+            elif not bypass:
+                self.probe_after = self.owner.probe_after
+            if bypass != self.decided_bypass:
+                self.switches += 1
+                self.decisions.append({
+                    "time": time.time(), "mode": "bypass" if bypass else "active",
+                    "hit_ratio": hit_ratio, "benefit": benefit, "overhead": overhead})
+            self.decided_bypass = self.bypassing = bypass
+            self.skipped = 0
+            self._roll()
+
+    def _roll(self):
+        self.hits = self.misses = 0
+        self.overhead_sum *= 0.5
+        self.overhead_n *= 0.5
+        self.compute_sum *= 0.5
+        self.record_sum *= 0.5
+        self.compute_n *= 0.5
+
+    def snapshot(self) -> dict:
+        return {
+            "mode": "bypass" if self.bypassing else "probe" if self.decided_bypass else "active",
+            "bypassed_calls": self.bypassed_calls,
+            "switches": self.switches,
+            "failed_probes": self.probes,
+            "probe_after": self.probe_after,
+            "overhead_seconds": self.overhead_sum / self.overhead_n if self.overhead_n else None,
+            "compute_seconds": self.compute_sum / self.compute_n if self.compute_n else None,
+            "decisions": list(self.decisions),
+        }
+
+class AdaptiveBypass:
+    """
+    Per-law governors for one VirtualLayer.
+    `window` calls per decision, one in `sample_every` timed for the
+    hashing/lookup cost; a bypassed law probes again after `probe_after`
+    calls, doubling (up to `max_probe_after`) while probes keep failing.
+    """
+    def __init__(self, window: int = 1024, sample_every: int = 16,
+                 probe_after: int = 4096, max_probe_after: int = 1 << 18, history: int = 16):
+        self.window = window
+        self.sample_every = sample_every
+        self.probe_after = probe_after
+        self.max_probe_after = max_probe_after
+        self.history = history
+        self.laws: Dict[str, LawGovernor] = {}
+        self._lock = threading.Lock()
+
+    def law(self, name: str) -> LawGovernor:
+        governor = self.laws.get(name)
+        if governor is None:
+            with self._lock:
+                governor = self.laws.setdefault(name, LawGovernor(self))
+        return governor
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {name: g.snapshot() for name, g in list(self.laws.items())}
@@ -0,0 +1,305 @@
+"""
+VLD-COMPACT: Compact Numeric Manifold
+Brief: An open-addressed Law store for scalar or fixed-width numeric results,
+holding uint64 addresses and typed values in parallel NumPy arrays.
+
+Notation:
+    [Slot]   slot(addr) = (addr * phi64) >> (64 - b),  linear probing, 2^b slots
+    [Entry]  keys[slot] = addr, values[slot] = r   (~ (8 + 1 + itemsize * w) / load bytes)
+    [Batch]  get_many(A) -> (values, found), one vectorized probe round per step
+"""
+import threading
+from typing import Any, Iterator, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional for the SDK core
+    np = None
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN = 0x9E3779B97F4A7C15  # Fibonacci hashing multiplier (2^64 / phi)
+_EMPTY, _FULL, _DELETED = 0, 1, 2
+_ABSENT = object()
+
+class CompactManifold:
+    """
+    Drop-in replacement for a Law's `manifold` dict, for laws whose results
+    are Python scalars of one kind (float, int or bool, per `dtype`) or
+    tuples of `width` of them. Values are stored at `dtype` precision and
+    recalled as plain Python scalars/tuples.
+    Results that do not fit (other types, out-of-range ints, cached
+    exceptions, tier handles) go to a small side dict, so any law can use it.
+    Lookups are lock-free; mutations serialize on an internal leaf lock
+    (budget evictions pop without holding the law lock).
+    """
+    def __init__(self, dtype: Any = "float64", width: Optional[int] = None,
+                 capacity: int = 1024, max_load: float = 0.75):
+        if np is None:
+            raise ImportError("CompactManifold requires numpy")
+        self.dtype = np.dtype(dtype)
+        kind = self.dtype.kind
+        if kind not in "fiub":
+            raise ValueError(f"Unsupported dtype: {self.dtype} (expected float, int or bool)")
+        if width is not None and width < 1:
+            raise ValueError("width must be >= 1")
+        if not 0.1 <= max_load <= 0.95:
+            raise ValueError("max_load must be in [0.1, 0.95]")
+        self.width = width
+        self.max_load = max_load
+        self._scalar = {"f": float, "i": int, "u": int, "b": bool}[kind]
+        if kind in "iu":
+            info = np.iinfo(self.dtype)
+            self._range = (int(info.min), int(info.max))
+        else:
+            self._range = None
+        self._overflow = {}
+        self._used = 0  # FULL + DELETED slots (probe chain length bound)
+        self._len = 0
+        self._lock = threading.Lock()
+        bits = max(3, (max(8, int(capacity / max_load)) - 1).bit_length())
+        self._table = self._allocate(bits)
+
+    def _allocate(self, bits: int) -> tuple:
+        size = 1 << bits
+        shape = (size,) if self.width is None else (size, self.width)
+        return (np.zeros(size, dtype=np.uint64), np.zeros(size, dtype=np.uint8),
+                np.zeros(shape, dtype=self.dtype), bits)
+
+    def fits(self, value: Any) -> bool:
+        """True if `value` is stored in the typed arrays (else the side dict)."""
+        scalar = self._scalar
+        if self.width is None:
+            items = (value,)
+        elif type(value) is tuple and len(value) == self.width:
+            items = value
+        else:
+            return False
+        for item in items:
+            if type(item) is not scalar:
+                return False
+            if self._range is not None and not self._range[0] <= item <= self._range[1]:
+                return False
+        return True
+
+    def _decode(self, values, i: int) -> Any:
+        if self.width is None:
+            return values.item(i)
+        return tuple(values[i].tolist())
+
+    def _find(self, table: tuple, key: int) -> int:
+        """Slot index holding `key`, or -1."""
+        keys, state, _, bits = table
+        mask = (1 << bits) - 1
+        i = ((key * _GOLDEN) & _MASK64) >> (64 - bits)
+        while True:
+            s = state.item(i)
+            if s == _EMPTY:
+                return -1
+            if s == _FULL and keys.item(i) == key:
+                return i
+            i = (i + 1) & mask
+
+    # --- Mapping interface (what Law, budgets and oracles use) ---
+
+    def get(self, key: int, default: Any = None) -> Any:
+        if self._overflow:
+            value = self._overflow.get(key, _ABSENT)
+            if value is not _ABSENT:
+                return value
+        table = self._table
+        i = self._find(table, key)
+        return default if i < 0 else self._decode(table[2], i)
+
+    def __getitem__(self, key: int) -> Any:
+        value = self.get(key, _ABSENT)
+        if value is _ABSENT:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._overflow or self._find(self._table, key) >= 0
+
+    def __setitem__(self, key: int, value: Any):
+        with self._lock:
+            if not self.fits(value):
+                if self._remove(key):
+                    self._len -= 1
+                if key not in self._overflow:
+                    self._len += 1
+                self._overflow[key] = value
+                return
+            if self._overflow.pop(key, _ABSENT) is not _ABSENT:
+                self._len -= 1
+            if (self._used + 1) > self.max_load * len(self._table[0]):
+                self._resize()
+            keys, state, values, bits = self._table
+            mask = (1 << bits) - 1
+            i = ((key * _GOLDEN) & _MASK64) >> (64 - bits)
+            tomb = -1
+            while True:
+                s = state.item(i)
+                if s == _EMPTY:
+                    break
+                if s == _FULL and keys.item(i) == key:
+                    values[i] = value  # Overwrite in place
+                    return
+                if s == _DELETED and tomb < 0:
+                    tomb = i
+                i = (i + 1) & mask
+            if tomb >= 0:
+                i = tomb
+            else:
+                self._used += 1
+            # Publish value and key before the state flag (lock-free readers)
+            values[i] = value
+            keys[i] = key
+            state[i] = _FULL
+            self._len += 1
+
+    def __delitem__(self, key: int):
+        if self.pop(key, _ABSENT) is _ABSENT:
+            raise KeyError(key)
+
+    def pop(self, key: int, default: Any = None) -> Any:
+        with self._lock:
+            value = self._overflow.pop(key, _ABSENT)
+            if value is not _ABSENT:
+                self._len -= 1
+                return value
+            table = self._table
+            i = self._find(table, key)
+            if i < 0:
+                return default
+            value = self._decode(table[2], i)
+            table[1][i] = _DELETED
+            self._len -= 1
+            return value
+
+    def _remove(self, key: int) -> bool:
+        table = self._table
+        i = self._find(table, key)
+        if i < 0:
+            return False
+        table[1][i] = _DELETED
+        return True
+
+    def _resize(self):
+        """Rehashes live entries (dropping tombstones), doubling if needed."""
+        keys, state, values, bits = self._table
+        live = state == _FULL
+        count = int(live.sum())
+        while (count + 1) > self.max_load * 0.5 * (1 << bits):
+            bits += 1
+        table = self._allocate(bits)
+        self._insert_distinct(table, keys[live], values[live])
+        self._used = count
+        self._table = table  # Single reference swap: readers see old or new
+
+    @staticmethod
+    def _slots(keys, bits: int):
+        return (keys * np.uint64(_GOLDEN)) >> np.uint64(64 - bits)
+
+    def _insert_distinct(self, table: tuple, new_keys, new_values):
+        """Vectorized insert of distinct keys into an empty-tombstone table."""
+        keys, state, values, bits = table
+        mask = np.uint64((1 << bits) - 1)
+        pending = np.arange(len(new_keys))
+        slots = self._slots(new_keys, bits)
+        while len(pending):
+            # Per probe round, the first claimant of each empty slot takes it
+            free = state[slots] == _EMPTY
+            idx, first = np.unique(slots[free], return_index=True)
+            winners = pending[free][first]
+            keys[idx] = new_keys[winners]
+            values[idx] = new_values[winners]
+            state[idx] = _FULL
+            placed = np.zeros(len(pending), dtype=bool)
+            placed[np.flatnonzero(free)[first]] = True
+            pending = pending[~placed]
+            slots = (slots[~placed] + np.uint64(1)) & mask
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        return (k for k, _ in self.items())
+
+    def keys(self) -> Iterator[int]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        return (v for _, v in self.items())
+
+    def items(self) -> Iterator[Tuple[int, Any]]:
+        keys, state, values, _ = self._table
+        overflow = list(self._overflow.items())
+        for i in np.flatnonzero(state == _FULL).tolist():
+            yield keys.item(i), self._decode(values, i)
+        yield from overflow
+
+    def clear(self):
+        with self._lock:
+            self._overflow = {}
+            self._table = self._allocate(self._table[3])
+            self._used = self._len = 0
+
+    def update(self, other: Any = (), **kwargs):
+        pairs = other.items() if hasattr(other, "items") else other
+        for key, value in pairs:
+            self[key] = value
+
+    # --- Vectorized lookups ---
+
+    def _probe_many(self, addrs) -> Tuple[tuple, Any]:
+        """Slot index per address (-1 if absent), one probe step per round."""
+        table = self._table
+        keys, state, _, bits = table
+        addrs = np.asarray(addrs, dtype=np.uint64)
+        mask = (1 << bits) - 1
+        where = np.full(len(addrs), -1, dtype=np.intp)
+        pending = np.arange(len(addrs))
+        wanted = addrs
+        slots = self._slots(addrs, bits).astype(np.intp)
+        while len(pending):
+            s = state.take(slots)
+            hit = (keys.take(slots) == wanted) & (s == _FULL)
+            where[pending[hit]] = slots[hit]
+            go = ~hit & (s != _EMPTY)
+            pending = pending[go]
+            wanted = wanted[go]
+            slots = (slots[go] + 1) & mask
+        return table, where
+
+    def contains_many(self, addrs) -> Any:
+        """Boolean array: which addresses hold a state (typed or side dict)."""
+        _, where = self._probe_many(addrs)
+        found = where >= 0
+        if self._overflow:
+            side = self._overflow
+            for i, addr in enumerate(np.asarray(addrs, dtype=np.uint64).tolist()):
+                if addr in side:
+                    found[i] = True
+        return found
+
+    def get_many(self, addrs, default: Any = 0) -> Tuple[Any, Any]:
+        """
+        (values, found): a `dtype` array of typed states (`default` where not
+        found) and a boolean mask. Side-dict states are reported as not found;
+        resolve those with get().
+        """
+        table, where = self._probe_many(addrs)
+        found = where >= 0
+        shape = (len(where),) if self.width is None else (len(where), self.width)
+        out = np.full(shape, default, dtype=self.dtype)
+        out[found] = table[2].take(where[found], axis=0)
+        return out, found
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the typed arrays (the side dict is not counted)."""
+        keys, state, values, _ = self._table
+        return keys.nbytes + state.nbytes + values.nbytes
+
+    def __repr__(self) -> str:
+        return (f"CompactManifold(dtype={self.dtype}, width={self.width}, "
+                f"len={self._len}, slots={len(self._table[0])})")
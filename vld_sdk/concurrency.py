@@ -0,0 +1,53 @@
+"""
+VLD-CONCURRENCY: Single-Flight Grounding
+Brief: Collapses concurrent misses on the same coordinate into one ground
+phase; late arrivals wait for the leader's result instead of recomputing.
+
+Notation:
+    [Flight] Calls(k) = {t_0 (leader), t_1..t_n (waiters)} -> Exec(f, x) once
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    In-flight call registry. Each Law owns one, so the lock is striped per
+    law and unrelated laws never contend.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable, *args) -> Any:
+        """Runs fn(*args) once per key among concurrent callers."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -7,10 +7,16 @@ Notation:
     [VRns]  x = {r1, r2, ..., rn} mod {m1, m2, ..., mn}
     [Ground] G(c) = Feistel(H(data)) -> 64-bit seed
 """
+import sys
+import types
 import hashlib
 import struct
 import math
-from typing import List, Tuple, Union
+import functools
+from typing import Any, List, Tuple, Union
+
+_FLOAT_ONLY = frozenset((float,))
+_FLOAT_LIST = b'\x00VLD:d1'  # Tag of packed float lists (distinct from CanonicalEncoder.MAGIC)
 
 class DeterministicHasher:
     """
@@ -21,19 +27,478 @@ class DeterministicHasher:
         """
         [H-Field]: Maps S -> H(256)
         Equation: h = SHA256(serialize(data))
+        Everything is canonically serialized (type-tagged, so 1, 1.0, True,
+        "1" and b"1" never alias), except float lists: packed doubles under
+        their own tag.
         """
-        if isinstance(data, str):
-            encoded = data.encode()
-        elif isinstance(data, list):
-            # Upgrade: Encode float list as 64-bit double binary ('d')
-            encoded = struct.pack(f'{len(data)}d', *data)
-        elif isinstance(data, bytes):
-            encoded = data
+        t = type(data)
+        if t is str or t is bytes or t is int:
+            # CanonicalEncoder's stream for one scalar, without building an encoder
+            body = (data.encode('utf-8', 'surrogatepass') if t is str else
+                    data if t is bytes else str(data).encode())
+            h = hashlib.sha256(_SCALAR_PREFIX[t] + struct.pack('<Q', len(body)))
+            h.update(body)
+            return int.from_bytes(h.digest(), 'big')
+        if t is float:
+            return int.from_bytes(hashlib.sha256(_SCALAR_PREFIX[t] + struct.pack('<d', data)).digest(), 'big')
+        if isinstance(data, list) and _FLOAT_ONLY.issuperset(map(type, data)):
+            # Upgrade: Encode float list as 64-bit double binary ('d'). Only exact
+            # floats: ints and bools would alias them (1 / 1.0 / True, ints > 2**53)
+            encoded = _FLOAT_LIST + struct.pack(f'{len(data)}d', *data)
+            return int.from_bytes(hashlib.sha256(encoded).digest(), 'big')
+        return DeterministicHasher.hash_canonical(data)
+
+    @staticmethod
+    def hash_canonical(data: Any) -> int:
+        """Equation: h = SHA256(MAGIC || tagged_stream(data))"""
+        encoder = CanonicalEncoder()
+        encoder.write(data)
+        return int.from_bytes(encoder.digest(), 'big')
+
+# Scalars whose repr() is exact and type-distinguishing (1 / 1.0 / True / '1' / b'1')
+_REPR_EXACT = frozenset((int, float, str, bool, bytes, type(None)))
+_REPR_SEQ = (list, tuple)
+
+class CanonicalEncoder:
+    """
+    Type-tagged canonical serializer streaming into an incremental SHA-256.
+    - Scalars are tagged and length-prefixed into a small staging buffer.
+    - Buffers (bytes-likes, array.array, NumPy arrays) are fed to the hash
+      straight from a memoryview with their format/dtype, shape and strides.
+    - Dicts and sets are order-independent (sorted keys, else sorted digests).
+    """
+    MAGIC = b'\x00VLD:c1'
+    FLUSH = 1 << 12  # Buffers at least this large bypass the staging buffer
+    FLAT_SEQ = _REPR_SEQ  # Sequence types batched into a dict's repr
+
+    def __init__(self, h=None):
+        self.h = h if h is not None else hashlib.sha256()
+        self.buf = bytearray(self.MAGIC)
+
+    def digest(self) -> bytes:
+        self._flush()
+        return self.h.digest()
+
+    def _flush(self):
+        if self.buf:
+            self.h.update(self.buf)
+            self.buf.clear()
+
+    def _raw(self, view):
+        n = view.nbytes if type(view) is memoryview else len(view)
+        if n >= self.FLUSH:
+            self._flush()
+            self.h.update(view)
         else:
-            # Fallback for ints, dicts, etc.
-            encoded = str(data).encode()
-        
-        return int(hashlib.sha256(encoded).hexdigest(), 16)
+            self.buf += view
+
+    def _len(self, tag: bytes, n: int):
+        self.buf += tag
+        self.buf += struct.pack('<Q', n)
+
+    def write(self, data: Any):
+        writer = _WRITERS.get(type(data))
+        if writer is not None:
+            writer(self, data)
+        elif type(data).__module__ == 'numpy' and hasattr(data, 'dtype'):
+            self._write_array(data)
+        else:
+            try:
+                view = memoryview(data)
+            except TypeError:
+                # Opaque objects keep the legacy str() identity, tagged by type
+                t = type(data)
+                self._len(b'o', 0)
+                self.write(f"{t.__module__}.{t.__qualname__}")
+                self.write(str(data))
+                return
+            self._write_buffer(view)
+
+    def _write_str(self, data: str):
+        encoded = data.encode('utf-8', 'surrogatepass')
+        self._len(b's', len(encoded))
+        self._raw(encoded)
+
+    def _write_int(self, data: int):
+        encoded = str(data).encode()
+        self._len(b'i', len(encoded))
+        self.buf += encoded
+
+    def _write_float(self, data: float):
+        self.buf += b'f'
+        self.buf += struct.pack('<d', data)
+
+    def _write_bool(self, data: bool):
+        self.buf += b'T' if data else b'F'
+
+    def _write_none(self, data: None):
+        self.buf += b'N'
+
+    def _write_bytes(self, data: bytes):
+        self._len(b'b', len(data))
+        self._raw(data)
+
+    def _write_sequence(self, data):
+        self._len(b'l' if type(data) is list else b't', len(data))
+        if _REPR_EXACT.issuperset(map(type, data)):
+            self._repr(data)
+        else:
+            for item in data:
+                self.write(item)
+
+    def _write_dict(self, data: dict):
+        self._len(b'd', len(data))
+        keys = self._ordered(data)
+        values = [data[k] for k in keys]
+        if not _REPR_EXACT.issuperset(map(type, keys)):
+            for k, v in zip(keys, values):
+                self.write(k)
+                self.write(v)
+        elif _REPR_EXACT.issuperset(map(type, values)):
+            self._repr((keys, values))
+        else:
+            # Scalar (and flat list/tuple) fields in one batch, nested fields
+            # recursed; the mask keeps the encoding injective.
+            flat = [type(v) in _REPR_EXACT or
+                    (type(v) in self.FLAT_SEQ and _REPR_EXACT.issuperset(map(type, v)))
+                    for v in values]
+            if all(flat):
+                self._repr((keys, values))
+                return
+            self._repr((keys, flat, [v if f else None for v, f in zip(values, flat)]))
+            for v, f in zip(values, flat):
+                if not f:
+                    self.write(v)
+
+    def _write_set(self, data):
+        self._len(b'S', len(data))
+        items = self._ordered(data)
+        if _REPR_EXACT.issuperset(map(type, items)):
+            self._repr(items)
+        else:
+            for item in items:
+                self.write(item)
+
+    def _repr(self, flat):
+        # Fast path: repr() of exact scalars is injective and runs in C
+        encoded = repr(flat).encode('utf-8', 'surrogatepass')
+        self._len(b'r', len(encoded))
+        self._raw(encoded)
+
+    def _ordered(self, items) -> list:
+        try:
+            return sorted(items)
+        except TypeError:
+            # Mixed, unorderable keys: order by each key's canonical digest
+            def digest(x):
+                sub = CanonicalEncoder()
+                sub.write(x)
+                return sub.digest()
+            return sorted(items, key=digest)
+
+    def _write_buffer(self, view: memoryview):
+        fmt = view.format.encode()
+        self._len(b'B', len(fmt))
+        self.buf += fmt
+        self.buf += struct.pack(f'<QB{2 * view.ndim}q', view.itemsize, view.ndim,
+                                *view.shape, *view.strides)
+        if view.c_contiguous:
+            self._raw(view.cast('B') if view.ndim != 1 or view.format != 'B' else view)
+        else:
+            self._raw(view.tobytes())  # Strided buffers need one gather copy
+
+    def _write_array(self, arr):
+        if arr.ndim == 0 or arr.dtype.hasobject:
+            self._len(b'a', arr.ndim)
+            self.write(arr.dtype.str)
+            self.write(arr.tolist())
+            return
+        dtype = arr.dtype.str.encode()
+        self._len(b'A', len(dtype))
+        self.buf += dtype
+        self.buf += struct.pack(f'<B{2 * arr.ndim}q', arr.ndim, *arr.shape, *arr.strides)
+        if arr.flags.c_contiguous:
+            # Zero-copy: reinterpret the array's own memory as bytes
+            self._raw(memoryview(arr.reshape(-1).view('u1')))
+        else:
+            self._raw(memoryview(arr.tobytes()))
+
+_WRITERS = {
+    str: CanonicalEncoder._write_str,
+    int: CanonicalEncoder._write_int,
+    float: CanonicalEncoder._write_float,
+    bool: CanonicalEncoder._write_bool,
+    type(None): CanonicalEncoder._write_none,
+    bytes: CanonicalEncoder._write_bytes,
+    list: CanonicalEncoder._write_sequence,
+    tuple: CanonicalEncoder._write_sequence,
+    dict: CanonicalEncoder._write_dict,
+    set: CanonicalEncoder._write_set,
+    frozenset: CanonicalEncoder._write_set,
+}
+# Stream heads of one-scalar encodings (see DeterministicHasher.hash_data)
+_SCALAR_PREFIX = {t: CanonicalEncoder.MAGIC + tag for t, tag in
+                  ((str, b's'), (bytes, b'b'), (int, b'i'), (float, b'f'))}
+
+class CoordinateCache:
+    """
+    Tiered keys: an in-process front for DeterministicHasher.
+    Hashable immutable scalars index a dict per exact type (so 1, 1.0 and
+    True never alias), letting recall skip SHA-256 entirely; the stable
+    256-bit coordinate is computed once per distinct input.
+    The tier holds its keys strongly, so only scalars up to `MAX_KEY_BYTES`
+    (str/bytes length, int width) are admitted; larger ones are hashed
+    on every call rather than pinned beyond any manifold budget.
+    """
+    """
+    Equation: C(x) = Tier[type(x)][x] | H(x) on first sight
+    """
+    FAST_TYPES = (int, str, bytes, float, bool)
+    MAX_KEY_BYTES = 256
+
+    def __init__(self, hasher: DeterministicHasher, max_entries: int = 1 << 16):
+        self.hasher = hasher
+        self.max_entries = max_entries
+        self._tiers = {t: {} for t in self.FAST_TYPES} if max_entries > 0 else {}
+        self._args = {} if max_entries > 0 else None
+        self._fast = frozenset(self.FAST_TYPES)
+
+    def coordinate(self, data: Any) -> int:
+        tier = self._tiers.get(type(data))
+        if tier is None:
+            return self.hasher.hash_data(data)
+        coord = tier.get(data)
+        if coord is None:
+            coord = self.hasher.hash_data(data)
+            # -0.0 == 0.0 (and NaN != NaN) would alias or never hit: bypass the tier
+            if type(data) is float and (data != data or data == 0.0):
+                return coord
+            if not self._small(data):
+                return coord
+            if len(tier) >= self.max_entries:
+                tier.clear()  # O(1) amortized bound; entries are recomputable
+            tier[data] = coord
+        return coord
+
+    def coordinate_args(self, key: tuple) -> int:
+        """
+        Argument tuples of fast scalars share one tier, keyed with their types
+        (as lru_cache(typed=True)); other tuples are hashed canonically.
+        """
+        if self._args is None:
+            return self.hasher.hash_data(key)
+        types = tuple(map(type, key))
+        typed = (key, types)
+        try:
+            coord = self._args.get(typed)
+        except TypeError:  # Unhashable elements
+            return self.hasher.hash_data(key)
+        if coord is None:
+            # Only admitted keys can hit (types are part of the key), so the
+            # checks run on the miss path: -0.0 == 0.0 would alias (NaN only ever misses)
+            coord = self.hasher.hash_data(key)
+            if (not self._fast.issuperset(types) or (float in types and 0.0 in key) or
+                    not all(map(self._small, key))):
+                return coord
+            if len(self._args) >= self.max_entries:
+                self._args.clear()
+            self._args[typed] = coord
+        return coord
+
+    def _small(self, data: Any) -> bool:
+        t = type(data)
+        if t is str or t is bytes:
+            return len(data) <= self.MAX_KEY_BYTES
+        return t is not int or data.bit_length() <= 8 * self.MAX_KEY_BYTES
+
+class _MerkleEncoder(CanonicalEncoder):
+    """Node encoder: scalars inline, sub-trees replaced by their digests."""
+    MAGIC = b'\x00VLD:m1'
+    FLAT_SEQ = ()  # Nested sequences are sub-trees, never inlined
+
+    def __init__(self, tree: 'StructuralHasher'):
+        super().__init__()
+        self.tree = tree
+        self.stable = True
+        self.nbytes = 0  # Bytes hashed for this node: what a cached digest pins
+
+    def _flush(self):
+        self.nbytes += len(self.buf)
+        CanonicalEncoder._flush(self)
+
+    def _raw(self, view):
+        n = view.nbytes if type(view) is memoryview else len(view)
+        if n >= self.FLUSH:
+            self.nbytes += n
+        CanonicalEncoder._raw(self, view)
+
+    def write(self, data: Any):
+        t = type(data)
+        if t in _REPR_EXACT and not (t in (str, bytes) and len(data) >= self.FLUSH):
+            return CanonicalEncoder.write(self, data)
+        digest, stable = self.tree._node(data)
+        self.stable = self.stable and stable
+        self.buf += b'h'
+        self.buf += digest
+
+class StructuralHasher(DeterministicHasher):
+    """
+    Merkle-style hashing for large nested inputs (opt-in, see VirtualLayer).
+    Each container is hashed over its scalars and its children's digests;
+    digests of immutable sub-trees (tuples/frozensets of immutables, large
+    str/bytes) and of objects passed to `mark_frozen` are cached by identity,
+    so an input that differs in one leaf costs O(changed path).
+    Scalars keep the flat coordinates; containers hash differently than
+    under DeterministicHasher, so do not mix modes on one persistent oracle.
+    Cached digests pin their objects: the cache is bounded by `max_entries`
+    and by `max_bytes` of hashed content, and at most `max_entries` objects
+    stay marked frozen (oldest marks are dropped first).
+    """
+    """
+    Equation: h(node) = SHA256(MAGIC || scalars || h(child_1) .. h(child_k))
+    """
+    IMMUTABLE = frozenset((tuple, frozenset, str, bytes))
+    NODE_TYPES = frozenset((dict, list, tuple, set, frozenset))
+
+    def __init__(self, max_entries: int = 1 << 16, max_bytes: int = 64 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._digests = {}  # id -> (obj, digest, nbytes): the strong ref pins the id
+        self._nbytes = 0    # Hashed content pinned by _digests
+        self._frozen = {}   # id -> obj, in marking order
+
+    def mark_frozen(self, obj: Any) -> Any:
+        """Promises `obj` will not be mutated; its digest is then cached."""
+        self._frozen.pop(id(obj), None)
+        while len(self._frozen) >= self.max_entries:
+            self.unfreeze(next(iter(self._frozen.values())))
+        self._frozen[id(obj)] = obj
+        return obj
+
+    def unfreeze(self, obj: Any):
+        self._frozen.pop(id(obj), None)
+        hit = self._digests.pop(id(obj), None)
+        if hit is not None:
+            self._nbytes -= hit[2]
+
+    def hash_data(self, data: Any) -> int:
+        if type(data) in self.NODE_TYPES or id(data) in self._frozen:
+            return int.from_bytes(self._node(data)[0], 'big')
+        return DeterministicHasher.hash_data(data)
+
+    def _node(self, obj: Any) -> Tuple[bytes, bool]:
+        key = id(obj)
+        hit = self._digests.get(key)
+        if hit is not None and hit[0] is obj:
+            return hit[1], True
+        encoder = _MerkleEncoder(self)
+        CanonicalEncoder.write(encoder, obj)
+        digest = encoder.digest()
+        frozen = self._frozen.get(key) is obj
+        stable = frozen or (encoder.stable and type(obj) in self.IMMUTABLE)
+        if stable and encoder.nbytes <= self.max_bytes:
+            if (len(self._digests) >= self.max_entries or
+                    self._nbytes + encoder.nbytes > self.max_bytes):
+                self._digests.clear()  # Recomputable, like the coordinate tiers
+                self._nbytes = 0
+            self._digests[key] = (obj, digest, encoder.nbytes)
+            self._nbytes += encoder.nbytes
+        return digest, stable
+
+class CodeFingerprint:
+    """
+    Identifies a function by what it computes rather than its name: bytecode,
+    constants, referenced names, defaults and closure values (recursing into
+    nested code and closed-over functions). Line numbers and file paths are
+    excluded, so moving code keeps its fingerprint. Referenced globals that
+    are plain Python functions (helpers) are followed like closures; other
+    globals are named only. Opaque closure values hash by type and str().
+    """
+    """
+    Equation: V(f) = SHA256(tag || code(f) || defaults(f) || closure(f))
+    """
+    MAGIC = b'\x00VLD:f1'
+
+    @classmethod
+    def of(cls, func: Any) -> int:
+        encoder = CanonicalEncoder()
+        encoder.buf += cls.MAGIC + sys.implementation.cache_tag.encode()
+        cls._write_callable(encoder, func, set())
+        return int.from_bytes(encoder.digest(), 'big')
+
+    @classmethod
+    def _write_callable(cls, encoder: CanonicalEncoder, func: Any, seen: set):
+        if id(func) in seen:
+            encoder.write(('recursive', getattr(func, '__qualname__', '')))
+            return
+        seen.add(id(func))
+        if isinstance(func, functools.partial):
+            encoder.write('partial')
+            cls._write_callable(encoder, func.func, seen)
+            cls._write_value(encoder, (func.args, func.keywords), seen)
+        elif isinstance(func, types.MethodType):
+            cls._write_callable(encoder, func.__func__, seen)
+        elif isinstance(func, types.FunctionType):
+            cls._write_code(encoder, func.__code__)
+            cls._write_value(encoder, (func.__defaults__, func.__kwdefaults__), seen)
+            namespace = func.__globals__
+            helpers = [name for name in cls._global_names(func.__code__)
+                       if type(namespace.get(name)) is types.FunctionType]
+            encoder.write(len(helpers))
+            for name in helpers:
+                encoder.write(name)
+                cls._write_callable(encoder, namespace[name], seen)
+            cells = []
+            for cell in func.__closure__ or ():
+                try:
+                    cells.append(cell.cell_contents)
+                except ValueError:  # Empty cell (not yet assigned)
+                    cells.append(None)
+            encoder.write(len(cells))
+            for value in cells:
+                cls._write_value(encoder, value, seen)
+        elif not isinstance(func, type) and isinstance(getattr(type(func), '__call__', None),
+                                                       types.FunctionType):
+            # Callable instance: its class's __call__ plus its state
+            cls._write_callable(encoder, type(func).__call__, seen)
+            cls._write_value(encoder, getattr(func, '__dict__', None), seen)
+        else:
+            # Builtins and classes: identified by name only
+            encoder.write((getattr(func, '__module__', None), getattr(func, '__qualname__', repr(func))))
+
+    @classmethod
+    def _global_names(cls, code: types.CodeType) -> List[str]:
+        """Names a code object (and its nested code) may load as globals, in order."""
+        names = dict.fromkeys(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names.update(dict.fromkeys(cls._global_names(const)))
+        return list(names)
+
+    @classmethod
+    def _write_code(cls, encoder: CanonicalEncoder, code: types.CodeType):
+        encoder.write((code.co_code, code.co_names, code.co_varnames, code.co_freevars,
+                       code.co_cellvars, code.co_argcount, code.co_posonlyargcount,
+                       code.co_kwonlyargcount, code.co_flags))
+        encoder.write(len(code.co_consts))
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                cls._write_code(encoder, const)
+            else:
+                encoder.write(const)
+
+    @classmethod
+    def _write_value(cls, encoder: CanonicalEncoder, value: Any, seen: set):
+        if isinstance(value, (types.FunctionType, types.MethodType, functools.partial)):
+            cls._write_callable(encoder, value, seen)
+        elif isinstance(value, types.ModuleType):
+            encoder.write(('module', value.__name__))
+        elif isinstance(value, (list, tuple)) and any(callable(v) for v in value):
+            encoder.write(len(value))
+            for item in value:
+                cls._write_value(encoder, item, seen)
+        else:
+            encoder.write(value)
 
 class FeistelMemoizer:
     """
@@ -0,0 +1,178 @@
+"""
+VLD-FILTERS: Read-Through Membership Filter
+Brief: A scalable Bloom filter over a law's recorded addresses, consulted
+before a read-through so that true misses against a disk-backed or remote
+oracle skip the round trip.
+
+Notation:
+    [Probe] g_i(a) = (h1 + i * h2) mod m,  h1 = mix(a), h2 = mix(a ^ C) | 1,  i < k
+    [Size]  m = ceil(-n ln p / ln^2 2),  k = round(m / n * ln 2)   (capacity n, error rate p)
+    [Grow]  a full layer is frozen; the next has capacity 2n and error p/2 (total <= 2p)
+    [FPR]   P(a in F | a never added) = 1 - prod_j (1 - fill_j^k_j)
+    [Probe] g_i(a) = (h1 mod m + i (h2 mod m)) mod m   (the same bits, in uint64 without overflow)
+"""
+import itertools
+import math
+import threading
+import time
+from typing import Iterable, List, Optional, Sequence
+
+from .shm import _mix
+
+try:
+    import numpy as np
+except ImportError:  # Pure-Python probes
+    np = None
+
+_SECOND = 0xD6E8FEB86659FD93
+_CHUNK = 1 << 14       # Addresses per update when filling from a stream
+_VECTOR_MIN = 256      # Batches at least this large set their bits with numpy
+
+class _Layer:
+    __slots__ = ('bits', 'm', 'k', 'capacity', 'count')
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.m = max(64, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / capacity * math.log(2)))
+        self.bits = bytearray((self.m + 7) // 8)
+        self.capacity = capacity
+        self.count = 0
+
+def _set(layer: _Layer, addrs: Sequence[int]):
+    bits, m, k = layer.bits, layer.m, layer.k
+    for addr in addrs:
+        h1, h2 = _mix(addr), _mix(addr ^ _SECOND) | 1
+        for i in range(k):
+            j = (h1 + i * h2) % m
+            bits[j >> 3] |= 1 << (j & 7)
+
+def _mix_vector(x):
+    """_mix over a uint64 array (multiplication wraps mod 2^64, as the mask does)."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def _set_vector(layer: _Layer, addrs: Sequence[int]):
+    a = np.fromiter(addrs, dtype=np.uint64, count=len(addrs))
+    m = np.uint64(layer.m)
+    h1, h2 = _mix_vector(a) % m, (_mix_vector(a ^ np.uint64(_SECOND)) | np.uint64(1)) % m
+    bits = np.frombuffer(layer.bits, dtype=np.uint8)
+    for i in range(layer.k):
+        j = (h1 + np.uint64(i) * h2) % m
+        np.bitwise_or.at(bits, (j >> np.uint64(3)).astype(np.intp),
+                         np.left_shift(1, j & np.uint64(7)).astype(np.uint8))
+
+class BloomFilter:
+    """
+    Scalable Bloom filter over 64-bit addresses (no false negatives).
+    - Starts with `capacity` entries at `error_rate`; adding past a layer's
+      capacity opens a larger layer, so the bound holds as the law grows.
+    - Lookups are lock-free; adds serialize on an internal lock. Large
+      batches set their bits with numpy when it is installed.
+    - `check` counts lookups and negatives (round trips saved); a positive
+      that the backend then misses is a false positive (see Law.execute).
+    """
+    def __init__(self, capacity: int = 1024, error_rate: float = 0.01):
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be in (0, 1)")
+        self.error_rate = error_rate
+        self._layers: List[_Layer] = [_Layer(max(1, capacity), error_rate / 2)]
+        self._lock = threading.Lock()
+        self.built_at = time.monotonic()  # Current as of (see Law._screen)
+        self.build_time = 0.0
+        self.generation = None  # Backend token at build time (SharedOracle.generation)
+        self.lookups = 0
+        self.negatives = 0
+        self.false_positives = 0
+
+    @classmethod
+    def of(cls, addrs: Iterable[int], error_rate: float = 0.01,
+           capacity: Optional[int] = None) -> 'BloomFilter':
+        """
+        A filter holding `addrs`, with headroom for a quarter more. `capacity`
+        defaults to len(addrs); addresses are read in chunks, so a sized
+        stream (e.g. a paged scan) is never held in memory whole.
+        """
+        if capacity is None:
+            addrs = addrs if hasattr(addrs, '__len__') else list(addrs)
+            capacity = len(addrs)
+        bloom = cls(max(1024, capacity + capacity // 4), error_rate)
+        addrs = iter(addrs)
+        for chunk in iter(lambda: list(itertools.islice(addrs, _CHUNK)), []):
+            bloom.update(chunk)
+        return bloom
+
+    def add(self, addr: int):
+        self.update((addr,))
+
+    def update(self, addrs: Iterable[int]):
+        addrs = addrs if isinstance(addrs, (list, tuple)) else list(addrs)
+        with self._lock:
+            start = 0
+            while start < len(addrs):
+                layer = self._layers[-1]
+                if layer.count >= layer.capacity:
+                    layer = _Layer(layer.capacity * 2, self.error_rate / 2 ** (len(self._layers) + 1))
+                    self._layers = self._layers + [layer]  # Copy-on-write for lock-free readers
+                run = addrs[start:start + layer.capacity - layer.count]
+                if np is not None and len(run) >= _VECTOR_MIN:
+                    _set_vector(layer, run)
+                else:
+                    _set(layer, run)
+                layer.count += len(run)
+                start += len(run)
+
+    def __contains__(self, addr: int) -> bool:
+        h1, h2 = _mix(addr), 0
+        for layer in self._layers:
+            bits, m = layer.bits, layer.m
+            j = h1 % m
+            if not bits[j >> 3] & (1 << (j & 7)):
+                continue  # Most absent addresses stop at the first probe: h2 is not needed
+            if not h2:
+                h2 = _mix(addr ^ _SECOND) | 1
+            for i in range(1, layer.k):
+                j = (h1 + i * h2) % m
+                if not bits[j >> 3] & (1 << (j & 7)):
+                    break
+            else:
+                return True
+        return False
+
+    def check(self, addr: int) -> bool:
+        """Membership test that counts toward stats."""
+        self.lookups += 1
+        if addr in self:
+            return True
+        self.negatives += 1
+        return False
+
+    def __len__(self) -> int:
+        return sum(layer.count for layer in self._layers)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(layer.bits) for layer in self._layers)
+
+    def expected_fpr(self) -> float:
+        """False-positive probability implied by the current fill of each layer."""
+        miss = 1.0
+        for layer in self._layers:
+            fill = 1 - math.exp(-layer.k * layer.count / layer.m)
+            miss *= 1 - fill ** layer.k
+        return 1 - miss
+
+    def stats(self) -> dict:
+        positives = self.lookups - self.negatives
+        return {
+            "entries": len(self),
+            "layers": len(self._layers),
+            "bytes": self.nbytes,
+            "lookups": self.lookups,
+            "skipped_round_trips": self.negatives,
+            "false_positives": self.false_positives,
+            "observed_fpr": self.false_positives / (self.false_positives + self.negatives)
+            if self.false_positives + self.negatives else 0.0,
+            "expected_fpr": self.expected_fpr(),
+            "positive_hit_rate": 1 - self.false_positives / positives if positives else 0.0,
+        }
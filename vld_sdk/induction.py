@@ -1,6 +1,15 @@
-from .core import DeterministicHasher, FeistelMemoizer, RNSEngine, ArchetypeEngine
+from .core import (DeterministicHasher, FeistelMemoizer, RNSEngine, ArchetypeEngine, CoordinateCache,
+                   StructuralHasher, CodeFingerprint)
 from .matrix import VMatrix, GMatrix, XMatrix, PMatrix, GDescriptor
-from typing import Dict, List, Any, Callable, Optional, Tuple
+from .memory import AdmissionPolicy, ManifoldBudget, PolicySpec, estimate_nbytes
+from .tiers import ResultTier, STORED_TYPES
+from .concurrency import SingleFlight
+from .telemetry import Telemetry, UNBOUND
+from .adaptive import AdaptiveBypass, LawGovernor, BYPASS, MEASURE
+from .reduction import Reduction
+from .lsh import ToleranceIndex
+from .surrogate import Surrogate, cubic_arc
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple, Union
 """
 VLD-INDUCTION: Algorithmic Grounding
 Brief: Manages the promotion of O(N) Iterations into O(1) Geometric Laws.
@@ -9,40 +18,314 @@ Notation:
     [Induction] f(x) -> Law(f) | Sigma_H
     [Shunting]  Exec(f, x) = Recall(Law(f), H(x))
 """
+import copy
 import time
 import math
+import asyncio
+import inspect
+import functools
+import operator
+import threading
+import types
+import weakref
+from concurrent.futures import Executor
+
+class _Miss:
+    """Sentinel for an absent state (distinct from a memoized None)."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "MISS"
+
+    def __bool__(self):
+        return False
+
+MISS = _Miss()
+
+_FILTER_DUTY = 0.1  # Largest share of wall time spent rebuilding a read-through filter
+
+class CachedException:
+    """
+    Negative-cache envelope: a memoized failure, re-raised on recall until it
+    expires. `expires` is wall-clock so it stays meaningful once persisted.
+    """
+    __slots__ = ('exc', 'expires')
+
+    def __init__(self, exc: BaseException, ttl: Optional[float] = None):
+        # A detached copy: no traceback, so no frames (and inputs) are pinned
+        self.exc = copy.copy(exc)
+        self.expires = None if ttl is None else time.time() + ttl
+
+    def expired(self) -> bool:
+        return self.expires is not None and time.time() >= self.expires
+
+    def reraise(self):
+        raise copy.copy(self.exc)
+
+# Manifold values that are not results themselves: unwrapped on recall
+_ENVELOPES = frozenset((CachedException,)) | STORED_TYPES
 
 class SharedOracle:
-    """A shared registry for verified induction proofs (Laws)."""
+    """
+    A shared registry for verified induction proofs (Laws).
+    Subclasses back the registry with storage: `publish` binds the law to
+    the oracle (law.backend), after which `store` receives every recorded
+    state and `load` resolves manifold misses (read-through).
+    `resident`: whether loaded states are admitted into the law's manifold.
+    `filtered`: whether laws screen read-throughs with a Bloom filter over
+    `addresses(law)` (see filters.py), built on a background thread and kept
+    current by Law.record. Every `filter_refresh` seconds (None: never) it is
+    rebuilt unless `generation()` shows no writes from elsewhere.
+    """
+    resident = True
+    filtered = False
+    filter_error_rate = 0.01
+    filter_refresh: Optional[float] = None
+
     def __init__(self):
         self._laws: Dict[str, Law] = {}
+        self._lock = threading.Lock()
 
-    def publish(self, law: 'Law'):
-        if law.name not in self._laws:
-            self._laws[law.name] = law
+    def publish(self, law: 'Law') -> 'Law':
+        """Registers a law; returns the canonical instance if one already exists."""
+        with self._lock:
+            return self._laws.setdefault(law.name, law)
 
     def get(self, name: str) -> Optional['Law']:
         return self._laws.get(name)
 
+    def load(self, law: 'Law', addr: int) -> Any:
+        """Resolves a state absent from the resident manifold, or MISS."""
+        return MISS
+
+    def load_many(self, law: 'Law', addrs: List[int]) -> List[Any]:
+        """Batched load (MISS per absent state); remote tiers answer in one round trip."""
+        return [self.load(law, addr) for addr in addrs]
+
+    def store(self, law: 'Law', addr: int, result: Any):
+        """Receives a newly recorded state."""
+        pass
+
+    def names(self) -> List[str]:
+        """Names of all laws known to this oracle."""
+        return list(self._laws)
+
+    def states(self, law: 'Law') -> Iterable[Tuple[int, Any]]:
+        """All (addr, state) pairs of a law known to this oracle."""
+        return list(law.manifold.items())
+
+    def addresses(self, law: 'Law') -> Iterable[int]:
+        """Addresses of all states of a law known to this oracle (sized: len() is their count)."""
+        return [addr for addr, _ in self.states(law)]
+
+    def generation(self) -> Any:
+        """
+        Token that changes when other writers may have stored states, or None
+        when unknown (stale read-through filters are then always rebuilt).
+        """
+        return None
+
 class Law:
     """
     Represents a memoized function of an algorithm in the coordinate space.
     Notation: Law(f) = { H(inputs) -> result }
+    Versioned laws (code fingerprint V(f)) are published as `name@V`.
     """
-    def __init__(self, name: str, seed: int):
-        self.name = name
+    def __init__(self, name: str, seed: int, version: Optional[int] = None):
+        self.name = self.qualify(name, version)
+        self.algorithm = name
+        self.version = version
         self.seed = seed
         self.manifold: Dict[int, Any] = {} 
         self.evolution_depth = 0
+        self.budgets: List[ManifoldBudget] = []
+        self.backend: Optional[SharedOracle] = None
+        self.tier: Optional[ResultTier] = None
+        self.filter = None  # BloomFilter over the backend's addresses (filtered backends)
+        self.metrics = UNBOUND  # LawMetrics of the Telemetry that last ran it (see Telemetry.bind)
+        self._recorded: Optional[List[int]] = None  # Addresses recorded during a filter build
+        self._builder: Optional[threading.Thread] = None
+        self.evict_hooks: List[Callable[['Law', int], None]] = []  # Called as hook(law, addr)
+        self.flights = SingleFlight()
+        self.async_flights: Dict[int, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def qualify(name: str, version: Optional[int]) -> str:
+        return name if version is None else f"{name}@{version:016x}"
+
+    @classmethod
+    def restore(cls, qualified: str, seed: int) -> 'Law':
+        """Rebuilds a law from its published name (as stored by an oracle)."""
+        name, sep, tag = qualified.rpartition('@')
+        if sep and len(tag) == 16:
+            try:
+                return cls(name, seed, int(tag, 16))
+            except ValueError:
+                pass
+        return cls(qualified, seed)
 
-    def record(self, input_hash: int, result: Any):
+    def bind_budget(self, budget: ManifoldBudget):
+        """Places this manifold under a memory budget, charging resident states."""
+        if any(b is budget for b in self.budgets):
+            return
+        self.budgets.append(budget)
+        for addr, result in list(self.manifold.items()):
+            budget.charge(self, addr, estimate_nbytes(result))
+
+    def record(self, input_hash: int, result: Any, cost: float = 0.0):
+        """Memoizes a result; `cost` is the measured compute time in seconds."""
         addr = (self.seed ^ input_hash) & 0xFFFFFFFFFFFFFFFF
+        # Large results may be kept compressed or spilled (decoded on recall)
+        stored = result if self.tier is None else self.tier.encode(result)
+        with self._lock:
+            self._admit(addr, stored, cost)
+            self.evolution_depth += 1
+            if self._recorded is not None:
+                self._recorded.append(addr)
+        if self.filter is not None:
+            self.filter.add(addr)
+        if self.backend is not None:
+            self.backend.store(self, addr, result)
+
+    def _admit(self, addr: int, result: Any, cost: float = 0.0):
         self.manifold[addr] = result
-        self.evolution_depth += 1
+        if self.budgets:
+            size = estimate_nbytes(result)
+            for budget in self.budgets:
+                if addr not in self.manifold:
+                    break  # Evicted on admission (larger than a budget)
+                budget.charge(self, addr, size, cost)
 
-    def execute(self, input_hash: int) -> Optional[Any]:
+    def execute(self, input_hash: int) -> Any:
+        """Recalls a state, or MISS; cached failures are re-raised."""
         addr = (self.seed ^ input_hash) & 0xFFFFFFFFFFFFFFFF
-        return self.manifold.get(addr)
+        result = self.manifold.get(addr, MISS)
+        if result is MISS:
+            if self.backend is None:
+                return MISS
+            # Read-through: resolve from the oracle's storage tier
+            screen = self._screen() if self.backend.filtered else None
+            if screen is not None and not screen.check(addr):
+                return MISS  # Never recorded: skip the round trip
+            result = self.backend.load(self, addr)
+            if result is MISS:
+                if screen is not None:
+                    screen.false_positives += 1
+                return MISS
+            if type(result) is CachedException and result.expired():
+                return MISS
+            if self.backend.resident:
+                self._admit(addr, result if self.tier is None else self.tier.encode(result))
+        elif self.budgets:
+            for budget in self.budgets:
+                budget.touch(self, addr)
+        if type(result) in _ENVELOPES:
+            if type(result) is not CachedException:
+                return result.load()
+            if result.expired():
+                self._evict(addr)
+                return MISS
+            result.reraise()
+        return result
+
+    def execute_many(self, input_hashes: List[int]) -> List[Any]:
+        """
+        Batched execute (MISS per absent state). A compact manifold resolves
+        its typed states in one vectorized probe; everything else (side-dict
+        states, read-through, budget touches) goes through execute().
+        Manifold misses are first read through in one batched backend load.
+        """
+        if self.backend is not None and self.backend.resident and len(input_hashes) > 1:
+            self._prefetch(input_hashes)
+        get_many = getattr(self.manifold, 'get_many', None)
+        if get_many is None or self.budgets or not input_hashes:
+            return [self.execute(h) for h in input_hashes]
+        seed = self.seed
+        values, found = get_many([(seed ^ h) & 0xFFFFFFFFFFFFFFFF for h in input_hashes])
+        values = values.tolist()
+        tuples = self.manifold.width is not None
+        execute = self.execute
+        return [(tuple(v) if tuples else v) if ok else execute(h)
+                for h, v, ok in zip(input_hashes, values, found.tolist())]
+
+    def _prefetch(self, input_hashes: List[int]):
+        seed, manifold = self.seed, self.manifold
+        addrs = [addr for addr in ((seed ^ h) & 0xFFFFFFFFFFFFFFFF for h in input_hashes)
+                 if addr not in manifold]
+        screen = self._screen() if addrs and self.backend.filtered else None
+        if screen is not None:
+            addrs = [addr for addr in addrs if screen.check(addr)]
+        if not addrs:
+            return
+        for addr, result in zip(addrs, self.backend.load_many(self, addrs)):
+            if result is MISS:
+                if screen is not None:
+                    screen.false_positives += 1
+                continue
+            if type(result) is CachedException and result.expired():
+                continue
+            self._admit(addr, result if self.tier is None else self.tier.encode(result))
+
+    def _screen(self, wait: bool = False):
+        """
+        The read-through filter, or None until the first build completes.
+        Absent or stale filters are (re)built on a background thread while
+        reads go on (unscreened, or screened by the previous filter).
+        Rebuilds are spaced to take at most _FILTER_DUTY of wall time.
+        `wait` blocks until a running build is published.
+        """
+        screen, backend = self.filter, self.backend
+        if self._recorded is None:
+            if screen is None:
+                self._rebuild_screen()
+            elif backend.filter_refresh is not None:
+                now = time.monotonic()
+                if now - screen.built_at >= max(backend.filter_refresh, screen.build_time / _FILTER_DUTY):
+                    token = backend.generation()
+                    if token is None or token != screen.generation:
+                        self._rebuild_screen()
+                    else:
+                        screen.built_at = now  # No writes from elsewhere: still current
+        builder = self._builder
+        if wait and builder is not None:
+            builder.join()
+            screen = self.filter
+        return screen
+
+    def _rebuild_screen(self):
+        with self._lock:
+            if self._recorded is not None:
+                return  # A build is already running
+            self._recorded = []
+        self._builder = threading.Thread(target=self._build_screen, name="vld-filter", daemon=True)
+        self._builder.start()
+
+    def _build_screen(self):
+        from .filters import BloomFilter
+        backend = self.backend
+        try:
+            start = time.monotonic()
+            token = backend.generation()
+            screen = BloomFilter.of(backend.addresses(self), backend.filter_error_rate)
+        except Exception:
+            # Closed or unreachable backend: reads stay as they were; the next miss retries
+            with self._lock:
+                self._recorded = None
+            return
+        screen.built_at, screen.build_time, screen.generation = start, time.monotonic() - start, token
+        with self._lock:
+            recorded, self._recorded = self._recorded, None
+            self.filter = screen
+        screen.update(recorded)  # Recorded while the snapshot was read
+
+    def _evict(self, addr: int):
+        # Called by a budget after releasing its lock; must not take the law lock (order law -> budget)
+        self.manifold.pop(addr, None)
+        for budget in self.budgets:
+            budget.forget(self, addr)
+        for hook in self.evict_hooks:
+            hook(self, addr)
 
 class VirtualLayer:
     """
@@ -52,8 +335,44 @@ class VirtualLayer:
     """
     ORACLE = SharedOracle() # Global Process Oracle
 
-    def __init__(self, seed: int = 0x1ADDE777):
-        self.hasher = DeterministicHasher()
+    def __init__(self, seed: int = 0x1ADDE777,
+                 max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 law_max_entries: Optional[int] = None, law_max_bytes: Optional[int] = None,
+                 eviction: PolicySpec = "lru", oracle: Optional[SharedOracle] = None,
+                 async_hash_threshold: int = 64 * 1024, executor: Optional[Executor] = None,
+                 coordinate_cache: int = 1 << 16, structural_hashing: bool = False,
+                 versioned: bool = False,
+                 cache_exceptions: Union[bool, type, Tuple[type, ...]] = False,
+                 exception_ttl: Optional[float] = None, telemetry: bool = False,
+                 adaptive_bypass: Union[bool, AdaptiveBypass] = False,
+                 admission: Optional[AdmissionPolicy] = None,
+                 result_tier: Optional[ResultTier] = None):
+        """
+        Memory budgets are optional: `max_entries`/`max_bytes` bound all laws
+        of this layer together, `law_max_entries`/`law_max_bytes` bound each law.
+        `eviction` selects the policy ('lru', 'lfu', 'arc', 'gdsf' or a factory).
+        `oracle` replaces the process-global ORACLE for this layer.
+        `arun` hashes inputs of at least `async_hash_threshold` bytes off the event loop.
+        `executor` (e.g. a ProcessPoolExecutor) runs the ground phase of `run_many`.
+        `coordinate_cache` bounds the per-type scalar key tier (0 disables it).
+        `structural_hashing` hashes containers as Merkle trees, caching digests
+        of immutable or `self.hasher.mark_frozen` sub-objects across calls.
+        `versioned` folds a fingerprint of each function's code into its law's
+        seed: changed functions get a fresh manifold, unchanged ones stay warm.
+        `cache_exceptions` (True or exception types) memoizes deterministic
+        failures, re-raised on recall for `exception_ttl` seconds (None: forever).
+        `telemetry` starts per-law metrics enabled (toggle via self.telemetry).
+        `adaptive_bypass` (True or a configured AdaptiveBypass) lets run() and
+        induce() pass calls straight through for laws where induction costs
+        more than it saves, probing periodically to re-enable them.
+        `admission` filters which computed results are recorded at all
+        (by compute time, size and value per byte); see set_admission.
+        `result_tier` keeps large results compressed or spilled to disk.
+        """
+        if oracle is not None:
+            self.ORACLE = oracle
+        self.hasher = StructuralHasher() if structural_hashing else DeterministicHasher()
+        self.coords = CoordinateCache(self.hasher, coordinate_cache)
         self.feistel = FeistelMemoizer()
         self.laws: Dict[str, Law] = {}
         self.v_itsc = 0 
@@ -65,55 +384,654 @@ class VirtualLayer:
         self.p_engine = PMatrix(1024, 1024)
         self.archetype_engine = ArchetypeEngine(seed ^ 0x60)
         self.geodesic = GeodesicFlowSolver()
+
+        # Manifold Budgets (unbounded unless configured)
+        self.eviction = eviction
+        self.budget: Optional[ManifoldBudget] = None
+        if max_entries is not None or max_bytes is not None:
+            self.budget = ManifoldBudget(max_entries, max_bytes, eviction)
+        self.law_max_entries = law_max_entries
+        self.law_max_bytes = law_max_bytes
+        self.law_budgets: Dict[str, ManifoldBudget] = {}
+        self.async_hash_threshold = async_hash_threshold
+        self.executor = executor
+        self.versioned = versioned
+        if cache_exceptions is True:
+            cache_exceptions = (Exception,)
+        self.cache_exceptions = cache_exceptions or ()
+        self.exception_ttl = exception_ttl
+        self.telemetry = Telemetry(enabled=telemetry)
+        self.adaptive: Optional[AdaptiveBypass] = (
+            AdaptiveBypass() if adaptive_bypass is True else adaptive_bypass or None)
+        self.admission = admission
+        self.law_admission: Dict[str, AdmissionPolicy] = {}
+        self.result_tier = result_tier
+        self.law_stores: Dict[str, dict] = {}
+        self.reductions: Dict[str, Reduction] = {}
+        self.tolerances: Dict[str, ToleranceIndex] = {}
+        self.surrogates: Dict[str, Surrogate] = {}
+        self._versions = weakref.WeakKeyDictionary()
+        self._code_versions = weakref.WeakKeyDictionary()  # code -> (refs, version)
         
     def get_geometric_matrix(self, rows: int, cols: int, seed: int) -> GMatrix:
         desc = GDescriptor(rows, cols, seed)
         return GMatrix(desc)
 
-    def _get_or_create_law(self, algorithm_name: str, sample_input: Any) -> Law:
-        if algorithm_name not in self.laws:
+    def _get_or_create_law(self, algorithm_name: str, sample_input: Any,
+                           version: Optional[int] = None) -> Law:
+        law = self.laws.get(algorithm_name)
+        if law is None or law.version != version:
             # Check Shared Oracle for pre-existing induction proof
-            shared_law = self.ORACLE.get(algorithm_name)
-            if shared_law:
-                self.laws[algorithm_name] = shared_law
-            else:
+            law = self.ORACLE.get(Law.qualify(algorithm_name, version))
+            if not law:
                 # Generate a stable seed for this algorithm based on its name (its "nature")
                 algo_coord = self.hasher.hash_data(algorithm_name)
+                if version is not None:
+                    algo_coord ^= version  # ...and on what it computes
                 algo_seed = self.feistel.project_to_seed(algo_coord)
-                self.laws[algorithm_name] = Law(algorithm_name, algo_seed)
-        return self.laws[algorithm_name]
+                # Global Publication: storage-backed oracles bind the law here.
+                # A concurrent creator may win the race; adopt its instance.
+                law = self.ORACLE.publish(Law(algorithm_name, algo_seed, version))
+            # A changed function replaces its stale law in this layer
+            self.laws[algorithm_name] = law
+            if self.result_tier is not None and law.tier is None:
+                law.tier = self.result_tier
+            self._bind_store(law)
+            self._bind_budgets(law)
+        return law
+
+    def _law_for(self, algorithm_name: str, func: Callable, sample_input: Any) -> Law:
+        version = self.version_of(func) if self.versioned else None
+        return self._get_or_create_law(algorithm_name, sample_input, version)
+
+    def version_of(self, func: Callable) -> int:
+        """
+        64-bit code fingerprint of `func`. Plain functions are memoized per
+        code object (while globals, defaults and closure values are the same
+        objects), so a lambda re-created on every call is fingerprinted once;
+        other callables per object.
+        """
+        if type(func) is types.FunctionType:
+            refs = [func.__globals__, func.__defaults__, func.__kwdefaults__]
+            for cell in func.__closure__ or ():
+                try:
+                    refs.append(cell.cell_contents)
+                except ValueError:  # Empty cell (not yet assigned)
+                    refs.append(None)
+            hit = self._code_versions.get(func.__code__)
+            if hit is not None and len(hit[0]) == len(refs) and all(map(operator.is_, hit[0], refs)):
+                return hit[1]
+            version = CodeFingerprint.of(func) & 0xFFFFFFFFFFFFFFFF
+            self._code_versions[func.__code__] = (refs, version)
+            return version
+        try:
+            return self._versions[func]
+        except KeyError:
+            version = self._versions[func] = CodeFingerprint.of(func) & 0xFFFFFFFFFFFFFFFF
+            return version
+        except TypeError:  # Not weak-referenceable
+            return CodeFingerprint.of(func) & 0xFFFFFFFFFFFFFFFF
+
+    def _bind_budgets(self, law: Law):
+        budget = self.law_budgets.get(law.algorithm)
+        if budget is None and (self.law_max_entries is not None or self.law_max_bytes is not None):
+            budget = ManifoldBudget(self.law_max_entries, self.law_max_bytes, self.eviction)
+            self.law_budgets[law.algorithm] = budget
+        if budget is not None:
+            law.bind_budget(budget)
+        if self.budget is not None:
+            law.bind_budget(self.budget)
+
+    def set_budget(self, algorithm_name: str, max_entries: Optional[int] = None,
+                   max_bytes: Optional[int] = None, eviction: Optional[PolicySpec] = None):
+        """Overrides the per-law budget for a single algorithm."""
+        budget = ManifoldBudget(max_entries, max_bytes, eviction or self.eviction)
+        self.law_budgets[algorithm_name] = budget
+        law = self.laws.get(algorithm_name)
+        if law is not None:
+            law.bind_budget(budget)
+        return budget
+
+    def set_compact(self, algorithm_name: str, dtype: Any = "float64",
+                    width: Optional[int] = None, capacity: int = 1024):
+        """
+        Stores an algorithm's states in a CompactManifold (requires numpy):
+        uint64 addresses and `dtype` values in flat arrays, for laws returning
+        scalars (`width` None) or `width`-tuples of numbers.
+        """
+        self.law_stores[algorithm_name] = {"dtype": dtype, "width": width, "capacity": capacity}
+        law = self.laws.get(algorithm_name)
+        if law is not None:
+            self._bind_store(law)
+
+    def _bind_store(self, law: Law):
+        spec = self.law_stores.get(law.algorithm)
+        if spec is None or type(law.manifold) is not dict:
+            return
+        from .compact import CompactManifold
+        with law._lock:
+            compact = CompactManifold(**spec)
+            compact.update(law.manifold)
+            law.manifold = compact
+
+    def set_tolerance(self, algorithm_name: str, epsilon: float, bits: int = 16,
+                      vectorize: Optional[Callable[[Any], Any]] = None,
+                      max_probes: int = 64) -> ToleranceIndex:
+        """
+        Opts an algorithm into approximate recall: on an exact miss, run() and
+        induce() reuse the result of the nearest recorded input within
+        `epsilon` (Euclidean, verified exactly). `vectorize` maps inputs (for
+        induce: the (args, kwargs) pair) to a float vector.
+        """
+        index = self.tolerances[algorithm_name] = ToleranceIndex(
+            epsilon, bits, vectorize, max_probes, engine=self.v_engine)
+        return index
+
+    def set_surrogate(self, algorithm_name: str, tolerance: float,
+                      arguments: Optional[Callable[[Any], Any]] = None,
+                      validate_every: int = 0) -> Surrogate:
+        """
+        Opts a smooth scalar function of one or two numbers into surrogate
+        answers: on an exact miss, run() and induce() interpolate recorded
+        points when the held-out error bound is within `tolerance`.
+        `arguments` maps inputs (for induce: the (args, kwargs) pair) to them.
+        """
+        surrogate = self.surrogates[algorithm_name] = Surrogate(tolerance, arguments, validate_every)
+        return surrogate
+
+    def set_admission(self, algorithm_name: str, policy: Optional[AdmissionPolicy]) -> Optional[AdmissionPolicy]:
+        """Overrides the admission policy for a single algorithm (None: admit all)."""
+        self.law_admission[algorithm_name] = policy
+        return policy
+
+    def _admits(self, law: Law, result: Any, cost: float) -> bool:
+        policy = self.law_admission.get(law.algorithm, self.admission) if self.law_admission \
+            else self.admission
+        return policy is None or policy.admit(result, cost)
 
     def run(self, algorithm_name: str, func: Callable, inputs: Any) -> Any:
         """
         Executes a task. If the function is already "induced" as a Law,
         it performs O(1) recall. Otherwise, it executes and induces.
         """
-        input_hash = self.hasher.hash_data(inputs)
-        law = self._get_or_create_law(algorithm_name, inputs)
+        telemetry = self.telemetry
+        governor = None
+        if self.adaptive is not None:
+            governor = self.adaptive.laws.get(algorithm_name) or self.adaptive.law(algorithm_name)
+            gate = governor.gate()
+            if gate == BYPASS:
+                return func(inputs)  # Induction is a net loss for this law (for now)
+            if gate == MEASURE:
+                return self._run_timed(algorithm_name, func, inputs, governor)
+        law = self.laws.get(algorithm_name)
+        metrics = None
+        if telemetry.enabled:
+            metrics = UNBOUND if law is None else law.metrics
+            if metrics.countdown <= 0 or metrics.owner is not telemetry:
+                return self._run_timed(algorithm_name, func, inputs, governor)
+        input_hash = self.coords.coordinate(inputs)
+        if law is None or self.versioned:
+            law = self._law_for(algorithm_name, func, inputs)
 
         # 1. Try O(1) Law Recall
         result = law.execute(input_hash)
-        if result is not None:
+        if governor is not None:
+            governor.count(result is not MISS)
+        if result is not MISS:
+            if metrics is not None:
+                metrics.countdown -= 1  # A hit (see LawMetrics.hits)
             # Traceable/Reversible: The Virtual Layer 'recalls' the state
             return result
+        if metrics is not None:
+            metrics.misses += 1
+
+        # 2. O(N) Fallback & Induction (single-flight: concurrent misses share one call)
+        return law.flights.do(input_hash, self._ground, law, func, inputs, input_hash)
+
+    def _run_timed(self, algorithm_name: str, func: Callable, inputs: Any,
+                   governor: Optional[LawGovernor] = None) -> Any:
+        """The sampled run() that also times hashing and lookup."""
+        telemetry = self.telemetry
+        start = time.perf_counter()
+        input_hash = self.coords.coordinate(inputs)
+        hashed = time.perf_counter()
+        law = self.laws.get(algorithm_name)
+        if law is None or self.versioned:
+            law = self._law_for(algorithm_name, func, inputs)
+
+        result = law.execute(input_hash)
+        looked_up = time.perf_counter()
+        if telemetry.enabled:
+            metrics = law.metrics if law.metrics.owner is telemetry else telemetry.bind(law)
+            metrics.sample(telemetry.sample_every)
+            metrics.hash_latency.observe(hashed - start)
+            metrics.lookup_latency.observe(looked_up - hashed)
+            if result is not MISS:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+        if governor is not None:
+            governor.observe_overhead(looked_up - start)
+            governor.count(result is not MISS)
+        if result is not MISS:
+            return result
+        return law.flights.do(input_hash, self._ground, law, func, inputs, input_hash)
+
+    def _ground(self, law: Law, func: Callable, inputs: Any, input_hash: int) -> Any:
+        # Re-check: a previous leader may have recorded between our miss and the flight
+        result = law.execute(input_hash)
+        if result is not MISS:
+            return result
+        index = self.tolerances.get(law.algorithm) if self.tolerances else None
+        vector = None
+        if index is not None:
+            vector = index.vector(inputs)
+            if vector is not None:
+                result = self._recall_near(law, index, vector)
+                if result is not MISS:
+                    return result
+        surrogate = self.surrogates.get(law.algorithm) if self.surrogates else None
+        point = None
+        if surrogate is not None:
+            point = surrogate.point(inputs)
+            if point is not None:
+                estimate = surrogate.answer(point)
+                if estimate is not None:
+                    return estimate  # Interpolated, not recorded
 
-        # 2. O(N) Fallback & Induction
         # In a real VL system, this is where the algorithmic function is 'encoded'
-        result = func(inputs)
-        
-        # 3. One-Shot Induction (Ground Phase): Memoize instantly
-        law.record(input_hash, result)
+        start = time.perf_counter()
+        try:
+            result = func(inputs)
+        except Exception as e:
+            self._record_failure(law, input_hash, e, time.perf_counter() - start)
+            raise
+        cost = time.perf_counter() - start
         
-        # 4. Global Publication: Reach oracle consensus instantly
-        self.ORACLE.publish(law)
+        # 3. One-Shot Induction (Ground Phase): Memoize instantly (if worth keeping)
+        admitted = self._admits(law, result, cost)
+        if admitted:
+            law.record(input_hash, result, cost)
+            if vector is not None:
+                if index.evicted not in law.evict_hooks:
+                    law.evict_hooks.append(index.evicted)
+                index.add(vector, input_hash)
+        if point is not None:
+            surrogate.add(point, result)
+        if self.adaptive is not None:
+            self.adaptive.law(law.algorithm).observe_compute(
+                cost, time.perf_counter() - start - cost)
+        if self.telemetry.enabled:
+            self.telemetry.law(law.algorithm).observe_compute(
+                cost, estimate_nbytes(result) if admitted else 0)
             
         return result
 
+    def _recall_near(self, law: Law, index: ToleranceIndex, vector: tuple) -> Any:
+        """Result of the nearest recorded input within the index's epsilon, or MISS."""
+        while True:
+            near = index.nearest(vector)
+            if near is None:
+                return MISS
+            _, input_hash, distance = near
+            result = law.execute(input_hash)
+            if result is not MISS:
+                index.observe_hit(distance)
+                return result
+            index.discard(input_hash)  # Gone without an eviction hook (e.g. cleared)
+
+    def _record_failure(self, law: Law, input_hash: int, exc: Exception, cost: float):
+        """Negative caching: memoizes `exc` if its type is configured for it."""
+        if not self.cache_exceptions or not isinstance(exc, self.cache_exceptions):
+            return
+        try:
+            law.record(input_hash, CachedException(exc, self.exception_ttl), cost)
+        except Exception:
+            pass  # Uncopyable or unpicklable: never mask the original failure
+
+    def run_many(self, algorithm_name: str, func: Callable, inputs: Iterable[Any],
+                 executor: Optional[Executor] = None, chunksize: Optional[int] = None) -> List[Any]:
+        """
+        Batched run: hashes every input, resolves all hits in one pass, then
+        grounds the distinct misses on `executor` (default: self.executor,
+        else inline) in chunks of `chunksize`. Results keep input order,
+        independent of worker count; `func` must be picklable for process pools.
+        """
+        inputs = list(inputs)
+        law = self._law_for(algorithm_name, func, inputs[0] if inputs else None)
+        coordinate = self.coords.coordinate
+        hashes = [coordinate(x) for x in inputs]
+
+        # 1. Bulk O(1) Recall; distinct misses keep their first occurrence
+        results: List[Any] = [None] * len(inputs)
+        pending: Dict[int, List[int]] = {}
+        for i, (h, result) in enumerate(zip(hashes, law.execute_many(hashes))):
+            if result is MISS:
+                waiting = pending.get(h)
+                if waiting is None:
+                    pending[h] = [i]
+                else:
+                    waiting.append(i)
+            else:
+                results[i] = result
+        if self.telemetry.enabled:
+            metrics = self.telemetry.law(law.algorithm)
+            metrics.hits += len(inputs) - len(pending)
+            metrics.misses += len(pending)
+        if not pending:
+            return results
+
+        # 2. Ground Phase for the misses (process pool or inline)
+        miss_hashes = list(pending)
+        miss_inputs = [inputs[pending[h][0]] for h in miss_hashes]
+        executor = executor or self.executor
+        call = functools.partial(_capture, func)
+        start = time.perf_counter()
+        if executor is None:
+            computed = [call(x) for x in miss_inputs]
+        else:
+            chunksize = chunksize or max(1, len(miss_inputs) // 32)
+            computed = list(executor.map(call, miss_inputs, chunksize=chunksize))
+        cost = (time.perf_counter() - start) / len(miss_inputs)
+
+        # 3. Merge into the Law (and through it, the oracle backend); one
+        # failing input does not discard the rest of the batch
+        failure = None
+        for h, (ok, result) in zip(miss_hashes, computed):
+            if not ok:
+                self._record_failure(law, h, result, cost)
+                failure = failure or result
+                continue
+            for i in pending[h]:
+                results[i] = result
+            admitted = self._admits(law, result, cost)
+            if admitted:
+                law.record(h, result, cost)
+            if self.telemetry.enabled:
+                self.telemetry.law(law.algorithm).observe_compute(
+                    cost, estimate_nbytes(result) if admitted else 0)
+        if failure is not None:
+            raise failure
+        return results
+
+    def register_reduction(self, algorithm_name: str, combine: Callable[[Any, Any], Any],
+                           leaf: Optional[Callable] = None, chunk_size: int = 1024,
+                           **options) -> Reduction:
+        """
+        Registers an associative fold for `reduce`: chunk partials and their
+        combinations are memoized in a segment tree, so overlapping inputs
+        share work. `options`: identity, finalize, content_defined.
+        """
+        reduction = self.reductions[algorithm_name] = Reduction(
+            combine, leaf, chunk_size, **options)
+        return reduction
+
+    def reduce(self, algorithm_name: str, sequence: Any) -> Any:
+        """
+        Folds `sequence` with a registered reduction, computing only chunks
+        (and combinations) not seen before under this law.
+        """
+        reduction = self.reductions.get(algorithm_name)
+        if reduction is None:
+            raise KeyError(f"No reduction registered as {algorithm_name!r}")
+        version = None
+        if self.versioned:
+            version = self.version_of(reduction.combine) ^ self.version_of(reduction.leaf)
+            if reduction.finalize is not None:
+                version ^= self.version_of(reduction.finalize)
+        law = self._get_or_create_law(algorithm_name, sequence, version)
+        result, recalled, computed = reduction.evaluate(law, sequence)
+        if self.telemetry.enabled:
+            metrics = self.telemetry.law(law.algorithm)
+            metrics.hits += recalled
+            metrics.misses += computed
+        return result
+
+    async def arun(self, algorithm_name: str, func: Callable, inputs: Any) -> Any:
+        """
+        asyncio-native run: awaits coroutine functions and shares one in-flight
+        future per input hash, so concurrent tasks missing on the same input
+        ground it once. Large inputs are hashed in the loop's default executor.
+        """
+        law = self._law_for(algorithm_name, func, inputs)
+        if _payload_size(inputs) >= self.async_hash_threshold:
+            loop = asyncio.get_running_loop()
+            input_hash = await loop.run_in_executor(None, self.hasher.hash_data, inputs)
+        else:
+            input_hash = self.coords.coordinate(inputs)
+
+        # 1. Try O(1) Law Recall
+        result = law.execute(input_hash)
+        observed = self.telemetry.enabled
+        if observed:
+            metrics = self.telemetry.law(law.algorithm)
+            if result is not MISS:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+        if result is not MISS:
+            return result
+
+        # 2. Join the in-flight ground phase for this coordinate, if any
+        loop = asyncio.get_running_loop()
+        future = law.async_flights.get(input_hash)
+        if future is not None and future.get_loop() is loop:
+            return await asyncio.shield(future)
+
+        future = law.async_flights[input_hash] = loop.create_future()
+        try:
+            start = time.perf_counter()
+            result = func(inputs)
+            if inspect.isawaitable(result):
+                result = await result
+            cost = time.perf_counter() - start
+            admitted = self._admits(law, result, cost)
+            if admitted:
+                law.record(input_hash, result, cost)
+            if observed:
+                metrics.observe_compute(cost, estimate_nbytes(result) if admitted else 0)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if isinstance(e, Exception):
+                self._record_failure(law, input_hash, e, time.perf_counter() - start)
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: the leader re-raises it
+            raise
+        finally:
+            if law.async_flights.get(input_hash) is future:
+                del law.async_flights[input_hash]
+
+    def induce(self, name: Optional[str] = None, ignore: Iterable[str] = (),
+               key_funcs: Optional[Dict[str, Callable]] = None) -> Callable:
+        """
+        Decorator form of run for functions of any arity. The input coordinate
+        is derived from the bound arguments (defaults applied, keyword order
+        irrelevant); parameters in `ignore` are left out of it and
+        `key_funcs[param](value)` replaces a value by its key (e.g. an id).
+        """
+        def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+                raise TypeError("Use ainduce for coroutine functions")
+            algorithm_name = name or func.__qualname__
+            binder = _ArgBinder(func, ignore, key_funcs)
+            version = self.version_of(func) if self.versioned else None
+            coordinate = self.coords.coordinate_args
+            call = lambda packed: func(*packed[0], **packed[1])
+            # Exact-arity positional calls with no key plan key on args as given
+            arity = len(binder.names) if binder.plain and binder.plan is None else -1
+            telemetry = self.telemetry
+            bound: List[Law] = []  # This wrapper's law (its version), resolved once
+
+            def resolve(args: tuple) -> Law:
+                law = self._get_or_create_law(algorithm_name, args, version)
+                bound[:] = [law]
+                return law
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if self.adaptive is None and not telemetry.enabled:
+                    # Fast path: key, recall, return
+                    input_hash = coordinate(args if not kwargs and len(args) == arity
+                                            else binder.key(args, kwargs))
+                    law = bound[0] if bound else resolve(args)
+                    result = law.manifold.get((law.seed ^ input_hash) & 0xFFFFFFFFFFFFFFFF, MISS)
+                    if result is MISS or law.budgets or type(result) in _ENVELOPES:
+                        result = law.execute(input_hash)  # Read-through, budget touch, envelopes
+                    if result is not MISS:
+                        return result
+                    return law.flights.do(input_hash, self._ground, law, call, (args, kwargs), input_hash)
+                governor = None
+                if self.adaptive is not None:
+                    governor = self.adaptive.laws.get(algorithm_name) or self.adaptive.law(algorithm_name)
+                    gate = governor.gate()
+                    if gate == BYPASS:
+                        return func(*args, **kwargs)
+                    start = time.perf_counter() if gate == MEASURE else None
+                input_hash = coordinate(binder.key(args, kwargs))
+                law = bound[0] if bound else resolve(args)
+                result = law.execute(input_hash)
+                if governor is not None:
+                    if start is not None:
+                        governor.observe_overhead(time.perf_counter() - start)
+                    governor.count(result is not MISS)
+                if telemetry.enabled:
+                    metrics = telemetry.law(algorithm_name)
+                    if result is not MISS:
+                        metrics.hits += 1
+                    else:
+                        metrics.misses += 1
+                if result is not MISS:
+                    return result
+                return law.flights.do(input_hash, self._ground, law, call, (args, kwargs), input_hash)
+            wrapper.law_name = algorithm_name
+            return wrapper
+        return decorator
+
+    def ainduce(self, name: Optional[str] = None) -> Callable:
+        """Decorator form of arun for single-input (coroutine) functions."""
+        def decorator(func: Callable) -> Callable:
+            algorithm_name = name or func.__qualname__
+
+            @functools.wraps(func)
+            async def wrapper(inputs):
+                return await self.arun(algorithm_name, func, inputs)
+            return wrapper
+        return decorator
+
     def get_stats(self):
-        return {
+        stats = {
             "induced_laws": len(self.laws),
             "total_memoized_states": sum(len(l.manifold) for l in self.laws.values())
         }
+        if self.budget is not None:
+            stats["budget_entries"] = self.budget.entries
+            stats["budget_bytes"] = self.budget.nbytes
+            stats["evictions"] = self.budget.evictions + sum(
+                b.evictions for b in self.law_budgets.values())
+        elif self.law_budgets:
+            stats["evictions"] = sum(b.evictions for b in self.law_budgets.values())
+        if self.telemetry.laws:
+            stats["laws"] = self.telemetry.snapshot()
+        if self.adaptive is not None:
+            stats["bypass"] = self.adaptive.snapshot()
+        policies = {n: p for n, p in self.law_admission.items() if p is not None}
+        if self.admission is not None:
+            stats["admission"] = self.admission.stats()
+        if self.result_tier is not None:
+            stats["tier"] = self.result_tier.stats()
+        if self.tolerances:
+            stats["tolerance"] = {n: i.stats() for n, i in self.tolerances.items()}
+        if self.surrogates:
+            stats["surrogate"] = {n: s.stats() for n, s in self.surrogates.items()}
+        if policies:
+            stats["law_admission"] = {n: p.stats() for n, p in policies.items()}
+        filters = {n: l.filter.stats() for n, l in self.laws.items() if l.filter is not None}
+        if filters:
+            stats["filters"] = filters
+        return stats
+
+def _capture(func: Callable, inputs: Any) -> Tuple[bool, Any]:
+    """Runs one ground-phase call, returning (ok, result or exception)."""
+    try:
+        return True, func(inputs)
+    except Exception as e:
+        return False, e
+
+class _ArgBinder:
+    """
+    Signature binding computed once per decorated function.
+    Plain positional/keyword signatures bind by hand (no inspect per call);
+    var-args and keyword-only parameters go through Signature.bind.
+    """
+    _PLAIN = (inspect.Parameter.POSITIONAL_OR_KEYWORD,)
+
+    def __init__(self, func: Callable, ignore: Iterable[str] = (),
+                 key_funcs: Optional[Dict[str, Callable]] = None):
+        self.signature = inspect.signature(func)
+        params = self.signature.parameters
+        unknown = (set(ignore) | set(key_funcs or ())) - set(params)
+        if unknown:
+            raise ValueError(f"Unknown parameters for {func.__qualname__}: {sorted(unknown)}")
+        self.names = tuple(params)
+        self.defaults = {n: p.default for n, p in params.items() if p.default is not p.empty}
+        self.plain = all(p.kind in self._PLAIN for p in params.values())
+        # Positional calls omitting trailing defaults: args + tails[len(args)]
+        required = len(self.names) - len(self.defaults)
+        tail = tuple(self.defaults.get(n) for n in self.names)
+        self.tails = {n: tail[n:] for n in range(required, len(self.names) + 1)} if self.plain else {}
+        # Per-position key transforms: None keeps the value, False drops it
+        plan = [False if n in ignore else (key_funcs or {}).get(n) for n in self.names]
+        self.plan = tuple(plan) if any(step is not None for step in plan) else None
+
+    def key(self, args: tuple, kwargs: dict) -> tuple:
+        values = self._bind(args, kwargs)
+        if self.plan is None:
+            return values
+        return tuple(v if step is None else step(v)
+                     for v, step in zip(values, self.plan) if step is not False)
+
+    def _bind(self, args: tuple, kwargs: dict) -> tuple:
+        if not kwargs:
+            tail = self.tails.get(len(args))
+            if tail is not None:
+                return args + tail if tail else args
+        if self.plain:
+            n = len(args)
+            if n <= len(self.names):
+                rest = self.names[n:]
+                used = 0
+                values = list(args)
+                for name in rest:
+                    if name in kwargs:
+                        values.append(kwargs[name])
+                        used += 1
+                    elif name in self.defaults:
+                        values.append(self.defaults[name])
+                    else:
+                        break
+                else:
+                    if used == len(kwargs):
+                        return tuple(values)
+        # Irregular calls (and errors: Signature.bind raises the usual TypeError)
+        bound = self.signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        return tuple(arguments[n] for n in self.names)
+
+def _payload_size(data: Any) -> int:
+    """O(1) size hint for hashing cost: buffer bytes, else ~8 bytes per element."""
+    nbytes = getattr(data, 'nbytes', None)
+    if nbytes is not None:
+        return nbytes
+    if isinstance(data, (str, bytes, bytearray)):
+        return len(data)
+    if isinstance(data, (list, tuple, dict, set, frozenset)):
+        return 8 * len(data)
+    return 0
 
 class GeodesicFlowSolver:
     """
@@ -126,6 +1044,6 @@ class GeodesicFlowSolver:
         for t in range(steps):
             alpha = t / (steps - 1)
             # Cubic interpolation acting as a geodesic arc in semantic space
-            p = start + (goal - start) * (3 * alpha**2 - 2 * alpha**3)
+            p = start + (goal - start) * cubic_arc(alpha)
             path.append(p)
         return path
@@ -0,0 +1,174 @@
+"""
+VLD-LSH: Approximate Recall
+Brief: Tolerance mode for Laws over numeric vectors: random-hyperplane
+(SimHash) buckets on VMatrix projections, multi-probed within epsilon and
+verified by exact distance before a stored result is recalled.
+
+Notation:
+    [Sign]   sig(x)_j = [ <W_j, x> >= 0 ],  W = VMatrix.weights(d, bits)
+    [Probe]  |<W_j, x>| <= eps * |W_j|  =>  bit j may differ for ||y - x|| <= eps
+    [Recall] y* = argmin ||y - x||  over probed buckets,  recalled iff ||y* - x|| <= eps
+"""
+import math
+import threading
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .matrix import VMatrix
+
+_TEXT = (str, bytes, bytearray)
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+def _coordinate(x: Any) -> float:
+    if isinstance(x, _TEXT):
+        raise TypeError("text is not a numeric coordinate")  # float("12") would parse it
+    return float(x)
+
+class ToleranceIndex:
+    """
+    Approximate-recall index for one algorithm.
+    - `epsilon`: maximum Euclidean distance between a new input and a
+      recorded one for the recorded result to be reused.
+    - `bits`: hyperplanes per signature (more bits: smaller buckets).
+    - `vectorize(inputs)` maps inputs to a flat float sequence (default:
+      the inputs themselves; NumPy arrays are flattened). Inputs it cannot
+      map, including str/bytes and sequences of them, are served by exact
+      recall only.
+    - `max_probes` caps the buckets visited per lookup. Bits whose margin is
+      within epsilon are flipped (smallest margins first); when there are
+      too many to enumerate, the lookup may miss a neighbour (`truncated`).
+    - Entries follow their states: `evicted(law, addr)` (wired to the law's
+      eviction hooks) drops the entry of an evicted state.
+    """
+    def __init__(self, epsilon: float, bits: int = 16,
+                 vectorize: Optional[Callable[[Any], Any]] = None,
+                 max_probes: int = 64, engine: Optional[VMatrix] = None):
+        if epsilon < 0:
+            raise ValueError("epsilon must be >= 0")
+        if not 1 <= bits <= 64:
+            raise ValueError("bits must be in [1, 64]")
+        self.epsilon = epsilon
+        self.bits = bits
+        self.vectorize = vectorize
+        self.max_probes = max(1, max_probes)
+        self.engine = engine if engine is not None else VMatrix()
+        # (dim, signature) -> [(vector, input_hash)]
+        self.buckets: Dict[Tuple[int, int], List[Tuple[tuple, int]]] = {}
+        self._where: Dict[int, Tuple[int, int]] = {}  # low 64 bits of input_hash -> bucket key
+        self._planes: Dict[int, Tuple[List[List[float]], List[float]]] = {}
+        self._lock = threading.Lock()
+        self.entries = 0
+        self.lookups = 0
+        self.hits = 0
+        self.truncated = 0
+        self.error_sum = 0.0
+        self.max_error = 0.0
+
+    def vector(self, inputs: Any) -> Optional[tuple]:
+        """The input as a float tuple, or None if it is not a numeric vector."""
+        try:
+            data = inputs if self.vectorize is None else self.vectorize(inputs)
+            if isinstance(data, _TEXT):
+                return None
+            if hasattr(data, 'ravel'):
+                data = data.ravel().tolist()
+            vector = tuple(map(_coordinate, data))
+        except (TypeError, ValueError):
+            return None
+        return vector if vector else None
+
+    def _hyperplanes(self, dim: int) -> Tuple[List[List[float]], List[float]]:
+        planes = self._planes.get(dim)
+        if planes is None:
+            rows = self.engine.weights(dim, self.bits)
+            planes = self._planes[dim] = (rows, [math.sqrt(sum(w * w for w in row)) for row in rows])
+        return planes
+
+    def _signature(self, vector: tuple) -> Tuple[int, List[Tuple[float, int]]]:
+        """(signature, uncertain bits as (margin, bit)), smallest margins first."""
+        rows, norms = self._hyperplanes(len(vector))
+        signature, uncertain = 0, []
+        for j, (row, norm) in enumerate(zip(rows, norms)):
+            p = sum(x * w for x, w in zip(vector, row))
+            if p >= 0:
+                signature |= 1 << j
+            if abs(p) <= self.epsilon * norm:
+                uncertain.append((abs(p), j))
+        uncertain.sort()
+        return signature, uncertain
+
+    def _probes(self, signature: int, uncertain: List[Tuple[float, int]]):
+        """Signatures to visit: flips of uncertain bits, fewest flips first."""
+        yield signature
+        budget = self.max_probes - 1
+        bits = [j for _, j in uncertain]
+        for k in range(1, len(bits) + 1):
+            for flipped in combinations(bits, k):
+                if budget <= 0:
+                    self.truncated += 1
+                    return
+                mask = 0
+                for j in flipped:
+                    mask |= 1 << j
+                budget -= 1
+                yield signature ^ mask
+
+    def nearest(self, vector: tuple) -> Optional[Tuple[tuple, int, float]]:
+        """(vector, input_hash, distance) of the closest recorded input within epsilon."""
+        self.lookups += 1
+        signature, uncertain = self._signature(vector)
+        dim = len(vector)
+        best, best_distance = None, self.epsilon
+        for probe in self._probes(signature, uncertain):
+            for entry in self.buckets.get((dim, probe), ()):
+                distance = math.dist(entry[0], vector)  # Exact verification
+                if distance <= best_distance:
+                    best, best_distance = entry, distance
+        if best is None:
+            return None
+        return best[0], best[1], best_distance
+
+    def observe_hit(self, distance: float):
+        self.hits += 1
+        self.error_sum += distance
+        if distance > self.max_error:
+            self.max_error = distance
+
+    def add(self, vector: tuple, input_hash: int):
+        signature, _ = self._signature(vector)
+        key = (len(vector), signature)
+        with self._lock:
+            if input_hash & _MASK64 in self._where:
+                return
+            self.buckets.setdefault(key, []).append((vector, input_hash))
+            self._where[input_hash & _MASK64] = key
+            self.entries += 1
+
+    def discard(self, input_hash: int):
+        """Drops the entry of a state that is gone from the law (e.g. evicted)."""
+        low = input_hash & _MASK64  # What a law address keeps of it
+        with self._lock:
+            key = self._where.pop(low, None)
+            if key is None:
+                return
+            bucket = self.buckets[key]
+            bucket[:] = [e for e in bucket if e[1] & _MASK64 != low]
+            if not bucket:
+                del self.buckets[key]
+            self.entries -= 1
+
+    def evicted(self, law: Any, addr: int):
+        """Law eviction hook: addr = (seed ^ input_hash) mod 2^64."""
+        self.discard((addr ^ law.seed) & _MASK64)
+
+    def stats(self) -> dict:
+        return {
+            "epsilon": self.epsilon,
+            "entries": self.entries,
+            "lookups": self.lookups,
+            "approximate_hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "mean_error": self.error_sum / self.hits if self.hits else 0.0,
+            "max_error": self.max_error,
+            "truncated_probes": self.truncated,
+        }
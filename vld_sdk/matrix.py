@@ -30,18 +30,20 @@ class VMatrix:
 
     def project(self, vector: List[float], out_dim: int) -> List[float]:
         """O(D) Projection of an input vector of length d to out_dim."""
-        in_dim = len(vector)
+        return [sum(x * w for x, w in zip(vector, weights))
+                for weights in self.weights(len(vector), out_dim)]
+
+    def weights(self, in_dim: int, out_dim: int) -> List[List[float]]:
+        """The out_dim x in_dim projection rows W used by `project`."""
         scale = 1.0 / math.sqrt(in_dim) if in_dim > 0 else 1.0
-        output = []
+        rows = []
         for j in range(out_dim):
             # Better mix: ensure weights vary independently for each j
             # j_seed provides a unique spectral slice
             j_seed = (self.seed ^ (j * 0xBF58476D)) & 0xFFFFFFFFFFFFFFFF
-            weights = [(self.feistel.project_to_seed(j_seed ^ i) / float(2**128) * 2.0 - 1.0) * scale 
-                       for i in range(in_dim)]
-            val = sum(x * w for x, w in zip(vector, weights))
-            output.append(val)
-        return output
+            rows.append([(self.feistel.project_to_seed(j_seed ^ i) / float(2**128) * 2.0 - 1.0) * scale
+                         for i in range(in_dim)])
+        return rows
 
 # --- G-DYNAMICS: Geometric Symbolic ---
 
@@ -0,0 +1,377 @@
+"""
+VLD-MEMORY: Manifold Budgeting
+Brief: Bounds the resident size of Law manifolds with pluggable eviction policies.
+
+Notation:
+    [Budget] |M| <= B_entries  and  Sum(size(r)) <= B_bytes
+    [GDSF]   H(r) = L + freq(r) * cost(r) / size(r)   (evict min H, L <- H_evicted)
+    [Admit]  cost(r) >= C_min  and  size(r) <= S_max  and  cost(r) / size(r) >= V_min
+"""
+import sys
+import heapq
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+# Containers larger than this are sized from a prefix sample.
+_SIZE_SAMPLE = 64
+
+def estimate_nbytes(obj: Any) -> int:
+    """
+    Cheap, shallow estimate of the resident size of a result.
+    Buffers report their payload; containers add one level of element sizes,
+    extrapolated from a fixed-size sample so the estimate stays O(1).
+    """
+    base = sys.getsizeof(obj)
+    nbytes = getattr(obj, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return max(base, nbytes)
+    if isinstance(obj, (str, bytes, bytearray, int, float)):
+        return base
+    if isinstance(obj, dict):
+        n = len(obj)
+        if n == 0:
+            return base
+        sample = 0
+        for i, (k, v) in enumerate(obj.items()):
+            if i == _SIZE_SAMPLE:
+                break
+            sample += sys.getsizeof(k) + sys.getsizeof(v)
+        return base + sample * n // min(n, _SIZE_SAMPLE)
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        n = len(obj)
+        if n == 0:
+            return base
+        sample = 0
+        for i, item in enumerate(obj):
+            if i == _SIZE_SAMPLE:
+                break
+            sample += sys.getsizeof(item)
+        return base + sample * n // min(n, _SIZE_SAMPLE)
+    return base
+
+class EvictionPolicy:
+    """
+    Orders resident keys for eviction.
+    All operations are O(1) amortized; `evict` pops and returns the victim key.
+    """
+    def admit(self, key: Hashable, size: int, cost: float):
+        raise NotImplementedError
+
+    def touch(self, key: Hashable):
+        raise NotImplementedError
+
+    def evict(self) -> Hashable:
+        raise NotImplementedError
+
+    def discard(self, key: Hashable):
+        raise NotImplementedError
+
+class LRUPolicy(EvictionPolicy):
+    """Least Recently Used: a single recency-ordered dict."""
+    def __init__(self):
+        self._order: 'OrderedDict[Hashable, None]' = OrderedDict()
+
+    def admit(self, key, size, cost):
+        self._order[key] = None
+        self._order.move_to_end(key)
+
+    def touch(self, key):
+        try:
+            self._order.move_to_end(key)
+        except KeyError:
+            pass
+
+    def evict(self):
+        return self._order.popitem(last=False)[0]
+
+    def discard(self, key):
+        self._order.pop(key, None)
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Least Frequently Used with LRU tie-breaking.
+    Keys live in per-frequency recency buckets, so promotion is O(1).
+    """
+    def __init__(self):
+        self._freq: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, 'OrderedDict[Hashable, None]'] = {}
+        self._min = 0
+
+    def _unlink(self, key, f):
+        bucket = self._buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[f]
+
+    def admit(self, key, size, cost):
+        if key in self._freq:
+            self.touch(key)
+            return
+        self._freq[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min = 1
+
+    def touch(self, key):
+        f = self._freq.get(key)
+        if f is None:
+            return
+        self._unlink(key, f)
+        self._freq[key] = f + 1
+        self._buckets.setdefault(f + 1, OrderedDict())[key] = None
+        if self._min == f and f not in self._buckets:
+            self._min = f + 1
+
+    def evict(self):
+        if self._min not in self._buckets:
+            # Only reachable after discards; distinct frequencies are few.
+            self._min = min(self._buckets)
+        bucket = self._buckets[self._min]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min]
+        del self._freq[key]
+        return key
+
+    def discard(self, key):
+        f = self._freq.pop(key, None)
+        if f is not None:
+            self._unlink(key, f)
+
+class ARCPolicy(EvictionPolicy):
+    """
+    Adaptive Replacement Cache (Megiddo & Modha).
+    T1/T2 hold resident keys seen once/repeatedly; B1/B2 are ghost histories
+    that steer the adaptive target p for |T1|.
+    """
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self.p = 0.0
+        self.t1: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self.t2: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self.b1: 'OrderedDict[Hashable, None]' = OrderedDict()
+        self.b2: 'OrderedDict[Hashable, None]' = OrderedDict()
+
+    def _c(self) -> int:
+        return self.capacity or max(1, len(self.t1) + len(self.t2))
+
+    def _trim_ghosts(self):
+        c = self._c()
+        while len(self.b1) > c:
+            self.b1.popitem(last=False)
+        while len(self.b2) > c:
+            self.b2.popitem(last=False)
+
+    def admit(self, key, size, cost):
+        if key in self.t1 or key in self.t2:
+            self.touch(key)
+            return
+        c = self._c()
+        if key in self.b1:
+            self.p = min(float(c), self.p + max(len(self.b2) / len(self.b1), 1.0))
+            del self.b1[key]
+            self.t2[key] = None
+        elif key in self.b2:
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1.0))
+            del self.b2[key]
+            self.t2[key] = None
+        else:
+            self.t1[key] = None
+        self._trim_ghosts()
+
+    def touch(self, key):
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        elif key in self.t2:
+            self.t2.move_to_end(key)
+
+    def evict(self):
+        if self.t1 and (len(self.t1) > self.p or not self.t2):
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+        self._trim_ghosts()
+        return key
+
+    def discard(self, key):
+        self.t1.pop(key, None)
+        self.t2.pop(key, None)
+
+class GDSFPolicy(EvictionPolicy):
+    """
+    Greedy-Dual-Size-Frequency: cost-aware eviction.
+    Equation: H(r) = L + freq(r) * cost(r) / size(r)
+    Touches update H in place; the heap is reconciled lazily on eviction,
+    keeping hits O(1) and evictions O(log n) amortized.
+    """
+    def __init__(self):
+        self.clock = 0.0
+        self._entries: Dict[Hashable, list] = {}  # key -> [H, freq, cost, size, token]
+        self._heap: List[tuple] = []
+        self._token = 0
+
+    def _priority(self, freq: int, cost: float, size: int) -> float:
+        return self.clock + freq * cost / max(size, 1)
+
+    def admit(self, key, size, cost):
+        if key in self._entries:
+            self.touch(key)
+            return
+        self._token += 1
+        h = self._priority(1, cost, size)
+        self._entries[key] = [h, 1, cost, size, self._token]
+        heapq.heappush(self._heap, (h, self._token, key))
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(e[0], e[4], k) for k, e in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def touch(self, key):
+        e = self._entries.get(key)
+        if e is not None:
+            e[1] += 1
+            e[0] = self._priority(e[1], e[2], e[3])
+
+    def evict(self):
+        while True:
+            h, token, key = heapq.heappop(self._heap)
+            e = self._entries.get(key)
+            if e is None or e[4] != token:
+                continue
+            if e[0] != h:
+                heapq.heappush(self._heap, (e[0], token, key))
+                continue
+            del self._entries[key]
+            self.clock = h
+            return key
+
+    def discard(self, key):
+        self._entries.pop(key, None)
+
+POLICIES: Dict[str, Callable[[], EvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "arc": ARCPolicy,
+    "gdsf": GDSFPolicy,
+}
+
+PolicySpec = Union[str, Callable[[], EvictionPolicy]]
+
+def make_policy(spec: PolicySpec) -> EvictionPolicy:
+    """Resolves a policy name ('lru', 'lfu', 'arc', 'gdsf') or factory."""
+    if isinstance(spec, EvictionPolicy):
+        return spec
+    if isinstance(spec, str):
+        try:
+            return POLICIES[spec.lower()]()
+        except KeyError:
+            raise ValueError(f"Unknown eviction policy: {spec!r}") from None
+    return spec()
+
+class ManifoldBudget:
+    """
+    A memory budget over one or more Law manifolds.
+    Keys are (law, addr) pairs, so one budget can arbitrate between laws.
+    Thread-safe: a lock guards the policy. Victims are chosen under it but
+    evicted from their manifolds after it is released, so budgets never
+    hold one another's locks (a global and a per-law budget share states).
+    """
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None,
+                 policy: PolicySpec = "lru"):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy = make_policy(policy)
+        self.entries = 0
+        self.nbytes = 0
+        self.evictions = 0
+        self._sizes: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def _over(self) -> bool:
+        return ((self.max_entries is not None and self.entries > self.max_entries) or
+                (self.max_bytes is not None and self.nbytes > self.max_bytes))
+
+    def charge(self, law, addr: int, size: int, cost: float = 0.0):
+        """Accounts a newly recorded state and evicts until within budget."""
+        key = (law, addr)
+        with self._lock:
+            old = self._sizes.get(key)
+            if old is not None:
+                self.nbytes -= old
+                self.entries -= 1
+                self.policy.discard(key)
+            self._sizes[key] = size
+            self.entries += 1
+            self.nbytes += size
+            self.policy.admit(key, size, cost)
+            victims = []
+            while self._over() and self._sizes:
+                victim = self.policy.evict()
+                self.entries -= 1
+                self.nbytes -= self._sizes.pop(victim)
+                self.evictions += 1
+                victims.append(victim)
+        for victim_law, victim_addr in victims:
+            victim_law._evict(victim_addr)
+
+    def touch(self, law, addr: int):
+        with self._lock:
+            self.policy.touch((law, addr))
+
+    def forget(self, law, addr: int):
+        """Drops accounting for a state removed from its manifold."""
+        key = (law, addr)
+        with self._lock:
+            size = self._sizes.pop(key, None)
+            if size is None:
+                return
+            self.entries -= 1
+            self.nbytes -= size
+            self.policy.discard(key)
+
+class AdmissionPolicy:
+    """
+    Decides whether a freshly computed result enters its Law manifold.
+    Every rule is optional: `min_cost` (seconds of measured compute),
+    `max_result_bytes` (estimated size) and `min_value_per_byte` (seconds of
+    compute a recall saves per byte it keeps resident). Sizes are only
+    estimated when a size rule is set.
+    """
+    def __init__(self, min_cost: Optional[float] = None, max_result_bytes: Optional[int] = None,
+                 min_value_per_byte: Optional[float] = None):
+        self.min_cost = min_cost
+        self.max_result_bytes = max_result_bytes
+        self.min_value_per_byte = min_value_per_byte
+        self.admitted = 0
+        self.rejected = 0
+        self.rejected_bytes = 0
+        self._lock = threading.Lock()
+
+    def admit(self, result: Any, cost: float) -> bool:
+        if self.min_cost is not None and cost < self.min_cost:
+            return self._reject(result)
+        if self.max_result_bytes is not None or self.min_value_per_byte is not None:
+            size = estimate_nbytes(result)
+            if ((self.max_result_bytes is not None and size > self.max_result_bytes) or
+                    (self.min_value_per_byte is not None and cost < self.min_value_per_byte * size)):
+                return self._reject(result, size)
+        with self._lock:
+            self.admitted += 1
+        return True
+
+    def _reject(self, result: Any, size: Optional[int] = None) -> bool:
+        size = estimate_nbytes(result) if size is None else size
+        with self._lock:
+            self.rejected += 1
+            self.rejected_bytes += size
+        return False
+
+    def stats(self) -> dict:
+        return {"admitted": self.admitted, "rejected": self.rejected,
+                "rejected_bytes": self.rejected_bytes}
@@ -0,0 +1,250 @@
+"""
+VLD-PERSISTENCE: Warm-Start Oracle
+Brief: Persists Law seeds and recorded states in SQLite so a restarted
+process recalls previously induced Laws without re-running the ground phase.
+
+Notation:
+    [Store]  laws(name -> seed), states((name, addr) -> pickle5(result))
+    [Recall] Law.execute(h) -> manifold[addr] | SELECT states[name, addr]
+"""
+import atexit
+import pickle
+import sqlite3
+import struct
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .induction import Law, MISS, SharedOracle
+
+_INBAND = b'\x00'
+_OUTOFBAND = b'\x01'
+
+def _to_sql(addr: int) -> int:
+    """Maps an unsigned 64-bit address onto SQLite's signed INTEGER."""
+    return addr - (1 << 64) if addr >= (1 << 63) else addr
+
+def encode_payload(obj: Any, oob_threshold: int = 64 * 1024) -> bytes:
+    """
+    Serializes a result with pickle protocol 5.
+    Buffers of at least `oob_threshold` bytes are taken out-of-band and
+    appended raw, so large arrays are never copied into the pickle stream.
+    Frame: 0x01 | u32 n | u64 len(body), u64 len(buf_i)... | body | buf_0..buf_n-1
+    """
+    buffers: List[pickle.PickleBuffer] = []
+
+    def take(buf: pickle.PickleBuffer):
+        if buf.raw().nbytes < oob_threshold:
+            return True  # Small: serialize in-band
+        buffers.append(buf)
+        return False
+
+    body = pickle.dumps(obj, protocol=5, buffer_callback=take)
+    if not buffers:
+        return _INBAND + body
+    raws = [b.raw() for b in buffers]
+    header = _OUTOFBAND + struct.pack(f'<I{len(raws) + 1}Q', len(raws), len(body),
+                                      *(r.nbytes for r in raws))
+    return b''.join([header, body, *raws])
+
+def decode_payload(blob: bytes) -> Any:
+    """Inverse of encode_payload; out-of-band buffers are views on the blob."""
+    view = memoryview(blob)
+    if view[:1] == _INBAND:
+        return pickle.loads(view[1:])
+    (n,) = struct.unpack_from('<I', view, 1)
+    lengths = struct.unpack_from(f'<{n + 1}Q', view, 5)
+    offset = 5 + 8 * (n + 1)
+    body = view[offset:offset + lengths[0]]
+    offset += lengths[0]
+    buffers = []
+    for length in lengths[1:]:
+        buffers.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(body, buffers=buffers)
+
+class SQLiteOracle(SharedOracle):
+    """
+    A persistent SharedOracle on stdlib sqlite3.
+    - Laws are loaded lazily by name; states are read through on a manifold miss.
+    - Writes are buffered and flushed as one transaction (group commit) every
+      `batch_size` states or `flush_interval` seconds, and on close/exit.
+    - Misses are screened by a per-law Bloom filter (see filters.py), so
+      inputs never recorded skip the SELECT. It is built in the background
+      from a paged scan, and rebuilt when another connection has committed
+      to the file (checked every `filter_refresh` seconds); until then,
+      states written by sibling processes may be recomputed.
+    """
+    filtered = True
+    filter_refresh = 1.0
+
+    def __init__(self, path: str, batch_size: int = 256, flush_interval: float = 1.0,
+                 oob_threshold: int = 64 * 1024):
+        super().__init__()
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.oob_threshold = oob_threshold
+        self._lock = threading.RLock()
+        self._pending: Dict[Tuple[str, int], bytes] = {}
+        self._last_flush = time.monotonic()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS laws (name TEXT PRIMARY KEY, seed TEXT NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS states (law TEXT NOT NULL, addr INTEGER NOT NULL, "
+            "payload BLOB NOT NULL, PRIMARY KEY (law, addr)) WITHOUT ROWID")
+        atexit.register(self.close)
+
+    def publish(self, law: Law) -> Law:
+        with self._lock:
+            existing = self._laws.get(law.name)
+            if existing is not None:
+                return existing
+            self._laws[law.name] = law
+            law.backend = self
+            self._conn.execute("INSERT OR IGNORE INTO laws (name, seed) VALUES (?, ?)",
+                               (law.name, format(law.seed, 'x')))
+            for addr, result in law.manifold.items():
+                self._pending[(law.name, addr)] = encode_payload(result, self.oob_threshold)
+            self._maybe_flush()
+            return law
+
+    def get(self, name: str) -> Optional[Law]:
+        law = self._laws.get(name)
+        if law is not None:
+            return law
+        with self._lock:
+            row = self._conn.execute("SELECT seed FROM laws WHERE name = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            law = self._laws.get(name)
+            if law is None:
+                law = Law.restore(name, int(row[0], 16))
+                law.backend = self
+                self._laws[name] = law
+            return law
+
+    def load(self, law: Law, addr: int) -> Any:
+        with self._lock:
+            blob = self._pending.get((law.name, addr))
+            if blob is None:
+                row = self._conn.execute("SELECT payload FROM states WHERE law = ? AND addr = ?",
+                                         (law.name, _to_sql(addr))).fetchone()
+                if row is None:
+                    return MISS
+                blob = row[0]
+        return decode_payload(blob)
+
+    def names(self) -> List[str]:
+        with self._lock:
+            stored = [row[0] for row in self._conn.execute("SELECT name FROM laws")]
+        return sorted(set(stored) | set(self._laws))
+
+    def states(self, law: Law):
+        self.flush()
+        with self._lock:
+            rows = self._conn.execute("SELECT addr, payload FROM states WHERE law = ?",
+                                      (law.name,)).fetchall()
+        return [(addr & 0xFFFFFFFFFFFFFFFF, decode_payload(blob)) for addr, blob in rows]
+
+    def addresses(self, law: Law) -> '_AddressScan':
+        return _AddressScan(self, law.name)
+
+    def generation(self) -> Optional[int]:
+        """Changes whenever another connection (e.g. a sibling process) commits to the file."""
+        with self._lock:
+            if self._conn is None:
+                return None
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def store(self, law: Law, addr: int, result: Any):
+        blob = encode_payload(result, self.oob_threshold)
+        with self._lock:
+            self._pending[(law.name, addr)] = blob
+            self._maybe_flush()
+
+    def _maybe_flush(self):
+        if (len(self._pending) >= self.batch_size or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Commits all buffered states in a single transaction."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._pending or self._conn is None:
+                return
+            rows = [(name, _to_sql(addr), blob) for (name, addr), blob in self._pending.items()]
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO states (law, addr, payload) VALUES (?, ?, ?)", rows)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self._pending.clear()
+
+    def close(self):
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush()
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of persisted states (after flushing buffered writes)."""
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM states").fetchone()[0]
+
+class _AddressScan:
+    """
+    The addresses of one law, read in primary-key pages so that no more
+    than `page` are held at once; len() counts them. Buffered writes are
+    included without flushing them (group commit is left to its schedule).
+    """
+    def __init__(self, oracle: SQLiteOracle, name: str, page: int = 1 << 13):
+        self.oracle = oracle
+        self.name = name
+        self.page = page
+
+    def _pending(self) -> List[int]:
+        return [addr for name, addr in list(self.oracle._pending) if name == self.name]
+
+    def __len__(self) -> int:
+        oracle = self.oracle
+        with oracle._lock:
+            if oracle._conn is None:
+                return 0
+            return len(self._pending()) + oracle._conn.execute(
+                "SELECT COUNT(*) FROM states WHERE law = ?", (self.name,)).fetchone()[0]
+
+    def __iter__(self) -> Iterator[int]:
+        oracle = self.oracle
+        with oracle._lock:
+            pending = self._pending()
+        yield from pending  # A state flushed meanwhile is also read from its page
+        low = -(1 << 63)
+        while True:
+            with oracle._lock:  # Per page: other threads' queries interleave
+                if oracle._conn is None:
+                    return
+                rows = oracle._conn.execute(
+                    "SELECT addr FROM states WHERE law = ? AND addr >= ? ORDER BY addr LIMIT ?",
+                    (self.name, low, self.page)).fetchall()
+            for (addr,) in rows:
+                yield addr & 0xFFFFFFFFFFFFFFFF
+            if len(rows) < self.page or rows[-1][0] == (1 << 63) - 1:
+                return
+            low = rows[-1][0] + 1
@@ -0,0 +1,174 @@
+"""
+VLD-REDUCTION: Segment-Tree Induction
+Brief: Memoizes associative folds chunk by chunk, so an input that overlaps
+a previous one only computes its unseen chunks and recombines cached partials.
+
+Notation:
+    [Leaf]    P(c) = leaf(c),  key(c) = H(c)                 (chunk c of the input)
+    [Node]    P(l, r) = combine(P(l), P(r)),  key = H(key(l) || key(r))
+    [Recall]  reduce(x) = finalize(P(root)), evaluated top-down: a recalled node
+              prunes its subtree, so k new chunks cost O(k log n) combines
+"""
+import array
+import functools
+import hashlib
+import sys
+from typing import Any, Callable, List, Optional, Tuple
+
+from .core import DeterministicHasher
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - pure-Python boundary scan
+    np = None
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN = 0x9E3779B97F4A7C15
+_NO_IDENTITY = object()
+_NUMBERS = frozenset((int, float, bool))
+_INTS = frozenset((int,))
+
+def _element_hash(x: Any) -> int:
+    """Signed 64-bit hash of one element, stable across processes (hash() salts str/bytes)."""
+    t = type(x)
+    if t is int or t is float or t is bool:
+        return hash(x)  # Unsalted, and within int64
+    if t is str:
+        x = x.encode('utf-8', 'surrogatepass')
+    elif t is not bytes:
+        x = DeterministicHasher.hash_data(x).to_bytes(32, 'big')
+    return int.from_bytes(hashlib.blake2b(x, digest_size=8).digest(), 'little', signed=True)
+
+def _int64_view(sequence: Any) -> Optional[memoryview]:
+    """Little-endian int64 view of a list of plain ints, else None."""
+    if type(sequence) is not list or not _INTS.issuperset(map(type, sequence)):
+        return None
+    try:
+        packed = array.array('q', sequence)
+    except OverflowError:
+        return None
+    if sys.byteorder != 'little':
+        packed.byteswap()
+    return memoryview(packed)  # Sliced by element
+
+class _Node:
+    __slots__ = ('key', 'lo', 'hi', 'left', 'right')
+
+    def __init__(self, key: int, lo: int, hi: int,
+                 left: Optional['_Node'] = None, right: Optional['_Node'] = None):
+        self.key = key
+        self.lo = lo
+        self.hi = hi
+        self.left = left
+        self.right = right
+
+class Reduction:
+    """
+    An associative fold registered on a VirtualLayer.
+    - `combine(a, b)` merges two partials; it must be associative (it need
+      not be commutative: partials are always combined in input order).
+    - `leaf(chunk)` folds one chunk into a partial (default: reduce with
+      `combine`, i.e. elements are partials themselves).
+    - `chunk_size` is the (target) number of elements per chunk. With
+      `content_defined`, chunk boundaries follow element values instead of
+      positions, so insertions and deletions only disturb nearby chunks.
+    - `finalize(partial)` maps the root partial to the result.
+    """
+    def __init__(self, combine: Callable[[Any, Any], Any], leaf: Optional[Callable] = None,
+                 chunk_size: int = 1024, identity: Any = _NO_IDENTITY,
+                 finalize: Optional[Callable] = None, content_defined: bool = False):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.combine = combine
+        self.leaf = leaf if leaf is not None else functools.partial(functools.reduce, combine)
+        self.chunk_size = chunk_size
+        self.identity = identity
+        self.finalize = finalize
+        self.content_defined = content_defined
+        # Content-defined cut after x: the top `bits` of h(x) * phi64 are 0
+        self._bits = max(0, chunk_size.bit_length() - 1)
+
+    def boundaries(self, sequence: Any) -> List[int]:
+        """Chunk end offsets (exclusive) covering `sequence`."""
+        n = len(sequence)
+        size = self.chunk_size
+        if not self.content_defined or size == 1:
+            return list(range(size, n, size)) + [n]
+        elements = sequence.tolist() if hasattr(sequence, 'tolist') else sequence
+        # hash() is only stable across processes for numbers (str/bytes are salted)
+        element_hash = hash if _NUMBERS.issuperset(map(type, elements)) else _element_hash
+        shift = 64 - self._bits
+        if np is not None:
+            hashes = np.fromiter(map(element_hash, elements), dtype=np.int64, count=n).view(np.uint64)
+            mixed = (hashes * np.uint64(_GOLDEN)) >> np.uint64(shift)
+            cuts = (np.flatnonzero(mixed == 0) + 1).tolist()
+        else:
+            threshold = 1 << shift
+            cuts = [i for i, h in enumerate(map(element_hash, elements), 1)
+                    if (h * _GOLDEN) & _MASK64 < threshold]
+        low, high = max(1, size // 4), size * 4
+        ends, start = [], 0
+        for cut in cuts + [n]:
+            while cut - start > high:
+                start += high
+                ends.append(start)
+            if cut - start >= low or cut == n:
+                ends.append(cut)
+                start = cut
+        return ends
+
+    def build(self, sequence: Any) -> _Node:
+        """Balanced tree over the chunks (a lone node at a level moves up as is)."""
+        level, lo = [], 0
+        ints = _int64_view(sequence)
+        for hi in self.boundaries(sequence):
+            if ints is None:
+                key = DeterministicHasher.hash_data(sequence[lo:hi])
+            else:  # Int lists: hash the packed chunk (its own domain) instead of its repr
+                digest = hashlib.blake2b(ints[lo:hi], digest_size=32, person=b'vld-int-chunk').digest()
+                key = int.from_bytes(digest, 'big')
+            level.append(_Node(key, lo, hi))
+            lo = hi
+        while len(level) > 1:
+            paired = [_Node(_join(a.key, b.key), a.lo, b.hi, a, b)
+                      for a, b in zip(level[0::2], level[1::2])]
+            if len(level) % 2:
+                paired.append(level[-1])
+            level = paired
+        return level[0]
+
+    def evaluate(self, law: Any, sequence: Any) -> Tuple[Any, int, int]:
+        """(result, recalled nodes, computed leaves) for one input."""
+        if not isinstance(sequence, (list, tuple)) and not hasattr(sequence, 'dtype'):
+            sequence = list(sequence)
+        if not len(sequence):
+            if self.identity is _NO_IDENTITY:
+                raise TypeError("reduction of an empty sequence with no identity")
+            return self._finish(self.identity), 0, 0
+        from .induction import MISS
+        counts = [0, 0]
+
+        def partial(node: _Node) -> Any:
+            result = law.execute(node.key)
+            if result is not MISS:
+                counts[0] += 1
+                return result
+            if node.left is None:
+                counts[1] += 1
+                result = self.leaf(sequence[node.lo:node.hi])
+            else:
+                result = self.combine(partial(node.left), partial(node.right))
+            law.record(node.key, result)
+            return result
+
+        return self._finish(partial(self.build(sequence))), counts[0], counts[1]
+
+    def _finish(self, partial: Any) -> Any:
+        return partial if self.finalize is None else self.finalize(partial)
+
+def _join(left: int, right: int) -> int:
+    """Key of an internal node (domain-separated from chunk hashes)."""
+    h = hashlib.blake2b(digest_size=32, person=b'vld-segment')
+    h.update(left.to_bytes(32, 'big'))
+    h.update(right.to_bytes(32, 'big'))
+    return int.from_bytes(h.digest(), 'big')
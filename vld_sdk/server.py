@@ -0,0 +1,515 @@
+"""
+VLD-SERVER: Networked Oracle
+Brief: Shares induced laws between processes and hosts through one oracle
+service, over a compact binary protocol on TCP or a Unix socket, with
+batched multi-get/multi-put, request pipelining and pooled connections.
+
+Notation:
+    [Frame]    u32 length | u8 op (status in replies) | u32 id | body   (little-endian)
+    [Name]     u16 n | utf8[n]               [Seed] u8 n | big-endian[n]
+    [MGET]     name | u32 k | u64[k] addr  ->  u32[k] len (MISSING = absent) | payloads
+    [MPUT]     name | u32 k | u64[k] addr | u32[k] len | payloads  ->  u32 stored
+    [KEYS]     name  ->  u32 k | u64[k] addr          [MDEL] name | u32 k | u64[k] addr  ->  u32 removed
+    [Pipeline] a connection carries many requests in flight; replies come in order
+"""
+import asyncio
+import atexit
+import ipaddress
+import itertools
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .induction import Law, MISS, SharedOracle, VirtualLayer
+from .persistence import decode_payload, encode_payload
+from .static import _state
+
+_FRAME = struct.Struct('<IBI')
+_COUNT = struct.Struct('<I')
+_NAME = struct.Struct('<H')
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+MISSING = 0xFFFFFFFF
+
+OP_LAW, OP_PUBLISH, OP_MGET, OP_MPUT, OP_NAMES, OP_KEYS, OP_MDEL = 1, 2, 3, 4, 5, 6, 7
+_OK, _ERROR = 0, 1
+
+Address = Union[str, Tuple[str, int]]  # Unix socket path, or (host, port)
+
+class OracleServerError(RuntimeError):
+    """A request the server rejected (the message is the server's error)."""
+
+def _pack_name(name: str) -> bytes:
+    raw = name.encode()
+    return _NAME.pack(len(raw)) + raw
+
+def _unpack_name(body: memoryview, offset: int = 0) -> Tuple[str, int]:
+    (n,) = _NAME.unpack_from(body, offset)
+    offset += _NAME.size
+    return bytes(body[offset:offset + n]).decode(), offset + n
+
+def _pack_seed(seed: int) -> bytes:
+    raw = seed.to_bytes(max(1, (seed.bit_length() + 7) // 8), 'big')
+    return bytes([len(raw)]) + raw
+
+def _unpack_seed(body: memoryview, offset: int = 0) -> int:
+    n = body[offset]
+    return int.from_bytes(body[offset + 1:offset + 1 + n], 'big')
+
+def _pack_addrs(name: str, addrs: List[int]) -> bytes:
+    return b''.join([_pack_name(name), _COUNT.pack(len(addrs)), struct.pack(f'<{len(addrs)}Q', *addrs)])
+
+def _pack_states(addrs: List[int], blobs: List[bytes]) -> bytes:
+    k = len(addrs)
+    return b''.join([_COUNT.pack(k), struct.pack(f'<{k}Q', *addrs),
+                     struct.pack(f'<{k}I', *map(len, blobs)), *blobs])
+
+def _unpack_blobs(body: memoryview, offset: int, k: int) -> List[Optional[memoryview]]:
+    lengths = struct.unpack_from(f'<{k}I', body, offset)
+    offset += 4 * k
+    out = []
+    for n in lengths:
+        if n == MISSING:
+            out.append(None)
+        else:
+            out.append(body[offset:offset + n])
+            offset += n
+    return out
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # A hostname, or "" (every interface)
+
+# --- Server ---
+
+class OracleServer:
+    """
+    Serves an oracle (default: VirtualLayer.ORACLE) to other processes.
+    - `path` selects a Unix socket, else TCP on (`host`, `port`); port 0
+      picks a free port (see `address` once started).
+    - Connections are handled on one asyncio loop in a background thread.
+      Requests on a connection may be pipelined; they are answered in order.
+    - Backing the server with a SQLiteOracle makes the service persistent.
+    - Written states are pickles, unpickled on arrival: anyone who can reach
+      the socket can run code as the server. Serve trusted clients only.
+      Binding TCP beyond loopback requires `allow_remote=True`.
+    """
+    def __init__(self, oracle: Optional[SharedOracle] = None, host: str = "127.0.0.1",
+                 port: int = 0, path: Optional[str] = None, allow_remote: bool = False):
+        if path is None and not allow_remote and not _is_loopback(host):
+            raise ValueError(f"Refusing to serve pickles on {host!r}: bind to loopback or a "
+                             "Unix socket, or pass allow_remote=True for trusted networks")
+        self.oracle = oracle if oracle is not None else VirtualLayer.ORACLE
+        self.host = host
+        self.port = port
+        self.path = path
+        self.address: Optional[Address] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self.connections = 0
+        self.requests = 0
+        self.keys_read = 0
+        self.keys_written = 0
+
+    def start(self) -> 'OracleServer':
+        ready = threading.Event()
+        errors: List[BaseException] = []
+
+        def run():
+            loop = self._loop = asyncio.new_event_loop()
+            try:
+                if self.path is not None:
+                    server = loop.create_unix_server(lambda: _Session(self), path=self.path)
+                else:
+                    server = loop.create_server(lambda: _Session(self), self.host, self.port)
+                self._server = loop.run_until_complete(server)
+                if self.path is not None:
+                    self.address = self.path
+                else:
+                    self.address = self._server.sockets[0].getsockname()[:2]
+            except BaseException as exc:
+                errors.append(exc)
+                ready.set()
+                loop.close()
+                return
+            ready.set()
+            loop.run_forever()
+            self._server.close()
+            loop.run_until_complete(self._server.wait_closed())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="vld-oracle-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+        return self
+
+    def stop(self):
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = self._thread = None
+
+    def __enter__(self) -> 'OracleServer':
+        return self.start() if self._thread is None else self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> dict:
+        return {"connections": self.connections, "requests": self.requests,
+                "keys_read": self.keys_read, "keys_written": self.keys_written}
+
+    def _respond(self, op: int, rid: int, body: memoryview) -> bytes:
+        self.requests += 1
+        try:
+            status, reply = _OK, self._dispatch(op, body)
+        except Exception as exc:
+            status, reply = _ERROR, f"{type(exc).__name__}: {exc}".encode()
+        return _FRAME.pack(len(reply), status, rid) + reply
+
+    def _dispatch(self, op: int, body: memoryview) -> bytes:
+        oracle = self.oracle
+        if op == OP_MGET:
+            name, offset = _unpack_name(body)
+            (k,) = _COUNT.unpack_from(body, offset)
+            addrs = struct.unpack_from(f'<{k}Q', body, offset + 4)
+            law = oracle.get(name)
+            blobs = [MISS] * k if law is None else [self._lookup(law, addr) for addr in addrs]
+            self.keys_read += k
+            lengths = [MISSING if b is MISS else len(b) for b in blobs]
+            return b''.join([struct.pack(f'<{k}I', *lengths), *(b for b in blobs if b is not MISS)])
+        if op == OP_MPUT:
+            name, offset = _unpack_name(body)
+            law = oracle.get(name)
+            if law is None:
+                raise KeyError(f"Unknown law: {name!r}")
+            (k,) = _COUNT.unpack_from(body, offset)
+            addrs = struct.unpack_from(f'<{k}Q', body, offset + 4)
+            for addr, blob in zip(addrs, _unpack_blobs(body, offset + 4 + 8 * k, k)):
+                law.record((addr ^ law.seed) & _MASK64, decode_payload(bytes(blob)))
+            self.keys_written += k
+            return _COUNT.pack(k)
+        if op == OP_LAW:
+            law = oracle.get(_unpack_name(body)[0])
+            return b'' if law is None else _pack_seed(law.seed)
+        if op == OP_PUBLISH:
+            name, offset = _unpack_name(body)
+            law = oracle.get(name) or oracle.publish(Law.restore(name, _unpack_seed(body, offset)))
+            return _pack_seed(law.seed)
+        if op == OP_NAMES:
+            return b''.join(_pack_name(name) for name in oracle.names())
+        if op == OP_KEYS:
+            law = oracle.get(_unpack_name(body)[0])
+            addrs = [] if law is None else [addr for addr, value in oracle.states(law)
+                                            if _state(value) is not MISS]
+            return _COUNT.pack(len(addrs)) + struct.pack(f'<{len(addrs)}Q', *addrs)
+        if op == OP_MDEL:
+            name, offset = _unpack_name(body)
+            law = oracle.get(name)
+            (k,) = _COUNT.unpack_from(body, offset)
+            removed = 0
+            if law is not None:
+                for addr in struct.unpack_from(f'<{k}Q', body, offset + 4):
+                    if addr in law.manifold:
+                        law._evict(addr)
+                        removed += 1
+            return _COUNT.pack(removed)
+        raise ValueError(f"Unknown op: {op}")
+
+    @staticmethod
+    def _lookup(law: Law, addr: int) -> Any:
+        """Encoded state at `addr`, or MISS (cached failures are not served)."""
+        value = law.manifold.get(addr, MISS)
+        if value is MISS and law.backend is not None:
+            value = law.backend.load(law, addr)
+        if value is not MISS:
+            value = _state(value)
+        return value if value is MISS else encode_payload(value)
+
+class _Session(asyncio.Protocol):
+    """
+    One client connection. Every complete frame in a read is answered, and
+    the replies go out in one write: pipelined requests share syscalls.
+    """
+    def __init__(self, server: OracleServer):
+        self.server = server
+        self.buffer = bytearray()
+        self.transport: Optional[asyncio.Transport] = None
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transport = transport
+        self.server.connections += 1
+        sock = transport.get_extra_info('socket')
+        if sock is not None and sock.family != socket.AF_UNIX:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def data_received(self, data: bytes):
+        buffer = self.buffer
+        buffer += data
+        replies, offset = [], 0
+        while len(buffer) - offset >= _FRAME.size:
+            length, op, rid = _FRAME.unpack_from(buffer, offset)
+            end = offset + _FRAME.size + length
+            if len(buffer) < end:
+                break
+            body = memoryview(bytes(buffer[offset + _FRAME.size:end]))
+            replies.append(self.server._respond(op, rid, body))
+            offset = end
+        del buffer[:offset]
+        if replies:
+            self.transport.write(b''.join(replies))
+
+    # Backpressure: stop reading requests while replies are not drained
+    def pause_writing(self):
+        self.transport.pause_reading()
+
+    def resume_writing(self):
+        self.transport.resume_reading()
+
+# --- Client ---
+
+class _Connection:
+    """One socket with pipelined requests: replies are matched by id."""
+    def __init__(self, address: Address):
+        if isinstance(address, str):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(address)
+        else:
+            self.sock = socket.create_connection(tuple(address))
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._closed = False
+        self._reader = threading.Thread(target=self._read, name="vld-oracle-client", daemon=True)
+        self._reader.start()
+
+    def submit(self, op: int, body: bytes) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise ConnectionError("Oracle connection is closed")
+            rid = next(self._ids) & 0xFFFFFFFF
+            self._pending[rid] = future
+            self.sock.sendall(_FRAME.pack(len(body), op, rid) + body)
+        return future
+
+    def _read(self):
+        stream = self.sock.makefile('rb')
+        error: BaseException = ConnectionError("Oracle connection closed")
+        try:
+            while True:
+                head = stream.read(_FRAME.size)
+                if len(head) < _FRAME.size:
+                    break
+                length, status, rid = _FRAME.unpack(head)
+                body = stream.read(length) if length else b''
+                future = self._pending.pop(rid, None)
+                if future is None:
+                    continue
+                if status == _OK:
+                    future.set_result(body)
+                else:
+                    future.set_exception(OracleServerError(body.decode()))
+        except (OSError, ValueError) as exc:
+            error = exc
+        finally:
+            with self._lock:
+                self._closed = True
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(error)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self._reader.join()
+
+class RemoteOracle(SharedOracle):
+    """
+    Drop-in SharedOracle client for an OracleServer: assign it to
+    VirtualLayer.ORACLE (or pass `oracle=`) to share laws across hosts.
+    - Misses are read through with MGET; Law.execute_many (and run_many)
+      batches all misses of a call into one request.
+    - Recorded states are buffered and sent as pipelined MPUTs every
+      `batch_size` states or `flush_interval` seconds, and on flush/close.
+    - Requests are spread over a pool of `pool_size` connections; threads
+      sharing the client pipeline their requests on them.
+    - Misses are screened by a per-law Bloom filter over the server's keys,
+      rebuilt in the background every `filter_refresh` seconds (or ten
+      build times, if longer) to pick up other hosts' writes.
+    """
+    filtered = True
+    filter_refresh = 5.0
+
+    def __init__(self, address: Address, pool_size: int = 4, batch_size: int = 256,
+                 flush_interval: float = 1.0, timeout: float = 30.0):
+        super().__init__()
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        self.address = address
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self._pool = [_Connection(address) for _ in range(pool_size)]
+        self._turn = itertools.count()
+        self._pending: Dict[Tuple[str, int], bytes] = {}
+        self._pending_lock = threading.Lock()
+        self._inflight: List[Future] = []
+        self._last_flush = time.monotonic()
+        self.requests = 0
+        self.keys_requested = 0
+        atexit.register(self.close)
+
+    def _submit(self, op: int, body: bytes) -> Future:
+        self.requests += 1
+        return self._pool[next(self._turn) % len(self._pool)].submit(op, body)
+
+    def _call(self, op: int, body: bytes) -> memoryview:
+        return memoryview(self._submit(op, body).result(self.timeout))
+
+    def publish(self, law: Law) -> Law:
+        with self._lock:
+            existing = self._laws.get(law.name)
+            if existing is not None:
+                return existing
+            seed = _unpack_seed(self._call(OP_PUBLISH, _pack_name(law.name) + _pack_seed(law.seed)))
+            if seed != law.seed:
+                law = Law.restore(law.name, seed)  # Another host published it first
+            law.backend = self
+            self._laws[law.name] = law
+        for addr, result in list(law.manifold.items()):
+            self.store(law, addr, result)
+        return law
+
+    def get(self, name: str) -> Optional[Law]:
+        law = self._laws.get(name)
+        if law is not None:
+            return law
+        reply = self._call(OP_LAW, _pack_name(name))
+        if not len(reply):
+            return None
+        with self._lock:
+            law = self._laws.get(name)
+            if law is None:
+                law = Law.restore(name, _unpack_seed(reply))
+                law.backend = self
+                self._laws[name] = law
+            return law
+
+    def load(self, law: Law, addr: int) -> Any:
+        return self.load_many(law, [addr])[0]
+
+    def load_many(self, law: Law, addrs: List[int]) -> List[Any]:
+        return self.submit_many(law, addrs)()
+
+    def submit_many(self, law: Law, addrs: List[int]) -> Callable[[], List[Any]]:
+        """Sends a multi-get without waiting; the returned callable gathers its results."""
+        out: List[Any] = [MISS] * len(addrs)
+        ask, where = [], []
+        with self._pending_lock:
+            for i, addr in enumerate(addrs):
+                blob = self._pending.get((law.name, addr))
+                if blob is not None:
+                    out[i] = decode_payload(blob)  # Not yet flushed: read our own write
+                else:
+                    ask.append(addr)
+                    where.append(i)
+        if not ask:
+            return lambda: out
+        self.keys_requested += len(ask)
+        future = self._submit(OP_MGET, _pack_addrs(law.name, ask))
+
+        def gather() -> List[Any]:
+            reply = memoryview(future.result(self.timeout))
+            for i, blob in zip(where, _unpack_blobs(reply, 0, len(ask))):
+                if blob is not None:
+                    out[i] = decode_payload(bytes(blob))
+            return out
+        return gather
+
+    def keys(self, law: Law) -> List[int]:
+        """Addresses of all states the server holds for `law` (after a flush)."""
+        self.flush()
+        reply = self._call(OP_KEYS, _pack_name(law.name))
+        (k,) = _COUNT.unpack_from(reply, 0)
+        return list(struct.unpack_from(f'<{k}Q', reply, 4))
+
+    def addresses(self, law: Law) -> List[int]:
+        return self.keys(law)
+
+    def delete_many(self, law: Law, addrs: List[int]) -> int:
+        """Drops states from the server's resident manifold; returns how many were held."""
+        with self._pending_lock:
+            for addr in addrs:
+                self._pending.pop((law.name, addr), None)
+        return _COUNT.unpack(self._call(OP_MDEL, _pack_addrs(law.name, addrs)))[0]
+
+    def store(self, law: Law, addr: int, result: Any):
+        blob = encode_payload(result)
+        with self._pending_lock:
+            self._pending[(law.name, addr)] = blob
+            due = (len(self._pending) >= self.batch_size or
+                   time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush(wait=False)
+
+    def flush(self, wait: bool = True):
+        """Sends buffered states (one MPUT per law); `wait` blocks until all are stored."""
+        with self._pending_lock:
+            self._last_flush = time.monotonic()
+            pending, self._pending = self._pending, {}
+        by_law: Dict[str, Tuple[List[int], List[bytes]]] = {}
+        for (name, addr), blob in pending.items():
+            addrs, blobs = by_law.setdefault(name, ([], []))
+            addrs.append(addr)
+            blobs.append(blob)
+        sent = [self._submit(OP_MPUT, _pack_name(name) + _pack_states(addrs, blobs))
+                for name, (addrs, blobs) in by_law.items()]
+        with self._pending_lock:
+            # Keep puts still in flight, and failed ones until a waiting flush reports them
+            self._inflight = [f for f in self._inflight
+                              if not f.done() or f.exception() is not None] + sent
+            if not wait:
+                return
+            inflight, self._inflight = self._inflight, []
+        for future in inflight:
+            future.result(self.timeout)
+
+    def names(self) -> List[str]:
+        reply, offset, names = self._call(OP_NAMES, b''), 0, set(self._laws)
+        while offset < len(reply):
+            name, offset = _unpack_name(reply, offset)
+            names.add(name)
+        return sorted(names)
+
+    def close(self):
+        if self._pool is None:
+            return
+        try:
+            self.flush()
+        finally:
+            for conn in self._pool:
+                conn.close()
+            self._pool = None
+            atexit.unregister(self.close)
+
+    def __enter__(self) -> 'RemoteOracle':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
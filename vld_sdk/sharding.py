@@ -0,0 +1,256 @@
+"""
+VLD-SHARDING: Consistent-Hash Oracle
+Brief: Spreads a law's states over N oracle server processes: each address
+is owned by one shard on a hash ring with virtual nodes, so adding or
+removing a shard moves only ~1/N of the states.
+
+Notation:
+    [Ring]    points = { mix(H(shard, v)) : v < vnodes }  per shard, sorted
+    [Owner]   owner(a) = shard of the first point >= mix(a)   (wrapping around)
+    [Move]    |{a : owner changes}| ~ |A| / N  on adding or removing one shard
+    [Scatter] load_many(A): one multi-get per shard, all in flight, gathered in order
+"""
+import bisect
+import hashlib
+import multiprocessing
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .induction import Law, MISS, SharedOracle
+from .server import Address, OracleServer, RemoteOracle
+from .shm import _mix
+
+_MIGRATE_BATCH = 4096
+
+class HashRing:
+    """Consistent-hash ring over shard ids, `vnodes` points per shard."""
+    def __init__(self, vnodes: int = 128):
+        if vnodes < 1:
+            raise ValueError("vnodes must be >= 1")
+        self.vnodes = vnodes
+        self._points: List[int] = []
+        self._owners: List[str] = []
+
+    @staticmethod
+    def _point(shard: str, v: int) -> int:
+        digest = hashlib.blake2b(f"{shard}#{v}".encode(), digest_size=8, person=b'vld-ring').digest()
+        return int.from_bytes(digest, 'big')
+
+    @property
+    def shards(self) -> List[str]:
+        return sorted(set(self._owners))
+
+    def add(self, shard: str):
+        if shard in self._owners:
+            return
+        for v in range(self.vnodes):
+            point = self._point(shard, v)
+            i = bisect.bisect_left(self._points, point)
+            self._points.insert(i, point)
+            self._owners.insert(i, shard)
+
+    def remove(self, shard: str):
+        kept = [(p, s) for p, s in zip(self._points, self._owners) if s != shard]
+        self._points = [p for p, _ in kept]
+        self._owners = [s for _, s in kept]
+
+    def owner(self, key: int) -> str:
+        if not self._points:
+            raise LookupError("The ring has no shards")
+        i = bisect.bisect_left(self._points, _mix(key))
+        return self._owners[i if i < len(self._points) else 0]
+
+    def owners(self, keys: List[int]) -> List[str]:
+        return [self.owner(key) for key in keys]
+
+def _serve_shard(queue: Any, path: Optional[str]):
+    server = OracleServer(SharedOracle(), path=path).start()
+    queue.put(server.address)
+    threading.Event().wait()  # Until terminated
+
+class ShardedOracle(SharedOracle):
+    """
+    SharedOracle over oracle servers (see server.py), one per shard.
+    - Laws are published on every shard; each state lives on the shard
+      owning its address.
+    - Reads and writes go to the owner through a RemoteOracle client
+      (writes buffered there); load_many scatters one multi-get per shard
+      and gathers the results in input order.
+    - add_shard/remove_shard change the ring and migrate exactly the
+      states whose owner changed.
+    - `spawn(n)` starts n local shard processes owned by this oracle.
+    - Misses are screened by a per-law Bloom filter over all shards' keys.
+    """
+    filtered = True
+    filter_refresh = RemoteOracle.filter_refresh
+
+    def __init__(self, addresses: List[Address] = (), vnodes: int = 128, **client_options):
+        super().__init__()
+        self.ring = HashRing(vnodes)
+        self.client_options = client_options
+        self.shards: Dict[str, RemoteOracle] = {}
+        self._processes: Dict[str, multiprocessing.Process] = {}
+        self.moved = 0  # States migrated by ring changes
+        for address in addresses:
+            self._connect(address)
+
+    @classmethod
+    def spawn(cls, n: int, vnodes: int = 128, **client_options) -> 'ShardedOracle':
+        oracle = cls(vnodes=vnodes, **client_options)
+        for _ in range(n):
+            oracle.add_shard()
+        return oracle
+
+    @staticmethod
+    def _id(address: Address) -> str:
+        return address if isinstance(address, str) else f"{address[0]}:{address[1]}"
+
+    def _connect(self, address: Address) -> str:
+        shard = self._id(address)
+        if shard not in self.shards:
+            self.shards[shard] = RemoteOracle(address, **self.client_options)
+            self.ring.add(shard)
+        return shard
+
+    def _start_process(self) -> Address:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_serve_shard, args=(queue, None), daemon=True)
+        process.start()
+        address = queue.get(timeout=30)
+        self._processes[self._id(address)] = process
+        return address
+
+    # --- Routing ---
+
+    def _client(self, addr: int) -> RemoteOracle:
+        return self.shards[self.ring.owner(addr)]
+
+    def publish(self, law: Law) -> Law:
+        with self._lock:
+            existing = self._laws.get(law.name)
+            if existing is not None:
+                return existing
+            for client in self.shards.values():
+                canonical = client.publish(Law.restore(law.name, law.seed))
+                if canonical.seed != law.seed:
+                    law = Law.restore(law.name, canonical.seed)
+            law.backend = self
+            self._laws[law.name] = law
+        for addr, result in list(law.manifold.items()):
+            self.store(law, addr, result)
+        return law
+
+    def get(self, name: str) -> Optional[Law]:
+        law = self._laws.get(name)
+        if law is not None or not self.shards:
+            return law
+        found = next(iter(self.shards.values())).get(name)
+        if found is None:
+            return None
+        return self.publish(Law.restore(name, found.seed))
+
+    def load(self, law: Law, addr: int) -> Any:
+        return self._client(addr).load(law, addr)
+
+    def load_many(self, law: Law, addrs: List[int]) -> List[Any]:
+        groups: Dict[str, Tuple[List[int], List[int]]] = {}
+        for i, (addr, shard) in enumerate(zip(addrs, self.ring.owners(addrs))):
+            where, keys = groups.setdefault(shard, ([], []))
+            where.append(i)
+            keys.append(addr)
+        # Scatter: every shard's request is in flight before any is awaited
+        pending: List[Tuple[List[int], Callable[[], List[Any]]]] = [
+            (where, self.shards[shard].submit_many(law, keys)) for shard, (where, keys) in groups.items()]
+        out: List[Any] = [MISS] * len(addrs)
+        for where, gather in pending:
+            for i, result in zip(where, gather()):
+                out[i] = result
+        return out
+
+    def store(self, law: Law, addr: int, result: Any):
+        self._client(addr).store(law, addr, result)
+
+    def flush(self):
+        for client in self.shards.values():
+            client.flush(wait=False)
+        for client in self.shards.values():
+            client.flush()
+
+    def names(self) -> List[str]:
+        names = set(self._laws)
+        for client in self.shards.values():
+            names.update(client.names())
+        return sorted(names)
+
+    def addresses(self, law: Law) -> List[int]:
+        return [addr for client in self.shards.values() for addr in client.keys(law)]
+
+    def sizes(self) -> Dict[str, int]:
+        """States held per shard, over all laws."""
+        laws = [self.get(name) for name in self.names()]
+        return {shard: sum(len(client.keys(law)) for law in laws)
+                for shard, client in self.shards.items()}
+
+    # --- Membership ---
+
+    def add_shard(self, address: Optional[Address] = None) -> str:
+        """Adds a shard (default: a new local process) and moves the states it now owns."""
+        if address is None:
+            address = self._start_process()
+        self.flush()
+        names = self.names()
+        before = {shard: client for shard, client in self.shards.items()}
+        shard = self._connect(address)
+        client = self.shards[shard]
+        for name in names:
+            law = self.get(name)
+            client.publish(Law.restore(name, law.seed))
+        for old, source in before.items():
+            self._migrate(source, names, lambda addr: self.ring.owner(addr) != old)
+        return shard
+
+    def remove_shard(self, shard: str):
+        """Moves a shard's states to their new owners, then disconnects (and stops its process)."""
+        if shard not in self.shards:
+            raise KeyError(f"Unknown shard: {shard!r}")
+        self.flush()
+        names = self.names()
+        source = self.shards.pop(shard)
+        self.ring.remove(shard)
+        if self.shards:
+            self._migrate(source, names, lambda addr: True, delete=False)
+        source.close()
+        process = self._processes.pop(shard, None)
+        if process is not None:
+            process.terminate()
+            process.join()
+
+    def _migrate(self, source: RemoteOracle, names: List[str],
+                 moves: Callable[[int], bool], delete: bool = True):
+        for name in names:
+            law = self._laws.get(name) or self.get(name)
+            addrs = [addr for addr in source.keys(law) if moves(addr)]
+            for start in range(0, len(addrs), _MIGRATE_BATCH):
+                batch = addrs[start:start + _MIGRATE_BATCH]
+                for addr, result in zip(batch, source.load_many(law, batch)):
+                    if result is not MISS:
+                        self.store(law, addr, result)
+                self.moved += len(batch)
+                if delete:
+                    source.delete_many(law, batch)
+        self.flush()
+
+    def close(self):
+        for client in self.shards.values():
+            client.close()
+        self.shards.clear()
+        for process in self._processes.values():
+            process.terminate()
+            process.join()
+        self._processes.clear()
+
+    def __enter__(self) -> 'ShardedOracle':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
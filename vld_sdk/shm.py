@@ -0,0 +1,259 @@
+"""
+VLD-SHM: Cross-Process Oracle
+Brief: A SharedOracle in `multiprocessing.shared_memory`, so sibling worker
+processes recall each other's inductions instead of re-inducing them.
+
+Notation:
+    [Table] slot(addr) = probe(mix(addr ^ tag)) -> {addr, tag, offset, length, kind}
+    [Arena] append-only payloads; ndarray results (and bytes, with zero_copy) are recalled as views
+Layout:
+    header (64B) | slots (capacity x 32B) | arena (arena_bytes)
+"""
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+from .induction import Law, MISS, SharedOracle
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX: in-process locking only
+    fcntl = None
+
+_MAGIC = 0x564C44534D3031  # "VLDSM01"
+_HEADER = struct.Struct('<QQQQQ')  # magic, capacity, arena_bytes, arena_tail, count
+_HEADER_BYTES = 64
+_SLOT = struct.Struct('<QQQII')  # addr, tag, offset, length, kind
+_ARRAY_HEAD = struct.Struct('<HB')  # len(dtype.str), ndim
+_ALIGN = 16
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+KIND_PICKLE = 0
+KIND_BYTES = 1
+KIND_NDARRAY = 2
+
+def encode_state(result: Any):
+    """(kind, header, payload): bytes and C-contiguous arrays are stored raw."""
+    if isinstance(result, (bytes, bytearray)):
+        return KIND_BYTES, b'', memoryview(result)
+    if (type(result).__module__ == 'numpy' and getattr(result, 'ndim', 0) > 0 and
+            not result.dtype.hasobject and result.flags.c_contiguous):
+        try:
+            payload = memoryview(result).cast('B')
+        except (TypeError, ValueError):
+            payload = None  # dtype without a buffer format: pickle it
+        if payload is not None:
+            dtype = result.dtype.str.encode()
+            header = (_ARRAY_HEAD.pack(len(dtype), result.ndim) + dtype +
+                      struct.pack(f'<{result.ndim}Q', *result.shape))
+            return KIND_NDARRAY, header, payload
+    return KIND_PICKLE, b'', memoryview(pickle.dumps(result, protocol=5))
+
+def decode_state(view: memoryview, kind: int, zero_copy: bool = False) -> Any:
+    """
+    Inverse of encode_state over a read-only view (header, aligned payload).
+    Bytes-likes come back as bytes, or as the view itself with `zero_copy`.
+    """
+    if kind == KIND_BYTES:
+        return view if zero_copy else bytes(view)
+    if kind == KIND_NDARRAY:
+        import numpy as np
+        dlen, ndim = _ARRAY_HEAD.unpack_from(view, 0)
+        dtype = bytes(view[3:3 + dlen]).decode()
+        shape = struct.unpack_from(f'<{ndim}Q', view, 3 + dlen)
+        head = 3 + dlen + 8 * ndim
+        data_at = (head + _ALIGN - 1) & ~(_ALIGN - 1)
+        return np.frombuffer(view[data_at:], dtype=dtype).reshape(shape)
+    return pickle.loads(view)
+
+def _mix(x: int) -> int:
+    """SplitMix64 finalizer: spreads addresses over the probe table."""
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EB & _MASK64
+    return x ^ (x >> 31)
+
+def _law_tag(law: Law) -> int:
+    # Disambiguates equal addresses from different laws; never 0 (0 = empty slot)
+    return ((law.seed ^ (law.seed >> 64)) & _MASK64) | 1
+
+class SharedMemoryOracle(SharedOracle):
+    """
+    SharedOracle backed by one shared-memory segment per deployment.
+    - Readers are lock-free: a slot is published by writing its tag last.
+    - Writers serialize on an in-process lock plus an flock'd lock file.
+    - The table and arena are fixed-size; states that do not fit are
+      skipped (counted in `dropped`) and stay process-local.
+    - Bytes and bytearray results are recalled as bytes (copied out of the
+      arena). With `zero_copy=True` they come back as read-only memoryviews
+      on the segment instead, which lack str-like methods such as .decode().
+      Arrays are always read-only views.
+    """
+    def __init__(self, name: str = "vld_oracle", capacity: int = 1 << 16,
+                 arena_bytes: int = 64 << 20, max_load: float = 0.7, zero_copy: bool = False):
+        super().__init__()
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self.name = name
+        self.max_load = max_load
+        self.zero_copy = zero_copy
+        self.dropped = 0
+        size = _HEADER_BYTES + capacity * _SLOT.size + arena_bytes
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            _HEADER.pack_into(self._shm.buf, 0, 0, capacity, arena_bytes, 0, 0)
+            struct.pack_into('<Q', self._shm.buf, 0, _MAGIC)
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+            deadline = time.monotonic() + 5.0
+            while struct.unpack_from('<Q', self._shm.buf, 0)[0] != _MAGIC:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Shared oracle {name!r} was never initialized")
+                time.sleep(0.001)
+        # Lifetime is explicit (unlink); keep the resource tracker from
+        # destroying the segment when whichever process created it exits.
+        resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._buf = self._shm.buf
+        _, self.capacity, self.arena_bytes, _, _ = _HEADER.unpack_from(self._buf, 0)
+        self._arena = _HEADER_BYTES + self.capacity * _SLOT.size
+        self._thread_lock = threading.Lock()
+        self._lock_file = None
+        if fcntl is not None:
+            self._lock_file = open(os.path.join(tempfile.gettempdir(), f"{name}.lock"), "a+b")
+
+    # --- Oracle protocol ---
+
+    def publish(self, law: Law) -> Law:
+        with self._lock:
+            existing = self._laws.get(law.name)
+            if existing is not None:
+                return existing
+            self._laws[law.name] = law
+        law.backend = self
+        for addr, result in list(law.manifold.items()):
+            self.store(law, addr, result)
+        return law
+
+    def load(self, law: Law, addr: int) -> Any:
+        slot = self._find(addr, _law_tag(law))
+        if slot < 0:
+            return MISS
+        _, _, offset, length, kind = _SLOT.unpack_from(self._buf, slot)
+        return self._decode(offset, length, kind)
+
+    def store(self, law: Law, addr: int, result: Any):
+        kind, header, payload = self._encode(result)
+        tag = _law_tag(law)
+        with self._write_lock():
+            if self._find(addr, tag) >= 0:
+                return
+            _, _, _, tail, count = _HEADER.unpack_from(self._buf, 0)
+            if count + 1 > self.capacity * self.max_load:
+                self.dropped += 1
+                return
+            start = (tail + _ALIGN - 1) & ~(_ALIGN - 1)
+            data_at = start + ((len(header) + _ALIGN - 1) & ~(_ALIGN - 1) if header else 0)
+            end = data_at + payload.nbytes
+            if end > self.arena_bytes:
+                self.dropped += 1
+                return
+            base = self._arena
+            if header:
+                self._buf[base + start:base + start + len(header)] = header
+            self._buf[base + data_at:base + end] = payload
+            slot = self._probe_empty(addr, tag)
+            # Publish: payload and descriptor first, tag last
+            _SLOT.pack_into(self._buf, slot, addr, 0, start, end - start, kind)
+            struct.pack_into('<Q', self._buf, slot + 8, tag)
+            struct.pack_into('<QQ', self._buf, 24, end, count + 1)
+
+    # --- Table ---
+
+    def _slot_at(self, i: int) -> int:
+        return _HEADER_BYTES + i * _SLOT.size
+
+    def _find(self, addr: int, tag: int) -> int:
+        mask = self.capacity - 1
+        i = _mix(addr ^ tag) & mask
+        for _ in range(self.capacity):
+            slot = self._slot_at(i)
+            s_addr, s_tag = struct.unpack_from('<QQ', self._buf, slot)
+            if s_tag == 0:
+                return -1
+            if s_tag == tag and s_addr == addr:
+                return slot
+            i = (i + 1) & mask
+        return -1
+
+    def _probe_empty(self, addr: int, tag: int) -> int:
+        mask = self.capacity - 1
+        i = _mix(addr ^ tag) & mask
+        while struct.unpack_from('<Q', self._buf, self._slot_at(i) + 8)[0] != 0:
+            i = (i + 1) & mask
+        return self._slot_at(i)
+
+    def _write_lock(self):
+        return _WriteLock(self._thread_lock, self._lock_file)
+
+    # --- Payloads ---
+
+    def _encode(self, result: Any):
+        return encode_state(result)
+
+    def _decode(self, offset: int, length: int, kind: int) -> Any:
+        start = self._arena + offset
+        return decode_state(self._buf[start:start + length].toreadonly(), kind, self.zero_copy)
+
+    # --- Lifetime ---
+
+    def __len__(self) -> int:
+        return _HEADER.unpack_from(self._buf, 0)[4]
+
+    def close(self):
+        """
+        Detaches this process. Bound laws are unbound and their resident
+        states (which may be views on the segment) dropped; views still held
+        by callers must be released first.
+        """
+        with self._lock:
+            for law in self._laws.values():
+                law.backend = None
+                law.manifold.clear()
+            self._laws.clear()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self):
+        """Destroys the segment (call once, from the owning process)."""
+        # SharedMemory.unlink unregisters from the resource tracker; balance
+        # the unregister done at attach time.
+        resource_tracker.register(self._shm._name, "shared_memory")
+        self._shm.unlink()
+        lock_path = os.path.join(tempfile.gettempdir(), f"{self.name}.lock")
+        if os.path.exists(lock_path):
+            os.remove(lock_path)
+
+class _WriteLock:
+    """Thread lock + advisory file lock: one writer across all processes."""
+    __slots__ = ('thread_lock', 'lock_file')
+
+    def __init__(self, thread_lock: threading.Lock, lock_file):
+        self.thread_lock = thread_lock
+        self.lock_file = lock_file
+
+    def __enter__(self):
+        self.thread_lock.acquire()
+        if self.lock_file is not None:
+            fcntl.flock(self.lock_file, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc):
+        if self.lock_file is not None:
+            fcntl.flock(self.lock_file, fcntl.LOCK_UN)
+        self.thread_lock.release()
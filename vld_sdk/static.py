@@ -0,0 +1,269 @@
+"""
+VLD-STATIC: Read-Only Oracle Export
+Brief: Compiles an oracle's laws into one static file: a minimal perfect
+hash (CHD-style hash-and-displace) over law addresses plus a packed result
+arena, answered from an mmap without deserializing the table.
+
+Notation:
+    [Key]    k = mix(addr ^ phi64 * (law + 1))            (a bijection: distinct per state)
+    [Bucket] b = (k >> 32) mod r,  d = disp[b]
+    [Slot]   s = d & ~DIRECT  if d & DIRECT  else mix(k ^ C * (d + 1)) mod n   (n = #states)
+    [Verify] entry[s] = {addr, law, value, length, kind}   (value: arena offset, or an inline float/int64)
+Layout:
+    header (64B) | law table (JSON) | disp (r x u32) | entries (n x 24B) | arena
+"""
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .induction import Law, MISS, SharedOracle, CachedException, _ENVELOPES
+from .shm import decode_state, encode_state, _ALIGN, _mix
+
+_MAGIC = b'VLDMPH01'
+_HEADER = struct.Struct('<8sQQQQQQ')  # magic, laws, n, r, laws_at, disp_at, entries_at
+_HEADER_BYTES = 64
+_ENTRY = struct.Struct('<Q8sIHH')  # addr, value, length, law, kind
+_U64 = struct.Struct('<Q')
+_F64 = struct.Struct('<d')
+_I64 = struct.Struct('<q')
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN = 0x9E3779B97F4A7C15
+_SECOND = 0xD6E8FEB86659FD93
+_DIRECT = 0x80000000
+_MAX_LAWS = 0xFFFF
+_MAX_DISPLACEMENT = 1 << 20
+_KIND_FLOAT = 0x100  # Inline kinds (beside the shm payload kinds)
+_KIND_INT = 0x101
+
+def _key(law: int, addr: int) -> int:
+    return _mix(addr ^ ((_GOLDEN * (law + 1)) & _MASK64))
+
+def _displace(k: int, d: int) -> int:
+    return _mix(k ^ ((_SECOND * (d + 1)) & _MASK64))
+
+def _build(keys: List[Tuple[int, int]], bucket_size: float) -> Tuple[List[int], List[int]]:
+    """(disp, slot of each key): a minimal perfect hash over `keys`."""
+    n = len(keys)
+    r = max(1, int(n / bucket_size))
+    hashed = [_key(law, addr) for law, addr in keys]
+    buckets: List[List[int]] = [[] for _ in range(r)]
+    for i, k in enumerate(hashed):
+        buckets[(k >> 32) % r].append(i)
+    disp = [0] * r
+    slots = [0] * n
+    taken = bytearray(n)
+    order = sorted(range(r), key=lambda b: -len(buckets[b]))
+    free = iter(range(n))
+    for b in order:
+        members = buckets[b]
+        if not members:
+            break
+        if len(members) == 1:
+            # Singletons take the next free slot directly (keeps the table minimal)
+            slot = next(s for s in free if not taken[s])
+            disp[b] = _DIRECT | slot
+            taken[slot] = 1
+            slots[members[0]] = slot
+            continue
+        # Each displacement rehashes the whole bucket (independent candidate slots)
+        for d in range(_MAX_DISPLACEMENT):
+            placed = [_displace(hashed[i], d) % n for i in members]
+            if len(set(placed)) == len(placed) and not any(taken[s] for s in placed):
+                break
+        else:  # pragma: no cover - astronomically unlikely
+            raise RuntimeError("Could not place a bucket; retry with a smaller bucket_size")
+        disp[b] = d
+        for i, s in zip(members, placed):
+            taken[s] = 1
+            slots[i] = s
+    return disp, slots
+
+def _state(value: Any) -> Any:
+    """The exportable result behind a manifold value, or MISS."""
+    if type(value) in _ENVELOPES:
+        if type(value) is CachedException:
+            return MISS  # Failures (and their expiry) are not exported
+        return value.load()
+    return value
+
+def _encode(result: Any) -> Tuple[int, bytes, Any]:
+    """(kind, header, payload); scalars are inlined in the entry (payload None)."""
+    if type(result) is float:
+        return _KIND_FLOAT, _F64.pack(result), None
+    if type(result) is int and -(1 << 63) <= result < (1 << 63):
+        return _KIND_INT, _I64.pack(result), None
+    return encode_state(result)
+
+def export_static(oracle: SharedOracle, path: str, laws: Optional[Iterable[str]] = None,
+                  bucket_size: float = 2.0) -> dict:
+    """
+    Compiles the states of `oracle`'s laws (default: all published laws)
+    into a static file at `path`, written atomically. Returns build stats.
+    """
+    start = time.perf_counter()
+    names = sorted(oracle.names() if laws is None else laws)
+    if len(names) > _MAX_LAWS:
+        raise ValueError(f"At most {_MAX_LAWS} laws per static file")
+    table, keys, payloads = [], [], []
+    for index, name in enumerate(names):
+        law = oracle.get(name)
+        if law is None:
+            raise KeyError(f"Unknown law: {name!r}")
+        table.append({"name": law.name, "seed": format(law.seed, 'x')})
+        for addr, value in oracle.states(law):
+            result = _state(value)
+            if result is not MISS:
+                keys.append((index, addr))
+                payloads.append(_encode(result))
+
+    disp, slots = _build(keys, bucket_size) if keys else ([0], [])
+    n, r = len(keys), len(disp)
+    laws_blob = json.dumps(table).encode()
+    laws_at = _HEADER_BYTES
+    disp_at = _align(laws_at + len(laws_blob))
+    entries_at = _align(disp_at + 4 * r)
+    arena_at = _align(entries_at + _ENTRY.size * n)
+
+    entries = bytearray(_ENTRY.size * n)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".vld-static-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.seek(arena_at)
+            offset = 0
+            for (index, addr), slot, (kind, header, payload) in zip(keys, slots, payloads):
+                if payload is None:
+                    _ENTRY.pack_into(entries, slot * _ENTRY.size, addr, header, 0, index, kind)
+                    continue
+                offset = _align(offset)
+                f.seek(arena_at + offset)
+                data_at = _align(len(header)) if header else 0
+                f.write(header)
+                f.write(b'\0' * (data_at - len(header)))
+                f.write(payload)
+                length = data_at + payload.nbytes
+                _ENTRY.pack_into(entries, slot * _ENTRY.size, addr, _U64.pack(offset), length, index, kind)
+                offset += length
+            f.seek(0)
+            f.write(_HEADER.pack(_MAGIC, len(table), n, r, laws_at, disp_at, entries_at))
+            f.seek(laws_at)
+            f.write(laws_blob)
+            f.seek(disp_at)
+            f.write(struct.pack(f'<{r}I', *disp))
+            f.seek(entries_at)
+            f.write(entries)
+            f.truncate(arena_at + _align(offset))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    size = os.path.getsize(path)
+    return {"laws": len(table), "entries": n, "buckets": r, "bytes": size,
+            "index_bytes": arena_at - disp_at, "build_seconds": time.perf_counter() - start}
+
+def _align(x: int) -> int:
+    return (x + _ALIGN - 1) & ~(_ALIGN - 1)
+
+class StaticOracle(SharedOracle):
+    """
+    Read-only SharedOracle over an exported static file.
+    Opening maps the file and parses only the header and law table; each
+    recall hashes (law, addr), reads one displacement and one entry, and
+    decodes just that result (floats and int64s are inlined in the entry;
+    arrays come back as zero-copy views, bytes as bytes unless `zero_copy`).
+    Loaded states are not kept resident. Laws induced at runtime stay
+    process-local; `store` is a no-op.
+    """
+    resident = False
+
+    def __init__(self, path: str, zero_copy: bool = False):
+        super().__init__()
+        self.path = path
+        self.zero_copy = zero_copy
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buf = memoryview(self._mmap)
+        magic, count, self.n, self.r, laws_at, disp_at, entries_at = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            self._buf.release()
+            self._mmap.close()
+            raise ValueError(f"Not a VLD static oracle: {path!r}")
+        table = json.loads(bytes(self._buf[laws_at:disp_at]).rstrip(b'\0'))
+        self._seeds = {entry["name"]: int(entry["seed"], 16) for entry in table}
+        self._index = {entry["name"]: i for i, entry in enumerate(table)}
+        self._disp = self._buf[disp_at:disp_at + 4 * self.r].cast('I')
+        self._entries = entries_at
+        self._arena = _align(entries_at + _ENTRY.size * self.n)
+
+    def get(self, name: str) -> Optional[Law]:
+        law = self._laws.get(name)
+        if law is not None or name not in self._seeds:
+            return law
+        with self._lock:
+            law = self._laws.get(name)
+            if law is None:
+                law = Law.restore(name, self._seeds[name])
+                law.backend = self
+                self._laws[name] = law
+            return law
+
+    def load(self, law: Law, addr: int) -> Any:
+        index = self._index.get(law.name)
+        if index is None or not self.n:
+            return MISS
+        k = _key(index, addr)
+        d = self._disp[(k >> 32) % self.r]
+        slot = d & ~_DIRECT if d & _DIRECT else _displace(k, d) % self.n
+        s_addr, value, length, s_law, kind = _ENTRY.unpack_from(
+            self._buf, self._entries + slot * _ENTRY.size)
+        if s_addr != addr or s_law != index:
+            return MISS  # Not a member: the hash maps it somewhere anyway
+        return self._decode(value, length, kind)
+
+    def _decode(self, value: bytes, length: int, kind: int) -> Any:
+        if kind == _KIND_FLOAT:
+            return _F64.unpack(value)[0]
+        if kind == _KIND_INT:
+            return _I64.unpack(value)[0]
+        start = self._arena + _U64.unpack(value)[0]
+        return decode_state(self._buf[start:start + length].toreadonly(), kind, self.zero_copy)
+
+    def store(self, law: Law, addr: int, result: Any):
+        pass  # Read-only
+
+    def names(self) -> List[str]:
+        return sorted(set(self._index) | set(self._laws))
+
+    def states(self, law: Law) -> List[Tuple[int, Any]]:
+        index = self._index.get(law.name)
+        out = []
+        for slot in range(self.n):
+            s_addr, value, length, s_law, kind = _ENTRY.unpack_from(
+                self._buf, self._entries + slot * _ENTRY.size)
+            if s_law == index:
+                out.append((s_addr, self._decode(value, length, kind)))
+        return out
+
+    def __len__(self) -> int:
+        return self.n
+
+    def close(self):
+        """Unbinds laws and unmaps the file (views handed out must be released first)."""
+        with self._lock:
+            for law in self._laws.values():
+                law.backend = None
+            self._laws.clear()
+        self._disp.release()
+        self._buf.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,221 @@
+"""
+VLD-SURROGATE: Interpolation Laws
+Brief: Answers in-range queries of smooth scalar functions of one or two
+numbers from piecewise cubic interpolants over recorded points, when a
+held-out error estimate is under tolerance.
+
+Notation:
+    [Arc]      A(t) = 3t^2 - 2t^3                     (GeodesicFlowSolver's cubic arc)
+    [Hermite]  p(x) = y_a + (y_b - y_a) A(t) + h (m_a (t^3 - 2t^2 + t) + m_b (t^3 - t^2))
+    [Held-out] e_k = |p_{-k}(x_k) - y_k| / (4 t_k (1 - t_k))^2   (rebuilt without point k)
+    [Answer]   p(x) iff max(e_a, e_b) <= tol, else execute
+"""
+import bisect
+import math
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+def cubic_arc(alpha: float) -> float:
+    """Equation: A(t) = 3t^2 - 2t^3 (A(0) = 0, A(1) = 1, A'(0) = A'(1) = 0)"""
+    return 3 * alpha ** 2 - 2 * alpha ** 3
+
+def hermite(xa: float, ya: float, ma: float, xb: float, yb: float, mb: float, x: float) -> float:
+    """Cubic Hermite segment through (xa, ya), (xb, yb) with slopes ma, mb."""
+    h = xb - xa
+    t = (x - xa) / h
+    return ya + (yb - ya) * cubic_arc(t) + h * (ma * (t ** 3 - 2 * t ** 2 + t) + mb * (t ** 3 - t ** 2))
+
+class _Curve:
+    """Recorded points of a function of one number, with held-out error estimates."""
+    __slots__ = ('xs', 'ys', 'errors')
+
+    def __init__(self):
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.errors: List[float] = []
+
+    def add(self, x: float, y: float):
+        i = bisect.bisect_left(self.xs, x)
+        if i < len(self.xs) and self.xs[i] == x:
+            self.ys[i] = y
+        else:
+            self.xs.insert(i, x)
+            self.ys.insert(i, y)
+            self.errors.insert(i, math.inf)
+        # Slopes reach two neighbours out: refresh estimates within three
+        for k in range(max(0, i - 3), min(len(self.xs), i + 4)):
+            self.errors[k] = self._held_out(k)
+
+    def _slope(self, i: int, skip: int) -> float:
+        """Mean of the secants to the nearest neighbours of i, ignoring `skip`."""
+        xs, ys = self.xs, self.ys
+        left = i - 1 if i - 1 != skip else i - 2
+        right = i + 1 if i + 1 != skip else i + 2
+        secants = [(ys[i] - ys[j]) / (xs[i] - xs[j])
+                   for j in (left, right) if 0 <= j < len(xs)]
+        return sum(secants) / len(secants)
+
+    def _held_out(self, k: int) -> float:
+        n = len(self.xs)
+        if n < 3:
+            return math.inf
+        if 0 < k < n - 1:
+            a, b = k - 1, k + 1  # Interpolate across the gap
+        elif k == 0:
+            a, b = 1, 2          # Extrapolate: a conservative estimate at the ends
+        else:
+            a, b = n - 3, n - 2
+        xs, ys = self.xs, self.ys
+        estimate = hermite(xs[a], ys[a], self._slope(a, k), xs[b], ys[b], self._slope(b, k), xs[k])
+        error = abs(estimate - ys[k])
+        if a < k < b:
+            # Interpolation error grows like (t(1-t))^2 across a gap: scale the
+            # held-out error at t up to the gap's midpoint (a factor >= 1)
+            t = (xs[k] - xs[a]) / (xs[b] - xs[a])
+            error *= 0.0625 / (t * (1 - t)) ** 2
+        return error
+
+    def predict(self, x: float) -> Optional[Tuple[float, float]]:
+        """(value, error bound) inside the recorded range, else None."""
+        xs = self.xs
+        i = bisect.bisect_right(xs, x) - 1
+        if i < 0:
+            return None
+        if xs[i] == x:
+            return self.ys[i], 0.0
+        if i >= len(xs) - 1:
+            return None
+        ys = self.ys
+        value = hermite(xs[i], ys[i], self._slope(i, -1), xs[i + 1], ys[i + 1], self._slope(i + 1, -1), x)
+        return value, max(self.errors[i], self.errors[i + 1])
+
+class Surrogate:
+    """
+    Interpolation law for one algorithm.
+    - `arguments(inputs)` maps inputs to a tuple of one or two numbers
+      (default: a number, or a list/tuple of one or two numbers).
+    - One argument: cubic Hermite over all recorded points.
+    - Two arguments: points are grouped into rows of equal y; a query is
+      interpolated along x on the rows around it, then across those rows
+      (so inputs should share y values, e.g. sweeps over x at several y).
+    - An answer is given only when its held-out error bound is at most
+      `tolerance`; otherwise the function runs and the point is recorded.
+    - `validate_every` N > 0 executes every Nth answerable query anyway and
+      checks the surrogate against it (`bound_violations` in stats).
+    """
+    def __init__(self, tolerance: float, arguments: Optional[Callable[[Any], Any]] = None,
+                 validate_every: int = 0):
+        if tolerance < 0:
+            raise ValueError("tolerance must be >= 0")
+        self.tolerance = tolerance
+        self.arguments = arguments
+        self.validate_every = validate_every
+        self.curve = _Curve()             # One argument
+        self.rows: Dict[float, _Curve] = {}  # Two arguments: y -> curve over x
+        self.row_keys: List[float] = []
+        self._lock = threading.Lock()
+        self.points = 0
+        self.queries = 0
+        self.answered = 0
+        self.answerable = 0
+        self.max_bound = 0.0
+        self.validations = 0
+        self.violations = 0
+        self.observed_max_error = 0.0
+
+    def point(self, inputs: Any) -> Optional[Tuple[float, ...]]:
+        """The input as a 1- or 2-tuple of finite floats, or None."""
+        try:
+            args = inputs if self.arguments is None else self.arguments(inputs)
+            if type(args) not in (tuple, list):
+                args = (args,)
+            if not 1 <= len(args) <= 2 or any(type(a) is bool for a in args):
+                return None
+            point = tuple(float(a) for a in args)
+        except (TypeError, ValueError):
+            return None
+        return point if all(map(math.isfinite, point)) else None
+
+    def predict(self, point: Tuple[float, ...]) -> Optional[Tuple[float, float]]:
+        """(value, error bound), or None outside the interpolable region."""
+        with self._lock:
+            return self._predict(point)
+
+    def _predict(self, point: Tuple[float, ...]) -> Optional[Tuple[float, float]]:
+        # Caller holds _lock: add() grows xs, ys and errors one list at a time
+        if len(point) == 1:
+            return self.curve.predict(point[0])
+        x, y = point
+        keys = self.row_keys
+        j = bisect.bisect_right(keys, y) - 1
+        if j < 0:
+            return None
+        if keys[j] == y:
+            return self.rows[y].predict(x)
+        if j >= len(keys) - 1:
+            return None
+        # Interpolate along x on up to four rows around y, then across them
+        across, bound = _Curve(), 0.0
+        for r in range(max(0, j - 1), min(len(keys), j + 3)):
+            found = self.rows[keys[r]].predict(x)
+            if found is None:
+                if r in (j, j + 1):
+                    return None
+                continue
+            across.add(keys[r], found[0])
+            if r in (j, j + 1):
+                bound = max(bound, found[1])
+        value, across_bound = across.predict(y)
+        return value, bound + across_bound
+
+    def answer(self, point: Tuple[float, ...]) -> Optional[float]:
+        """The surrogate's value if its error bound is within tolerance, else None."""
+        with self._lock:
+            self.queries += 1
+            found = self._predict(point)
+            if found is None or found[1] > self.tolerance:
+                return None
+            self.answerable += 1
+            if self.validate_every and self.answerable % self.validate_every == 0:
+                return None  # Audit: execute; add() compares the two
+            self.answered += 1
+            if found[1] > self.max_bound:
+                self.max_bound = found[1]
+            return found[0]
+
+    def add(self, point: Tuple[float, ...], result: Any):
+        """Records an executed point (real-valued results only)."""
+        if type(result) not in (int, float) or not math.isfinite(result):
+            return
+        with self._lock:
+            found = self._predict(point)
+            if found is not None and found[1] <= self.tolerance:
+                # Would have been answered: check the estimate against the truth
+                error = abs(found[0] - result)
+                self.validations += 1
+                self.observed_max_error = max(self.observed_max_error, error)
+                if error > self.tolerance:
+                    self.violations += 1
+            if len(point) == 1:
+                self.curve.add(point[0], float(result))
+            else:
+                x, y = point
+                row = self.rows.get(y)
+                if row is None:
+                    row = self.rows[y] = _Curve()
+                    bisect.insort(self.row_keys, y)
+                row.add(x, float(result))
+            self.points += 1
+
+    def stats(self) -> dict:
+        return {
+            "tolerance": self.tolerance,
+            "points": self.points,
+            "queries": self.queries,
+            "answered": self.answered,
+            "answer_rate": self.answered / self.queries if self.queries else 0.0,
+            "max_error_bound": self.max_bound,
+            "validations": self.validations,
+            "observed_max_error": self.observed_max_error,
+            "bound_violations": self.violations,
+        }
@@ -0,0 +1,277 @@
+"""
+VLD-SYNC: Anti-Entropy Replication
+Brief: Reconciles the laws of two oracle replicas by comparing Merkle trees
+over address ranges: only subtrees that differ are descended into, and only
+the (address, result) pairs one side is missing are transferred.
+
+Notation:
+    [State] d(a) = H(a || pickle5(result))
+    [Leaf]  L(p) = H(sorted (a, d(a)) : a >> (64 - 4D) = p)        (depth D)
+    [Node]  N(p) = H(N(16p) || ... || N(16p + 15)),  0 for empty children
+    [Depth] D = min d >= 1 with leaf_size * 16^d >= max(|A|, |B|)
+    [Round] hello | D x nodes | leaves | pull | push   (per law, only while digests differ)
+"""
+import hashlib
+import pickle
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .induction import Law, MISS, SharedOracle, VirtualLayer
+from .persistence import decode_payload, encode_payload
+from .static import _state
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_FANOUT_BITS = 4
+_MAX_DEPTH = 64 // _FANOUT_BITS
+_OPS = frozenset(('hello', 'nodes', 'leaves', 'pull', 'push'))
+
+_DIGEST = 8
+_EMPTY = bytes(_DIGEST)
+_ROW = _DIGEST << _FANOUT_BITS
+_EMPTY_ROW = bytes(_ROW)
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=_DIGEST, person=b'vld-sync').digest()
+
+def _entries(leaf: bytes) -> Dict[int, bytes]:
+    """{addr: state digest} from a packed leaf."""
+    return {int.from_bytes(leaf[i:i + 8], 'big'): leaf[i + 8:i + 16] for i in range(0, len(leaf), 16)}
+
+class _Tree:
+    """
+    Merkle summary of one law's states at a fixed depth, kept in wire form:
+    a leaf is its sorted (addr, digest) pairs packed as bytes, an internal
+    node the row of its 16 child digests (zeros for empty children).
+    """
+    __slots__ = ('depth', 'root', 'leaves', 'children')
+
+    def __init__(self, digests: Dict[int, bytes], depth: int):
+        self.depth = depth
+        shift = 64 - _FANOUT_BITS * depth
+        groups: Dict[int, List[bytes]] = {}
+        for addr, digest in digests.items():
+            groups.setdefault(addr >> shift, []).append(addr.to_bytes(8, 'big') + digest)
+        self.leaves = {p: b''.join(sorted(entries)) for p, entries in groups.items()}
+        level = {p: _digest(leaf) for p, leaf in self.leaves.items()}
+        # children[l][p] = child row of node p at level l (root: level 0)
+        self.children: List[Dict[int, bytes]] = [{} for _ in range(depth)]
+        for l in range(depth - 1, -1, -1):
+            rows: Dict[int, bytearray] = {}
+            for p, digest in level.items():
+                row = rows.get(p >> _FANOUT_BITS)
+                if row is None:
+                    row = rows[p >> _FANOUT_BITS] = bytearray(_ROW)
+                i = (p & ((1 << _FANOUT_BITS) - 1)) * _DIGEST
+                row[i:i + _DIGEST] = digest
+            self.children[l] = {p: bytes(row) for p, row in rows.items()}
+            level = {p: _digest(row) for p, row in self.children[l].items()}
+        self.root = level.get(0, _EMPTY)
+
+class Replica:
+    """
+    One side of an anti-entropy session over a multiprocessing Connection
+    (a Pipe end, or a Listener/Client pair on a Unix socket).
+    - `serve(conn)` answers a peer until it finishes; `sync(conn)` drives
+      the session. Both replicas end with the union of their states.
+    - Laws are matched by published name and must share their seed (else
+      skipped). A state present on both sides with different results is a
+      conflict: counted and left as is. Cached exceptions are not replicated.
+    - Messages are pickles: only connect replicas that trust each other.
+    """
+    def __init__(self, oracle: Optional[SharedOracle] = None, leaf_size: int = 16):
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be >= 1")
+        self.oracle = oracle if oracle is not None else VirtualLayer.ORACLE
+        self.leaf_size = leaf_size
+        self._results: Dict[str, Dict[int, Any]] = {}
+        self._digests: Dict[str, Dict[int, bytes]] = {}
+        self._trees: Dict[Tuple[str, int], _Tree] = {}
+        self.stats = self._fresh_stats()
+
+    @staticmethod
+    def _fresh_stats() -> dict:
+        return {"laws": 0, "laws_skipped": 0, "rounds": 0, "bytes_sent": 0,
+                "bytes_received": 0, "states_sent": 0, "states_received": 0, "conflicts": 0}
+
+    # --- Local view (cached for one session) ---
+
+    def _reset(self):
+        self._results.clear()
+        self._digests.clear()
+        self._trees.clear()
+        self.stats = self._fresh_stats()
+
+    def _states(self, name: str) -> Dict[int, Any]:
+        results = self._results.get(name)
+        if results is None:
+            law = self.oracle.get(name)
+            results = {}
+            if law is not None:
+                for addr, value in self.oracle.states(law):
+                    result = _state(value)
+                    if result is not MISS:
+                        results[addr] = result
+            self._results[name] = results
+        return results
+
+    def _digest_map(self, name: str) -> Dict[int, bytes]:
+        digests = self._digests.get(name)
+        if digests is None:
+            digests = self._digests[name] = {
+                addr: _digest(addr.to_bytes(8, 'big') + encode_payload(result))
+                for addr, result in self._states(name).items()}
+        return digests
+
+    def _tree(self, name: str, depth: int) -> _Tree:
+        tree = self._trees.get((name, depth))
+        if tree is None:
+            tree = self._trees[(name, depth)] = _Tree(self._digest_map(name), depth)
+        return tree
+
+    def _depth(self, count: int) -> int:
+        depth = 1
+        while depth < _MAX_DEPTH and self.leaf_size << (_FANOUT_BITS * depth) < count:
+            depth += 1
+        return depth
+
+    def _laws(self, names: Optional[Iterable[str]] = None) -> Dict[str, Tuple[int, int]]:
+        """{name: (seed, states)} for local laws."""
+        out = {}
+        for name in (self.oracle.names() if names is None else names):
+            law = self.oracle.get(name)
+            if law is not None:
+                out[name] = (law.seed, len(self._states(name)))
+        return out
+
+    def _payloads(self, name: str, addrs: Optional[List[int]]) -> List[Tuple[int, bytes]]:
+        results = self._states(name)
+        if addrs is None:
+            addrs = list(results)
+        self.stats["states_sent"] += len(addrs)
+        return [(addr, encode_payload(results[addr])) for addr in addrs]
+
+    def _apply(self, name: str, seed: int, pairs: List[Tuple[int, bytes]]) -> int:
+        law = self.oracle.get(name)
+        if law is None:
+            law = self.oracle.publish(Law.restore(name, seed))
+        if law.seed != seed:
+            return 0
+        for addr, payload in pairs:
+            # Recorded like a local induction: budgets, tiers and backends apply
+            law.record((addr ^ law.seed) & _MASK64, decode_payload(payload))
+        self.stats["states_received"] += len(pairs)
+        self._results.pop(name, None)
+        self._digests.pop(name, None)
+        self._trees = {k: t for k, t in self._trees.items() if k[0] != name}
+        return len(pairs)
+
+    # --- Wire ---
+
+    def _send(self, conn: Any, message: Any):
+        data = pickle.dumps(message, protocol=5)
+        self.stats["bytes_sent"] += len(data)
+        conn.send_bytes(data)
+
+    def _recv(self, conn: Any) -> Any:
+        data = conn.recv_bytes()
+        self.stats["bytes_received"] += len(data)
+        return pickle.loads(data)
+
+    def _call(self, conn: Any, *message: Any) -> Any:
+        self.stats["rounds"] += 1
+        self._send(conn, message)
+        return self._recv(conn)
+
+    # --- Responder ---
+
+    def serve(self, conn: Any) -> dict:
+        """Answers one peer's session; returns this side's stats."""
+        self._reset()
+        while True:
+            op, *args = self._recv(conn)
+            if op == "done":
+                self._send(conn, self.stats)
+                return self.stats
+            if op not in _OPS:
+                raise ValueError(f"Unknown sync request: {op!r}")
+            self._send(conn, getattr(self, "_on_" + op)(*args))
+
+    def _on_hello(self, peer: Dict[str, Tuple[int, int]]) -> Dict[str, Tuple[int, int, bytes]]:
+        out = {}
+        for name, (seed, count) in self._laws().items():
+            theirs = peer.get(name, (seed, 0))[1]
+            out[name] = (seed, count, self._tree(name, self._depth(max(count, theirs))).root)
+        return out
+
+    def _on_nodes(self, name: str, depth: int, level: int, prefixes: List[int]) -> bytes:
+        rows = self._tree(name, depth).children[level]
+        return b''.join(rows.get(p, _EMPTY_ROW) for p in prefixes)
+
+    def _on_leaves(self, name: str, depth: int, prefixes: List[int]) -> List[bytes]:
+        leaves = self._tree(name, depth).leaves
+        return [leaves.get(p, b'') for p in prefixes]
+
+    def _on_pull(self, name: str, addrs: Optional[List[int]]) -> List[Tuple[int, bytes]]:
+        return self._payloads(name, addrs)
+
+    def _on_push(self, name: str, seed: int, pairs: List[Tuple[int, bytes]]) -> int:
+        return self._apply(name, seed, pairs)
+
+    # --- Initiator ---
+
+    def sync(self, conn: Any, laws: Optional[Iterable[str]] = None) -> dict:
+        """
+        Reconciles `laws` (default: all laws on either side) with the peer
+        served on `conn`, then ends the session. Returns this side's stats
+        plus the peer's under "peer".
+        """
+        self._reset()
+        wanted = None if laws is None else set(laws)
+        mine = self._laws(wanted)
+        theirs = self._call(conn, "hello", mine)
+        for name in sorted(set(mine) | set(theirs)):
+            if wanted is None or name in wanted:
+                self._reconcile(conn, name, mine.get(name), theirs.get(name))
+        peer = self._call(conn, "done")
+        stats = dict(self.stats)
+        stats["peer"] = peer
+        return stats
+
+    def _reconcile(self, conn: Any, name: str, mine: Optional[Tuple[int, int]],
+                   theirs: Optional[Tuple[int, int, bytes]]):
+        self.stats["laws"] += 1
+        if mine is None or mine[1] == 0:
+            if theirs is not None and theirs[1]:
+                self._apply(name, theirs[0], self._call(conn, "pull", name, None))
+            return
+        seed, count = mine
+        if theirs is None or theirs[1] == 0:
+            self._call(conn, "push", name, seed, self._payloads(name, None))
+            return
+        if theirs[0] != seed:
+            self.stats["laws_skipped"] += 1
+            return
+        depth = self._depth(max(count, theirs[1]))
+        tree = self._tree(name, depth)
+        if tree.root == theirs[2]:
+            return
+        diff = [0]
+        for level in range(depth):
+            remote = self._call(conn, "nodes", name, depth, level, diff)
+            rows, ahead = tree.children[level], []
+            for k, p in enumerate(diff):
+                ours, other = rows.get(p, _EMPTY_ROW), remote[k * _ROW:(k + 1) * _ROW]
+                if ours != other:
+                    ahead.extend((p << _FANOUT_BITS) | i for i in range(1 << _FANOUT_BITS)
+                                 if ours[i * _DIGEST:(i + 1) * _DIGEST] != other[i * _DIGEST:(i + 1) * _DIGEST])
+            diff = ahead
+        remote = self._call(conn, "leaves", name, depth, diff)
+        want, give = [], []
+        for p, leaf in zip(diff, remote):
+            ours, other = _entries(tree.leaves.get(p, b'')), _entries(leaf)
+            want.extend(a for a in other if a not in ours)
+            give.extend(a for a in ours if a not in other)
+            self.stats["conflicts"] += sum(1 for a, d in ours.items() if a in other and other[a] != d)
+        if give:
+            self._call(conn, "push", name, seed, self._payloads(name, give))
+        if want:
+            self._apply(name, seed, self._call(conn, "pull", name, want))
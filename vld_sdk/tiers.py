@@ -0,0 +1,175 @@
+"""
+VLD-TIERS: Result Storage Tiers
+Brief: Keeps large Law results compressed in memory or spilled to
+memory-mapped files under a cache directory, decoded transparently on recall.
+
+Notation:
+    [Tier]   store(r) = r                        if size(r) < T
+                      = mmap(dir/*.npy)          if r is an ndarray and spilling
+                      = C(pickle(r)) [-> file]   otherwise
+    [Recall] load(store(r)) == r   (spilled arrays: read-only np.memmap views)
+"""
+import bz2
+import lzma
+import os
+import pickle
+import threading
+import uuid
+import weakref
+import zlib
+from typing import Any, Optional
+
+from .memory import estimate_nbytes
+
+CODECS = {
+    "zlib": (zlib.compress, zlib.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+    "bz2": (bz2.compress, bz2.decompress),
+}
+
+def _unlink(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+class StoredResult:
+    """A tier handle held in a Law manifold; `nbytes` is its resident footprint."""
+    __slots__ = ()
+
+    def load(self) -> Any:
+        raise NotImplementedError
+
+class CompressedResult(StoredResult):
+    """In-memory compressed pickle; recall decompresses."""
+    __slots__ = ('codec', 'blob')
+
+    def __init__(self, codec: str, blob: bytes):
+        self.codec = codec
+        self.blob = blob
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.blob)
+
+    def load(self) -> Any:
+        return pickle.loads(CODECS[self.codec][1](self.blob))
+
+class SpilledBlob(StoredResult):
+    """(Optionally compressed) pickle in a file; deleted with its handle."""
+    __slots__ = ('path', 'codec', '__weakref__')
+    nbytes = 0
+
+    def __init__(self, path: str, codec: Optional[str]):
+        self.path = path
+        self.codec = codec
+        weakref.finalize(self, _unlink, path)
+
+    def load(self) -> Any:
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        return pickle.loads(CODECS[self.codec][1](data) if self.codec else data)
+
+class SpilledArray(StoredResult):
+    """
+    NumPy array in a .npy file, recalled as a read-only np.memmap (no copy,
+    no decode; pages are faulted in on access and evictable by the OS).
+    The file is deleted with its handle; views already handed out stay
+    valid on POSIX, where an unlinked file lives until it is unmapped.
+    """
+    __slots__ = ('path', '_view', '__weakref__')
+    nbytes = 0
+
+    def __init__(self, path: str):
+        self.path = path
+        self._view = None
+        weakref.finalize(self, _unlink, path)
+
+    def load(self) -> Any:
+        view = self._view
+        if view is None:
+            import numpy as np
+            view = self._view = np.load(self.path, mmap_mode='r')
+        return view
+
+STORED_TYPES = frozenset((CompressedResult, SpilledBlob, SpilledArray))
+
+class ResultTier:
+    """
+    Storage tier for results of at least `threshold` estimated bytes.
+    - `codec` ('zlib', 'lzma', 'bz2' or None) compresses pickled results;
+      results that shrink by less than `min_ratio` stay as they are.
+    - With `spill_dir`, NumPy arrays (and other encoded results of at least
+      `spill_threshold` bytes) move to files under that directory.
+    Results that cannot be pickled simply stay resident.
+    """
+    def __init__(self, threshold: int = 1 << 20, codec: Optional[str] = "zlib",
+                 level: Optional[int] = None, spill_dir: Optional[str] = None,
+                 spill_threshold: Optional[int] = None, min_ratio: float = 0.9):
+        if codec is not None and codec not in CODECS:
+            raise ValueError(f"Unknown codec: {codec!r} (expected one of {sorted(CODECS)})")
+        self.threshold = threshold
+        self.codec = codec
+        self.level = level
+        self.spill_dir = spill_dir
+        self.spill_threshold = threshold if spill_threshold is None else spill_threshold
+        self.min_ratio = min_ratio
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+        self.compressed = 0
+        self.spilled = 0
+        self.bytes_in = 0
+        self.bytes_resident = 0
+        self._lock = threading.Lock()
+
+    def encode(self, result: Any) -> Any:
+        """Returns the form to keep in the manifold (the result itself if small)."""
+        if type(result) in STORED_TYPES:
+            return result
+        size = estimate_nbytes(result)
+        if size < self.threshold:
+            return result
+        try:
+            stored = self._encode(result)
+        except Exception:
+            return result  # Unpicklable or unwritable: keep it resident
+        if stored is not result:
+            with self._lock:
+                self.bytes_in += size
+                self.bytes_resident += getattr(stored, 'nbytes', 0)
+                if type(stored) is CompressedResult:
+                    self.compressed += 1
+                else:
+                    self.spilled += 1
+        return stored
+
+    def _encode(self, result: Any) -> Any:
+        if (self.spill_dir is not None and type(result).__module__.startswith('numpy') and
+                getattr(result, 'ndim', 0) > 0 and not result.dtype.hasobject):
+            import numpy as np
+            path = self._path('.npy')
+            np.save(path, result, allow_pickle=False)
+            return SpilledArray(path)
+
+        payload = pickle.dumps(result, protocol=5)
+        codec, blob = None, payload
+        if self.codec is not None:
+            compress = CODECS[self.codec][0]
+            packed = compress(payload) if self.level is None else compress(payload, self.level)
+            if len(packed) <= self.min_ratio * len(payload):
+                codec, blob = self.codec, packed
+        if self.spill_dir is not None and len(blob) >= self.spill_threshold:
+            path = self._path('.bin')
+            with open(path, 'wb') as f:
+                f.write(blob)
+            return SpilledBlob(path, codec)
+        if codec is None:
+            return result  # Incompressible and not spilled
+        return CompressedResult(codec, blob)
+
+    def _path(self, suffix: str) -> str:
+        return os.path.join(self.spill_dir, f"vld-{uuid.uuid4().hex}{suffix}")
+
+    def stats(self) -> dict:
+        return {"compressed": self.compressed, "spilled": self.spilled,
+                "bytes_in": self.bytes_in, "bytes_resident": self.bytes_resident}